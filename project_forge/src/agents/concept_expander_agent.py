@@ -15,35 +15,43 @@ The output ProjectIdea becomes the foundation for all downstream agents
 (GoalsAnalyzer, FrameworkSelector, PhaseDesigner, etc.).
 """
 
-from crewai import Agent, Task
-from typing import Dict, Any
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, Any, Iterable, List, Optional, Tuple, Union
+import asyncio
 import json
+import re
 
 from ..models.project_models import ProjectIdea
 from ..tools.text_cleaner_tool import clean_project_idea, extract_keywords
+from ..tools.llm_tool import agent_llm_kwargs, import_litellm, llm_model
+from ..tools.cache_tool import PromptCache, ResponseCache, make_cache_key
+from ..tools.json_tool import loads_json
 
+# expand_concept and the agent factory import CrewAI when they run; the
+# parser, caches and the LiteLLM batch path work without it.
+if TYPE_CHECKING:
+    from crewai import Agent, Task
 
-def create_concept_expander_agent() -> Agent:
-    """
-    Create the ConceptExpanderAgent with specialized prompting for idea expansion.
 
-    This agent uses an LLM to take cleaned user input and expand it into a
-    comprehensive project concept. It infers missing details, identifies constraints,
-    and creates a solid foundation for planning.
+# Persistent cache of expanded concepts, keyed on (cleaned idea, skill level)
+_concept_cache = ResponseCache("concept_expansion")
 
-    Returns:
-        CrewAI Agent configured for concept expansion
+# Raw LLM responses keyed on the exact prompt, model and temperature
+_prompt_cache = PromptCache("concept_expansion_prompts")
 
-    Teaching Note:
-        CrewAI agents are defined by role, goal, and backstory. The backstory
-        shapes the agent's "personality" and decision-making style. This agent
-        is designed to be thorough but not overly prescriptive - it expands
-        ideas while staying true to user intent.
-    """
-    return Agent(
-        role="Project Concept Expander",
-        goal="Transform raw, vague project ideas into clear, structured, and actionable concepts",
-        backstory="""You are an expert product strategist and technical architect
+# Downstream planning outputs (goals, frameworks) keyed on plan_cache_key().
+# Shared with the orchestration layer, which checks it before running the
+# agents that consume a ProjectIdea.
+plan_cache = ResponseCache("plan")
+
+
+# Agent persona, shared by the CrewAI agent and the direct batch LLM path
+_AGENT_ROLE = "Project Concept Expander"
+_AGENT_GOAL = "Transform raw, vague project ideas into clear, structured, and actionable concepts"
+_AGENT_BACKSTORY = """You are an expert product strategist and technical architect
         who excels at taking half-formed ideas and turning them into crystal-clear
         project concepts.
 
@@ -56,46 +64,35 @@ def create_concept_expander_agent() -> Agent:
 
         You DO NOT make wild assumptions or add features the user didn't ask for.
         You clarify, structure, and enhance - but always stay grounded in the
-        user's actual intent.""",
-        allow_delegation=False,
-        verbose=True
-    )
-
+        user's actual intent."""
 
-def create_concept_expansion_task(agent: Agent, raw_idea: str, skill_level: str = "intermediate") -> Task:
-    """
-    Create the task for expanding a raw idea into a ProjectIdea.
-
-    This task provides the agent with the raw input and asks it to produce
-    a structured JSON output that we can parse into a ProjectIdea object.
-
-    Args:
-        agent: The ConceptExpanderAgent
-        raw_idea: Raw user input from CLI
-        skill_level: User's skill level (beginner/intermediate/advanced)
+# Maximum number of concurrent LLM calls made by expand_concepts_batch
+MAX_BATCH_CONCURRENCY = 4
 
-    Returns:
-        CrewAI Task configured for concept expansion
+# Cleaned ideas shorter than this (in words) are too thin for the LLM to expand
+MIN_IDEA_WORDS = 3
 
-    Teaching Note:
-        Tasks in CrewAI define WHAT to do. They include:
-        - description: the actual prompt/instructions
-        - expected_output: what format the result should be in
-        - agent: which agent executes this task
+# Cleaned ideas longer than this (in characters) are cut down to their first
+# _IDEA_HEAD_CHARS and last _IDEA_TAIL_CHARS before prompt assembly. A pasted
+# multi-KB description would otherwise grow the prompt (and its latency and
+# cost) without bound; the opening and closing sentences carry the intent.
+MAX_IDEA_CHARS = 2000
+_IDEA_HEAD_CHARS = 1800
+_IDEA_TAIL_CHARS = MAX_IDEA_CHARS - _IDEA_HEAD_CHARS - len("...")
 
-        The description is the key - it's where we encode domain knowledge
-        and guide the LLM's reasoning process.
-    """
-    # Pre-clean the raw idea using our text cleaning tools
-    cleaned_idea = clean_project_idea(raw_idea)
-    keywords = extract_keywords(cleaned_idea)
+# Ask the provider for a JSON object response (OpenAI-style JSON mode, mapped
+# by LiteLLM for other providers)
+_JSON_RESPONSE_FORMAT = {"type": "json_object"}
 
-    description = f"""
-Take this raw project idea and expand it into a clear, structured concept:
 
-RAW IDEA: "{cleaned_idea}"
-USER SKILL LEVEL: {skill_level}
-EXTRACTED KEYWORDS: {', '.join(keywords)}
+# Task prompt, split into an invariant head and a small per-call tail.
+# The head never changes between calls, so it is built once at import time and
+# forms a stable prefix that providers with prompt caching (OpenAI
+# automatically, Anthropic via LiteLLM) can reuse. Only the tail is formatted
+# per call.
+_TASK_TEMPLATE_STATIC_HEAD = """
+Expand a raw project idea into a clear, structured concept. The idea, the
+user's skill level and extracted keywords are given at the end.
 
 Your task is to create a comprehensive project concept with these components:
 
@@ -110,42 +107,186 @@ Your task is to create a comprehensive project concept with these components:
    - Complexity: What's the appropriate complexity level? ("low", "medium", "high")
    - Scope: What's in vs out of scope?
    - Technical: Any technical limitations or requirements?
-   - Skill: Is this appropriate for the user's {skill_level} skill level?
+   - Skill: Is this appropriate for the user's skill level?
 
 RULES:
 - Be specific but not overly prescriptive
 - Infer reasonable constraints from the idea
-- For {skill_level} users, suggest appropriate scope
+- Suggest a scope appropriate for the user's skill level
 - Preserve the user's original intent - don't add features they didn't want
 - If the idea is too vague, make reasonable assumptions but note them
 - If the idea seems too ambitious for the skill level, suggest a reasonable subset
 
 OUTPUT FORMAT (must be valid JSON):
-{{
+{
     "refined_summary": "Clear 2-4 sentence description of the project...",
-    "constraints": {{
+    "constraints": {
         "time": "1-2 weeks",
         "complexity": "medium",
         "scope": "Brief scope statement",
         "technical_requirements": "Any specific tech requirements",
-        "skill_appropriateness": "Why this fits {skill_level} level"
-    }}
-}}
+        "skill_appropriateness": "Why this fits the user's skill level"
+    }
+}
+
 """
 
+_TASK_TEMPLATE_DYNAMIC = """RAW IDEA: "{raw}"
+USER SKILL LEVEL: {skill}
+EXTRACTED KEYWORDS: {kw}
+"""
+
+# Markdown code fence around the JSON payload (```json ... ```). The closing
+# fence is optional so truncated output still yields its JSON body.
+_FENCE_RE = re.compile(r"^```[\w-]*[ \t]*\n(.*?)(?:\n?```)?\s*$", re.DOTALL)
+
+
+@lru_cache(maxsize=1)
+def create_concept_expander_agent() -> Agent:
+    """
+    Create the ConceptExpanderAgent with specialized prompting for idea expansion.
+
+    This agent uses an LLM to take cleaned user input and expand it into a
+    comprehensive project concept. It infers missing details, identifies constraints,
+    and creates a solid foundation for planning.
+
+    The agent's configuration never changes between calls, so the instance is
+    built once and reused (see reset_concept_expander_agent()). When the user
+    has configured a model, its LLM runs in JSON mode so replies are valid JSON
+    on the first try; otherwise CrewAI's default LLM is used unchanged.
+
+    Returns:
+        CrewAI Agent configured for concept expansion
+
+    Teaching Note:
+        CrewAI agents are defined by role, goal, and backstory. The backstory
+        shapes the agent's "personality" and decision-making style. This agent
+        is designed to be thorough but not overly prescriptive - it expands
+        ideas while staying true to user intent.
+    """
+    from crewai import Agent
+
+    return Agent(
+        role=_AGENT_ROLE,
+        goal=_AGENT_GOAL,
+        backstory=_AGENT_BACKSTORY,
+        # JSON mode (configured model only): the provider guarantees a valid
+        # JSON object, so the parse fallback (which drops the structure) is rarely hit
+        **agent_llm_kwargs(_JSON_RESPONSE_FORMAT),
+        allow_delegation=False,
+        verbose=True
+    )
+
+
+def reset_concept_expander_agent() -> None:
+    """
+    Drop the cached ConceptExpanderAgent so the next call builds a fresh one.
+
+    Mainly useful in tests, or after changing LLM settings in the environment.
+    """
+    create_concept_expander_agent.cache_clear()
+
+
+def _cap_idea_length(cleaned_idea: str) -> str:
+    """Trim an oversized idea to its head and tail so the prompt size stays bounded."""
+    if len(cleaned_idea) <= MAX_IDEA_CHARS:
+        return cleaned_idea
+    return cleaned_idea[:_IDEA_HEAD_CHARS] + "..." + cleaned_idea[-_IDEA_TAIL_CHARS:]
+
+
+@lru_cache(maxsize=1024)
+def _keywords_joined(cleaned_idea: str) -> str:
+    """Comma-separated keywords for the prompt, memoized so repeat builds skip the join."""
+    return ", ".join(extract_keywords(cleaned_idea))
+
+
+def _build_task_description(raw_idea: str, skill_level: str) -> str:
+    """Render the concept-expansion prompt for one idea (static head + per-call tail)."""
+    # Pre-clean the raw idea using our text cleaning tools, capping its length
+    cleaned_idea = _cap_idea_length(clean_project_idea(raw_idea))
+
+    return _TASK_TEMPLATE_STATIC_HEAD + _TASK_TEMPLATE_DYNAMIC.format(
+        raw=cleaned_idea,
+        skill=skill_level,
+        kw=_keywords_joined(cleaned_idea)
+    )
+
+
+def create_concept_expansion_task(agent: Agent, raw_idea: str, skill_level: str = "intermediate") -> Task:
+    """
+    Create the task for expanding a raw idea into a ProjectIdea.
+
+    This task provides the agent with the raw input and asks it to produce
+    a structured JSON output that we can parse into a ProjectIdea object.
+
+    Args:
+        agent: The ConceptExpanderAgent
+        raw_idea: Raw user input from CLI
+        skill_level: User's skill level (beginner/intermediate/advanced)
+
+    Returns:
+        CrewAI Task configured for concept expansion
+
+    Teaching Note:
+        Tasks in CrewAI define WHAT to do. They include:
+        - description: the actual prompt/instructions
+        - expected_output: what format the result should be in
+        - agent: which agent executes this task
+
+        The description is the key - it's where we encode domain knowledge
+        and guide the LLM's reasoning process.
+    """
+    from crewai import Task
+
     return Task(
-        description=description,
+        description=_build_task_description(raw_idea, skill_level),
         expected_output="JSON object with refined_summary and constraints dict",
         agent=agent
     )
 
 
-def parse_concept_expansion_result(result: str, raw_idea: str) -> ProjectIdea:
+def _strip_code_fence(text: str) -> str:
+    """Return the JSON body of ``text``, removing a surrounding markdown fence if present."""
+    clean_text = text.strip()
+    fence_match = _FENCE_RE.match(clean_text)
+    return fence_match.group(1) if fence_match else clean_text
+
+
+def _collect_streamed_result(chunks: Iterable[str]) -> str:
+    """
+    Accumulate a streamed agent response into a single string.
+
+    Chunks are appended to a list and joined only when the buffer looks
+    complete (its last non-whitespace character closes a JSON object or
+    array), instead of growing a string with += and re-parsing after every
+    chunk, which is quadratic in the response size. Consumption stops as soon
+    as the buffer parses as JSON.
+
+    Args:
+        chunks: Iterable of text fragments from a streaming LLM call
+
+    Returns:
+        The accumulated response text
+    """
+    parts = []
+    for chunk in chunks:
+        parts.append(chunk)
+        if chunk.rstrip()[-1:] in ("}", "]"):
+            candidate = "".join(parts)
+            try:
+                loads_json(_strip_code_fence(candidate))
+            except json.JSONDecodeError:
+                continue
+            return candidate
+    return "".join(parts)
+
+
+def parse_concept_expansion_result(result: Union[str, Iterable[str]], raw_idea: str) -> ProjectIdea:
     """
     Parse the agent's JSON output into a ProjectIdea object.
 
     Args:
-        result: JSON string from the agent
+        result: JSON string from the agent, or an iterable of streamed chunks
         raw_idea: Original raw input (for fallback)
 
     Returns:
@@ -157,16 +298,15 @@ def parse_concept_expansion_result(result: str, raw_idea: str) -> ProjectIdea:
         gracefully, and ensures we always return a valid ProjectIdea even
         if the agent's output was malformed.
     """
+    if not isinstance(result, str):
+        result = _collect_streamed_result(result)
+
     try:
         # Try to parse as JSON
         # The LLM might wrap JSON in markdown code blocks, so strip those
-        clean_result = result.strip()
-        if clean_result.startswith("```"):
-            # Extract content between ``` markers
-            lines = clean_result.split("\n")
-            clean_result = "\n".join(lines[1:-1])
+        clean_result = _strip_code_fence(result)
 
-        data = json.loads(clean_result)
+        data = loads_json(clean_result)
 
         return ProjectIdea(
             raw_description=raw_idea,
@@ -185,19 +325,100 @@ def parse_concept_expansion_result(result: str, raw_idea: str) -> ProjectIdea:
         )
 
 
-def expand_concept(raw_idea: str, skill_level: str = "intermediate") -> ProjectIdea:
+
+def _insufficient_input_concept(raw_idea: str) -> Optional[ProjectIdea]:
+    """
+    Return a placeholder ProjectIdea when the input is too short to expand.
+
+    Empty or one/two-word ideas ("x", "an app") give the model nothing to work
+    with, so rather than paying for an LLM call that can only guess, we answer
+    immediately and ask for more detail.
+    """
+    if len(clean_project_idea(raw_idea).split()) >= MIN_IDEA_WORDS:
+        return None
+    return ProjectIdea(
+        raw_description=raw_idea,
+        refined_summary="(insufficient input - please describe the project in a sentence)",
+        constraints={"status": "insufficient_input"}
+    )
+
+
+def is_insufficient_input(project_idea: ProjectIdea) -> bool:
+    """Return True if ``project_idea`` is the placeholder for a too-short idea."""
+    constraints = project_idea.constraints
+    return isinstance(constraints, dict) and constraints.get("status") == "insufficient_input"
+
+
+def _get_cached_concept(raw_idea: str, skill_level: str) -> Optional[ProjectIdea]:
+    """
+    Return the cached ProjectIdea for this idea and skill level, or None on a miss.
+
+    Cached entries were produced by parse_concept_expansion_result, so they are
+    trusted: the two stored fields are handed straight to the dataclass
+    constructor without re-running any of the parse/cleanup logic.
+    """
+    cached = _concept_cache.get(make_cache_key(clean_project_idea(raw_idea), skill_level))
+    if cached is None:
+        return None
+    return ProjectIdea(raw_idea, cached["refined_summary"], cached["constraints"])
+
+
+def _store_cached_concept(project_idea: ProjectIdea, skill_level: str) -> None:
+    """Cache a parsed ProjectIdea. Parse failures are skipped so they get retried next time."""
+    if "parsing_error" in project_idea.constraints:
+        return
+    cache_key = make_cache_key(clean_project_idea(project_idea.raw_description), skill_level)
+    # Only the LLM-derived fields are stored; the cache serializes to JSON, so
+    # a shallow dict is enough (dataclasses.asdict would deep-copy first)
+    _concept_cache.set(cache_key, {
+        "refined_summary": project_idea.refined_summary,
+        "constraints": project_idea.constraints,
+    })
+
+
+def plan_cache_key(raw_idea: str, skill_level: str) -> str:
+    """
+    Build the plan_cache key for a raw idea.
+
+    The key uses the same inputs as the concept cache (the *cleaned* idea and
+    the skill level), not the LLM's refined summary. Summaries vary from one
+    LLM call to the next, so a key built on one would rarely repeat; the
+    cleaned input repeats exactly whenever the user asks again.
+
+    Args:
+        raw_idea: Raw project idea from user input
+        skill_level: User's skill level (plans differ per level)
+
+    Returns:
+        Cache key for plan_cache
+
+    Teaching Note:
+        Keying the cache on the idea (rather than on each agent's prompt)
+        lets the orchestrator skip the whole chain of agents after the
+        concept step on a hit, not just a single LLM call.
+    """
+    return make_cache_key(clean_project_idea(raw_idea), skill_level)
+
+
+def expand_concept(raw_idea: str, skill_level: str = "intermediate", verbose: bool = True) -> ProjectIdea:
     """
     High-level function to expand a raw idea using the ConceptExpanderAgent.
 
     This is the main entry point for concept expansion. It:
-    1. Creates the agent
-    2. Creates the task
-    3. Executes the task
-    4. Parses the result into a ProjectIdea
+    1. Returns a placeholder for empty or near-empty ideas (< 3 words)
+    2. Checks the response cache for this idea and skill level
+    3. Creates the agent
+    4. Creates the task
+    5. Executes the task, unless this exact prompt/model pair is cached
+    6. Parses the result into a ProjectIdea and caches it
+
+    The cache key uses the *cleaned* idea, so cosmetic differences in the raw
+    input (extra whitespace, filler words) still hit the same entry.
 
     Args:
         raw_idea: Raw project idea from user
         skill_level: User's skill level
+        verbose: Whether to print detailed agent execution logs
 
     Returns:
         ProjectIdea with refined concept and constraints
@@ -207,17 +428,142 @@ def expand_concept(raw_idea: str, skill_level: str = "intermediate") -> ProjectI
         >>> print(idea.refined_summary)
         "A Streamlit web application that visualizes data in an interactive dashboard..."
     """
-    from crewai import Crew
+    # Degenerate input can't be expanded meaningfully - skip the LLM entirely
+    placeholder = _insufficient_input_concept(raw_idea)
+    if placeholder is not None:
+        return placeholder
+
+    # Identical (cleaned) ideas produce the same concept - skip the LLM on a hit
+    cached = _get_cached_concept(raw_idea, skill_level)
+    if cached is not None:
+        return cached
 
     agent = create_concept_expander_agent()
     task = create_concept_expansion_task(agent, raw_idea, skill_level)
 
-    # Execute the task through a Crew (CrewAI will call the LLM)
-    crew = Crew(agents=[agent], tasks=[task], verbose=True)
-    output = crew.kickoff()
-    result = output.raw
+    # The exact same prompt on the same model was answered before - reuse it
+    model = llm_model()
+    result = _prompt_cache.get_response(task.description, model)
+    if result is None:
+        from crewai import Crew
+
+        # Execute the task through a Crew (CrewAI will call the LLM)
+        crew = Crew(agents=[agent], tasks=[task], verbose=verbose)
+        output = crew.kickoff()
+        result = output.raw
 
     # Parse into ProjectIdea
     project_idea = parse_concept_expansion_result(result, raw_idea)
 
+    if "parsing_error" not in project_idea.constraints:
+        _prompt_cache.set_response(task.description, model, None, result)
+    _store_cached_concept(project_idea, skill_level)
+
     return project_idea
+
+
+def _prepare_idea(raw_idea: str) -> None:
+    """Warm the memoized cleaning/keyword helpers for one idea (runs in a worker thread)."""
+    _keywords_joined(_cap_idea_length(clean_project_idea(raw_idea)))
+
+
+async def _aexpand_one(
+    raw_idea: str,
+    skill_level: str,
+    semaphore: asyncio.Semaphore,
+    prepared: Optional[asyncio.Future] = None
+) -> ProjectIdea:
+    """Expand a single idea with one async LLM call, honoring the shared concurrency limit."""
+    # Wait for this idea's background preprocessing; the helpers below then hit
+    # the lru_cache instead of redoing the work on the event loop
+    if prepared is not None:
+        await prepared
+
+    placeholder = _insufficient_input_concept(raw_idea)
+    if placeholder is not None:
+        return placeholder
+
+    cached = _get_cached_concept(raw_idea, skill_level)
+    if cached is not None:
+        return cached
+
+    description = _build_task_description(raw_idea, skill_level)
+    model = llm_model()
+    result = _prompt_cache.get_response(description, model)
+    if result is None:
+        litellm = import_litellm()
+        messages = [
+            {"role": "system", "content": f"You are {_AGENT_ROLE}. {_AGENT_BACKSTORY}\n\nYour goal: {_AGENT_GOAL}"},
+            {"role": "user", "content": description},
+        ]
+        async with semaphore:
+            response = await litellm.acompletion(
+                model=model,
+                messages=messages,
+                response_format=_JSON_RESPONSE_FORMAT
+            )
+        result = response.choices[0].message.content or ""
+
+    project_idea = parse_concept_expansion_result(result, raw_idea)
+    if "parsing_error" not in project_idea.constraints:
+        _prompt_cache.set_response(description, model, None, result)
+    _store_cached_concept(project_idea, skill_level)
+    return project_idea
+
+
+async def expand_concepts_batch(
+    raw_ideas: List[Tuple[str, str]],
+    max_concurrency: int = MAX_BATCH_CONCURRENCY
+) -> List[ProjectIdea]:
+    """
+    Expand many independent ideas concurrently.
+
+    expand_concept() blocks on one LLM round-trip at a time, so N ideas take
+    N round-trips. This fires the calls concurrently (up to max_concurrency
+    in flight, to stay inside provider rate limits) so the batch takes about
+    as long as its slowest call. Input cleaning and keyword extraction run
+    in a thread pool so they are pipelined behind the network waits. It calls
+    the LLM directly through LiteLLM
+    (which CrewAI uses underneath) with the same persona and prompt as the
+    CrewAI agent, and shares the same response cache.
+
+    Args:
+        raw_ideas: List of (raw_idea, skill_level) pairs
+        max_concurrency: Maximum number of LLM calls in flight at once
+
+    Returns:
+        ProjectIdea objects in the same order as raw_ideas
+
+    Usage:
+        >>> ideas = await expand_concepts_batch([("a todo app", "beginner"), ("a chat bot", "advanced")])
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    loop = asyncio.get_running_loop()
+
+    # Clean and tokenize every idea in worker threads up front, so that CPU
+    # preprocessing for later ideas overlaps the network wait of earlier ones
+    with ThreadPoolExecutor(max_workers=max_concurrency) as pool:
+        preps = [loop.run_in_executor(pool, _prepare_idea, raw_idea) for raw_idea, _ in raw_ideas]
+        return await asyncio.gather(
+            *(
+                _aexpand_one(raw_idea, skill_level, semaphore, prep)
+                for (raw_idea, skill_level), prep in zip(raw_ideas, preps)
+            )
+        )
+
+
+def expand_concepts_batch_sync(
+    raw_ideas: List[Tuple[str, str]],
+    max_concurrency: int = MAX_BATCH_CONCURRENCY
+) -> List[ProjectIdea]:
+    """
+    Synchronous wrapper around expand_concepts_batch() for CLI callers.
+
+    Args:
+        raw_ideas: List of (raw_idea, skill_level) pairs
+        max_concurrency: Maximum number of LLM calls in flight at once
+
+    Returns:
+        ProjectIdea objects in the same order as raw_ideas
+    """
+    return asyncio.run(expand_concepts_batch(raw_ideas, max_concurrency))
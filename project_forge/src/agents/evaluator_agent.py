@@ -27,9 +27,17 @@ Teaching Note:
     loops and API cost blowout. We use a simple max_iterations approach.
 """
 
-from crewai import Agent, Task
-from typing import List, Dict, Any, Optional
+from __future__ import annotations
+
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from copy import deepcopy
+from functools import lru_cache, partial
+from typing import TYPE_CHECKING, List, Dict, Any, Optional, Tuple
+import hashlib
 import json
+import re
+import threading
 from dataclasses import dataclass
 
 from ..models.project_models import ProjectIdea, ProjectGoals, ProjectPlan
@@ -42,50 +50,128 @@ from ..tools.rubric_tool import (
     evaluate_technical_depth,
     evaluate_feasibility_for_project_type
 )
-from ..tools.consistency_tool import validate_project_plan, ConsistencyReport
+from ..tools.consistency_tool import (
+    validate_project_plan, ConsistencyReport, SEVERITY_ERROR, SEVERITY_WARNING
+)
+
+# CrewAI is only needed to build the agent and the LLM evaluation task, so it
+# is imported inside those functions. Heuristic evaluation works without it.
+if TYPE_CHECKING:
+    from crewai import Agent, Task
+
 
+# Phrases that signal a step is not decisive enough for autonomous execution
+_AMBIGUOUS_PHRASES = (
+    "if needed", "consider", "optionally", "you may", "if desired",
+    "feel free to", "think about", "research", "look into"
+)
 
-@dataclass
+# Criteria scored by evaluate_plan_quality, in report order, with their labels
+CRITERION_ORDER = (
+    RubricCriterion.CLARITY,
+    RubricCriterion.FEASIBILITY,
+    RubricCriterion.TEACHING_VALUE,
+    RubricCriterion.TECHNICAL_DEPTH,
+    RubricCriterion.BALANCE,
+)
+_CRITERION_LABELS = ("Clarity", "Feasibility", "Teaching Value", "Technical Depth", "Balance")
+
+# Plans with fewer steps than this are too trivial to teach anything
+MIN_PLAN_STEPS = 20
+
+# Number of evaluations kept by evaluate_project_plan's memo
+EVALUATION_CACHE_SIZE = 128
+
+# Shared pool for evaluate_plan_quality(parallel=True); one worker per rubric.
+# Threads are only started on first use.
+_RUBRIC_EXECUTOR = ThreadPoolExecutor(max_workers=5, thread_name_prefix="rubric")
+
+# Rubric evaluations run by evaluate_plan_quality, in evaluation order:
+# (criterion, evaluate(plan, skill_level, project_type, time_constraint),
+#  critical issue label, suggest below score, suggestion label).
+# Built once at import, so criteria and labels are plain tuple reads per call.
+_RUBRIC_CHECKS = (
+    (RubricCriterion.CLARITY,
+     lambda plan, skill_level, project_type, time_constraint:
+         evaluate_concept_clarity(plan.idea.refined_summary),
+     "Clarity issues", None, None),
+    (RubricCriterion.BALANCE,
+     lambda plan, skill_level, project_type, time_constraint:
+         evaluate_phase_balance(plan.phases),
+     "Balance issues", 8, "Balance could be improved"),
+    # Phase 5 Enhancements: teaching clarity, technical depth, and
+    # feasibility for the project type and time constraint
+    (RubricCriterion.TEACHING_VALUE,
+     lambda plan, skill_level, project_type, time_constraint:
+         evaluate_teaching_clarity(plan, skill_level),
+     "Teaching clarity issues", 8, "Teaching clarity"),
+    (RubricCriterion.TECHNICAL_DEPTH,
+     lambda plan, skill_level, project_type, time_constraint:
+         evaluate_technical_depth(plan, skill_level),
+     "Technical depth issues", 7, "Technical depth"),
+    (RubricCriterion.FEASIBILITY,
+     lambda plan, skill_level, project_type, time_constraint:
+         evaluate_feasibility_for_project_type(plan, project_type, time_constraint),
+     "SCOPE MISMATCH", 7, "Feasibility concern"),
+)
+
+
+# "<n> week(s)" or "<n>-<m> weeks"; the upper bound is the time available
+_WEEKS_PATTERN = re.compile(r"(\d+)(?:\s*-\s*(\d+))?\s*weeks?\b")
+
+
+@lru_cache(maxsize=64)
+def _step_limit_for(time_constraint: str) -> Optional[Tuple[int, str, str]]:
+    """
+    Resolve a time constraint to its step ceiling, once per distinct string.
+
+    Returns:
+        (max_steps, label, advice) for constraints of two weeks or less,
+        else None (including constraints that are not given in weeks)
+    """
+    match = _WEEKS_PATTERN.search(time_constraint.lower())
+    if match is None:
+        return None
+
+    max_weeks = int(match.group(2) or match.group(1))
+    if max_weeks <= 1:
+        return 40, "1 week", "Reduce scope or extend timeline to 1-2 weeks."
+    if max_weeks <= 2:
+        return 60, "2 weeks", "Reduce scope or set project_type to 'ambitious' with 3-4 weeks."
+    return None
+
+
+@dataclass(slots=True, frozen=True)
 class EvaluationResult:
     """
     Result of evaluating a project component.
 
+    Instances are immutable; use dataclasses.replace() to derive a modified
+    copy (e.g. to force approval after the last refinement iteration). The
+    issue and suggestion collections are tuples; the scores dict and the
+    consistency report are not, which is why evaluate_project_plan hands out
+    copies of its memoized results rather than the stored objects.
+
     Attributes:
         approved: Whether the component passes evaluation
         scores: Dict of rubric scores by criterion
         consistency_report: Structural consistency check results
         feedback: Detailed feedback and suggestions
-        critical_issues: List of blocking problems that must be fixed
-        suggestions: List of optional improvements
+        critical_issues: Blocking problems that must be fixed
+        suggestions: Optional improvements
     """
     approved: bool
     scores: Dict[RubricCriterion, RubricScore]
     consistency_report: Optional[ConsistencyReport]
     feedback: str
-    critical_issues: List[str]
-    suggestions: List[str]
-
-
-def create_evaluator_agent() -> Agent:
-    """
-    Create the EvaluatorAgent with specialized focus on quality assessment.
+    critical_issues: Tuple[str, ...]
+    suggestions: Tuple[str, ...]
 
-    This agent has high standards and provides constructive feedback. It
-    understands what makes a good project plan and can articulate specific
-    improvements.
 
-    Returns:
-        CrewAI Agent configured for evaluation
-
-    Teaching Note:
-        The backstory shapes this agent to be thorough but constructive.
-        We want it to catch real problems but not be needlessly picky about
-        subjective preferences.
-    """
-    return Agent(
-        role="Project Plan Evaluator and Quality Assurance",
-        goal="Ensure project plans meet quality standards for clarity, feasibility, teaching value, and structural integrity",
-        backstory="""You are an expert technical reviewer and quality assurance
+# Agent persona, built once at import time
+_AGENT_ROLE = "Project Plan Evaluator and Quality Assurance"
+_AGENT_GOAL = "Ensure project plans meet quality standards for clarity, feasibility, teaching value, and structural integrity"
+_AGENT_BACKSTORY = """You are an expert technical reviewer and quality assurance
         specialist with decades of experience evaluating project plans for
         AUTONOMOUS AI EXECUTION.
 
@@ -121,17 +207,109 @@ def create_evaluator_agent() -> Agent:
         - Overlook missing implementation details in teaching_guidance
         - Approve plans that require user input mid-execution
         - Reject plans for arbitrary or subjective reasons
-        - Provide vague feedback like "make it better"""
+        - Provide vague feedback like "make it better\""""
+
+
+def create_evaluator_agent() -> Agent:
+    """
+    Create the EvaluatorAgent with specialized focus on quality assessment.
+
+    This agent has high standards and provides constructive feedback. It
+    understands what makes a good project plan and can articulate specific
+    improvements.
+
+    Returns:
+        CrewAI Agent configured for evaluation
+
+    Teaching Note:
+        The backstory shapes this agent to be thorough but constructive.
+        We want it to catch real problems but not be needlessly picky about
+        subjective preferences.
+    """
+    from crewai import Agent
+
+    return Agent(
+        role=_AGENT_ROLE,
+        goal=_AGENT_GOAL,
+        backstory=_AGENT_BACKSTORY,
         allow_delegation=False,
         verbose=True
     )
 
 
+def _fill_skipped_scores(
+    scores: Dict[RubricCriterion, RubricScore],
+    reason: str
+) -> Tuple[RubricScore, ...]:
+    """Order scores by CRITERION_ORDER, scoring criteria that never ran as 0."""
+    return tuple(
+        scores.get(criterion) or RubricScore(criterion=criterion, score=0, feedback=reason)
+        for criterion in CRITERION_ORDER
+    )
+
+
+def _build_evaluation_result(
+    plan: ProjectPlan,
+    score_tuple: Tuple[RubricScore, ...],
+    consistency_report: ConsistencyReport,
+    critical_issues: List[str],
+    suggestions: List[str],
+    total_steps: int,
+    project_type: str,
+    time_constraint: str,
+    all_passed: bool
+) -> EvaluationResult:
+    """
+    Make the approval decision and render the feedback summary.
+
+    score_tuple holds one RubricScore per criterion, in CRITERION_ORDER;
+    all_passed records whether every one of them passed when it was scored.
+    """
+    # Overall approval decision
+    approved = not critical_issues and all_passed
+
+    # Generate feedback summary. Every line is appended to one parts list
+    # and the message is assembled with a single join at the end.
+    score_lines = [
+        f"- {label}: {score.score}/10\n" for label, score in zip(_CRITERION_LABELS, score_tuple)
+    ]
+    structure = (
+        f"Structure: {total_steps} steps across {len(plan.phases)} phases\n"
+        f"Project Type: {project_type} ({time_constraint})\n"
+    )
+
+    if approved:
+        parts = ["Plan approved! ✓\n\nScores:\n", *score_lines, "\n", structure]
+        if suggestions:
+            parts.append("\nOptional improvements:")
+            parts.extend(["\n- " + suggestion for suggestion in suggestions])
+    else:
+        parts = ["Plan needs revision. ✗\n\nCritical issues to fix:"]
+        parts.extend(["\n- " + issue for issue in critical_issues])
+        parts.append("\n\nCurrent scores:\n")
+        parts.extend(score_lines)
+        parts.append("\n")
+        parts.append(structure)
+    feedback = "".join(parts)
+
+    return EvaluationResult(
+        approved=approved,
+        scores=dict(zip(CRITERION_ORDER, score_tuple)),
+        consistency_report=consistency_report,
+        feedback=feedback,
+        critical_issues=tuple(critical_issues),
+        suggestions=tuple(suggestions)
+    )
+
+
 def evaluate_plan_quality(
     plan: ProjectPlan,
     skill_level: str = "intermediate",
     project_type: str = "medium",
-    time_constraint: str = "1-2 weeks"
+    time_constraint: str = "1-2 weeks",
+    fail_fast: bool = False,
+    collect_all_feedback: bool = True,
+    parallel: bool = False
 ) -> EvaluationResult:
     """
     Evaluate a complete ProjectPlan using heuristic checks.
@@ -150,6 +328,17 @@ def evaluate_plan_quality(
         skill_level: User's skill level for context
         project_type: Project type ("toy", "medium", "ambitious")
         time_constraint: Time available (e.g., "1 week", "1-2 weeks")
+        fail_fast: Skip the rubric and step checks when the consistency check
+                   already found structural errors (the plan is rejected
+                   either way); skipped criteria are reported with score 0
+        collect_all_feedback: When False, stop at the first rubric that raises
+                              a critical issue instead of gathering feedback
+                              from every rubric (useful when a caller only
+                              needs the first blocker)
+        parallel: Run the rubric evaluators concurrently on a shared thread
+                  pool. Only worthwhile when a rubric waits on I/O (e.g. an
+                  LLM-backed scorer); the built-in rubrics are pure Python
+                  and run faster serially
 
     Returns:
         EvaluationResult with scores, feedback, and approval decision
@@ -159,113 +348,113 @@ def evaluate_plan_quality(
         Phase 5 enhancement adds sophisticated scope validation to prevent
         users from attempting projects that are too ambitious or too trivial.
     """
-    scores = {}
     critical_issues = []
     suggestions = []
+    total_steps = plan.total_steps
 
     # Run consistency checks
     consistency_report = validate_project_plan(plan)
 
-    if consistency_report.has_errors():
+    # Sort issues by severity in one pass; errors are reported after a summary line
+    structural_errors = []
+    for issue in consistency_report.issues:
+        if issue.severity == SEVERITY_ERROR:
+            structural_errors.append(f"{issue.category}: {issue.message} ({issue.location})")
+        elif issue.severity == SEVERITY_WARNING:
+            suggestions.append(f"{issue.category}: {issue.message} ({issue.location})")
+
+    if structural_errors:
         critical_issues.append(
             f"Structural errors: {consistency_report.summary}"
         )
-        for issue in consistency_report.issues:
-            if issue.severity == 'error':
-                critical_issues.append(f"{issue.category}: {issue.message} ({issue.location})")
-
-    if consistency_report.has_warnings():
-        for issue in consistency_report.issues:
-            if issue.severity == 'warning':
-                suggestions.append(f"{issue.category}: {issue.message} ({issue.location})")
-
-    # Evaluate concept clarity
-    clarity_score = evaluate_concept_clarity(plan.idea.refined_summary)
-    scores[RubricCriterion.CLARITY] = clarity_score
-
-    if not clarity_score.passes():
-        critical_issues.append(f"Clarity issues: {clarity_score.feedback}")
-
-    # Evaluate phase balance
-    balance_score = evaluate_phase_balance(plan.phases)
-    scores[RubricCriterion.BALANCE] = balance_score
-
-    if not balance_score.passes():
-        critical_issues.append(f"Balance issues: {balance_score.feedback}")
-    elif balance_score.score < 8:
-        suggestions.append(f"Balance could be improved: {balance_score.feedback}")
-
-    # Phase 5 Enhancement: Evaluate teaching clarity comprehensively
-    teaching_score = evaluate_teaching_clarity(plan, skill_level)
-    scores[RubricCriterion.TEACHING_VALUE] = teaching_score
-
-    if not teaching_score.passes():
-        critical_issues.append(f"Teaching clarity issues: {teaching_score.feedback}")
-    elif teaching_score.score < 8:
-        suggestions.append(f"Teaching clarity: {teaching_score.feedback}")
-
-    # Phase 5 Enhancement: Evaluate technical depth
-    technical_depth_score = evaluate_technical_depth(plan, skill_level)
-    scores[RubricCriterion.TECHNICAL_DEPTH] = technical_depth_score
-
-    if not technical_depth_score.passes():
-        critical_issues.append(f"Technical depth issues: {technical_depth_score.feedback}")
-    elif technical_depth_score.score < 7:
-        suggestions.append(f"Technical depth: {technical_depth_score.feedback}")
-
-    # Phase 5 Enhancement: Evaluate feasibility for project type and time constraint
-    feasibility_score = evaluate_feasibility_for_project_type(plan, project_type, time_constraint)
-    scores[RubricCriterion.FEASIBILITY] = feasibility_score
-
-    if not feasibility_score.passes():
-        critical_issues.append(f"SCOPE MISMATCH: {feasibility_score.feedback}")
-    elif feasibility_score.score < 7:
-        suggestions.append(f"Feasibility concern: {feasibility_score.feedback}")
-
-    # Additional Phase 5 checks for trivial or overambitious plans
-    total_steps = sum(len(phase.steps) for phase in plan.phases)
-
-    # Reject plans that are too trivial
-    if total_steps < 20:
-        critical_issues.append(
-            f"Plan is too trivial: Only {total_steps} steps. Even 'toy' projects should have 20-30 steps to provide meaningful learning."
+        critical_issues.extend(structural_errors)
+
+    # Structural errors guarantee rejection - optionally stop here
+    if (fail_fast or not collect_all_feedback) and structural_errors:
+        return _build_evaluation_result(
+            plan, _fill_skipped_scores({}, "Not evaluated: plan has structural errors"),
+            consistency_report, critical_issues, suggestions,
+            total_steps, project_type, time_constraint, all_passed=False
         )
 
-    # Reject plans that are clearly overambitious
-    if time_constraint.startswith("1 week") or time_constraint == "1 week":
-        if total_steps > 40:
-            critical_issues.append(
-                f"Plan is too ambitious for 1 week: {total_steps} steps. Reduce scope or extend timeline to 1-2 weeks."
-            )
-    elif "1-2 week" in time_constraint or "2 week" in time_constraint:
-        if total_steps > 60:
-            critical_issues.append(
-                f"Plan is too ambitious for 2 weeks: {total_steps} steps. Reduce scope or set project_type to 'ambitious' with 3-4 weeks."
-            )
+    if parallel:
+        # Start every rubric at once; results are still consumed in order
+        futures = [
+            _RUBRIC_EXECUTOR.submit(check[1], plan, skill_level, project_type, time_constraint)
+            for check in _RUBRIC_CHECKS
+        ]
+        rubric_scores = (future.result() for future in futures)
+    else:
+        # Lazily, so an early rejection skips the remaining rubrics
+        rubric_scores = (
+            check[1](plan, skill_level, project_type, time_constraint) for check in _RUBRIC_CHECKS
+        )
 
-    # Check global teaching notes
-    if not plan.teaching_notes or len(plan.teaching_notes.strip()) < 50:
-        suggestions.append("Global teaching notes are missing or too brief")
+    scores = {}
+    all_passed = True
+    for check, score in zip(_RUBRIC_CHECKS, rubric_scores):
+        criterion, _, issue_label, suggest_below, suggestion_label = check
+        scores[criterion] = score
+
+        if not score.passes():
+            all_passed = False
+            critical_issues.append(f"{issue_label}: {score.feedback}")
+            if not collect_all_feedback:
+                # Rejection is already certain - skip the remaining rubrics
+                return _build_evaluation_result(
+                    plan, _fill_skipped_scores(scores, "Not evaluated: plan already rejected"),
+                    consistency_report, critical_issues, suggestions,
+                    total_steps, project_type, time_constraint, all_passed=False
+                )
+        elif suggest_below is not None and score.score < suggest_below:
+            suggestions.append(f"{suggestion_label}: {score.feedback}")
 
-    # Phase 5 Enhancement: Check for autonomous executability
-    ambiguous_phrases = ["if needed", "consider", "optionally", "you may", "if desired",
-                        "feel free to", "think about", "research", "look into"]
+    # Walk the steps once, collecting the per-step findings (Phase 5
+    # autonomous-executability checks) that are reported further down
     ambiguous_steps = []
+    thin_guidance_issues = []
 
     for phase in plan.phases:
         for step in phase.steps:
             # Check step titles and descriptions for ambiguous language
             step_text = (step.title + " " + step.description).lower()
-            found_phrases = [phrase for phrase in ambiguous_phrases if phrase in step_text]
+            found_phrases = [phrase for phrase in _AMBIGUOUS_PHRASES if phrase in step_text]
             if found_phrases:
                 ambiguous_steps.append(f"Step {step.index} contains ambiguous language: {', '.join(found_phrases)}")
 
             # Check that teaching_guidance is present and substantial
-            if not step.teaching_guidance or len(step.teaching_guidance.strip()) < 30:
-                critical_issues.append(
+            # (a raw length under 30 already fails, so strip() only runs on
+            # guidance that might be padded up to the limit with whitespace)
+            guidance = step.teaching_guidance
+            if not guidance or len(guidance) < 30 or len(guidance.strip()) < 30:
+                thin_guidance_issues.append(
                     f"Step {step.index} lacks comprehensive implementation guidance (teaching_guidance too brief or missing)"
                 )
 
+    # Additional Phase 5 checks for trivial or overambitious plans
+
+    # Reject plans that are too trivial
+    if total_steps < MIN_PLAN_STEPS:
+        critical_issues.append(
+            f"Plan is too trivial: Only {total_steps} steps. Even 'toy' projects should have 20-30 steps to provide meaningful learning."
+        )
+
+    # Reject plans that are clearly overambitious
+    step_limit = _step_limit_for(time_constraint)
+    if step_limit is not None:
+        max_steps, label, advice = step_limit
+        if total_steps > max_steps:
+            critical_issues.append(
+                f"Plan is too ambitious for {label}: {total_steps} steps. {advice}"
+            )
+
+    # Check global teaching notes
+    if not plan.teaching_notes or len(plan.teaching_notes.strip()) < 50:
+        suggestions.append("Global teaching notes are missing or too brief")
+
+    # Phase 5 Enhancement: Report autonomous executability findings
+    critical_issues.extend(thin_guidance_issues)
+
     if ambiguous_steps:
         if len(ambiguous_steps) > 5:
             critical_issues.append(
@@ -276,49 +465,11 @@ def evaluate_plan_quality(
             for ambiguous_step in ambiguous_steps:
                 suggestions.append(f"Autonomous execution concern: {ambiguous_step}")
 
-    # Overall approval decision
-    approved = len(critical_issues) == 0 and all(score.passes() for score in scores.values())
+    score_tuple = tuple(scores[criterion] for criterion in CRITERION_ORDER)
 
-    # Generate feedback summary
-    if approved:
-        feedback = f"""Plan approved! ✓
-
-Scores:
-- Clarity: {scores[RubricCriterion.CLARITY].score}/10
-- Feasibility: {scores[RubricCriterion.FEASIBILITY].score}/10
-- Teaching Value: {scores[RubricCriterion.TEACHING_VALUE].score}/10
-- Technical Depth: {scores[RubricCriterion.TECHNICAL_DEPTH].score}/10
-- Balance: {scores[RubricCriterion.BALANCE].score}/10
-
-Structure: {total_steps} steps across {len(plan.phases)} phases
-Project Type: {project_type} ({time_constraint})
-"""
-        if suggestions:
-            feedback += "\nOptional improvements:\n" + "\n".join(f"- {s}" for s in suggestions)
-    else:
-        feedback = f"""Plan needs revision. ✗
-
-Critical issues to fix:
-{chr(10).join(f'- {issue}' for issue in critical_issues)}
-
-Current scores:
-- Clarity: {scores[RubricCriterion.CLARITY].score}/10
-- Feasibility: {scores[RubricCriterion.FEASIBILITY].score}/10
-- Teaching Value: {scores[RubricCriterion.TEACHING_VALUE].score}/10
-- Technical Depth: {scores[RubricCriterion.TECHNICAL_DEPTH].score}/10
-- Balance: {scores[RubricCriterion.BALANCE].score}/10
-
-Structure: {total_steps} steps across {len(plan.phases)} phases
-Project Type: {project_type} ({time_constraint})
-"""
-
-    return EvaluationResult(
-        approved=approved,
-        scores=scores,
-        consistency_report=consistency_report,
-        feedback=feedback,
-        critical_issues=critical_issues,
-        suggestions=suggestions
+    return _build_evaluation_result(
+        plan, score_tuple, consistency_report, critical_issues, suggestions,
+        total_steps, project_type, time_constraint, all_passed
     )
 
 
@@ -350,24 +501,28 @@ def create_plan_evaluation_task(
         This is an advanced feature that could be implemented in Phase 5.
         For Phase 3, we rely primarily on the heuristic evaluation above.
     """
-    # Build a summary of the plan
-    plan_summary = f"""
+    from crewai import Task
+
+    # Build a summary of the plan. Pieces are collected in a list and joined
+    # once, instead of growing a string with += (quadratic on large plans).
+    summary_parts = [f"""
 PROJECT: {plan.idea.refined_summary}
 
 LEARNING GOALS: {', '.join(plan.goals.learning_goals)}
 TECHNICAL GOALS: {', '.join(plan.goals.technical_goals)}
 
-STRUCTURE: {len(plan.phases)} phases, {sum(len(p.steps) for p in plan.phases)} total steps
+STRUCTURE: {len(plan.phases)} phases, {plan.total_steps} total steps
 
 SAMPLE STEPS:
-"""
+"""]
     # Show first few steps as examples
     for phase in plan.phases[:2]:
-        plan_summary += f"\nPhase {phase.index}: {phase.name}\n"
+        summary_parts.append(f"\nPhase {phase.index}: {phase.name}\n")
         for step in phase.steps[:3]:
-            plan_summary += f"  {step.index}. {step.title}\n"
+            summary_parts.append(f"  {step.index}. {step.title}\n")
             if step.teaching_guidance:
-                plan_summary += f"     Educational Guidance: {step.teaching_guidance[:100]}...\n"
+                summary_parts.append(f"     Educational Guidance: {step.teaching_guidance[:100]}...\n")
+    plan_summary = "".join(summary_parts)
 
     description = f"""
 Evaluate this project plan for AUTONOMOUS AI EXECUTION.
@@ -430,12 +585,84 @@ Identify real problems that would block autonomous execution, not nitpicks.
     )
 
 
+# Memoized evaluate_project_plan results, least recently used first. The
+# lock guards every read and write: move_to_end/popitem reorder the dict, so
+# concurrent callers (e.g. Streamlit sessions) must not interleave them.
+_evaluation_cache: "OrderedDict[Tuple[Any, ...], EvaluationResult]" = OrderedDict()
+_evaluation_cache_lock = threading.Lock()
+
+# Pools used by evaluate_many(processes > 1), one per worker count, created on
+# first use. A pool is never shut down while the process runs: another thread
+# may be mid-map on it. The lock stops two callers creating the same pool.
+_process_pools: Dict[int, ProcessPoolExecutor] = {}
+_process_pools_lock = threading.Lock()
+
+
+def _plan_content_key(plan: ProjectPlan) -> str:
+    """
+    Digest the full content of a plan (idea, goals, frameworks, phases, steps).
+
+    Two plans with identical content get equal keys even if they are distinct
+    objects, e.g. when a refinement iteration reproduces the previous plan
+    unchanged. The field values are serialized as sorted-key JSON, which is
+    stable across runs and processes, and hashed with BLAKE2b. The memo then
+    holds a 32-character digest per entry instead of a copy of every step's
+    text; a 128-bit digest makes an accidental collision negligible.
+    """
+    idea, goals, framework = plan.idea, plan.goals, plan.framework
+    content = [
+        idea.raw_description, idea.refined_summary, idea.constraints,
+        goals.learning_goals, goals.technical_goals, goals.priority_notes,
+        framework.frontend, framework.backend, framework.storage, framework.special_libs,
+        plan.teaching_notes,
+        [
+            [phase.index, phase.name, phase.description, [
+                [step.index, step.title, step.description, step.teaching_guidance, step.dependencies]
+                for step in phase.steps
+            ]]
+            for phase in plan.phases
+        ],
+    ]
+    serialized = json.dumps(content, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.blake2b(serialized.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _recall_evaluation(cache_key: Tuple[Any, ...]) -> Optional[EvaluationResult]:
+    """Return a private copy of a memoized result (marking it recently used), or None."""
+    with _evaluation_cache_lock:
+        cached = _evaluation_cache.get(cache_key)
+        if cached is None:
+            return None
+        _evaluation_cache.move_to_end(cache_key)
+    # The scores dict and consistency report are mutable; a copy keeps one
+    # caller's edits out of every later hit
+    return deepcopy(cached)
+
+
+def _remember_evaluation(cache_key: Tuple[Any, ...], result: EvaluationResult) -> None:
+    """Store a copy of a result in the evaluation memo, evicting the oldest entry if full."""
+    stored = deepcopy(result)
+    with _evaluation_cache_lock:
+        _evaluation_cache[cache_key] = stored
+        if len(_evaluation_cache) > EVALUATION_CACHE_SIZE:
+            _evaluation_cache.popitem(last=False)
+
+
+def clear_evaluation_cache() -> None:
+    """Drop all memoized evaluate_project_plan results."""
+    with _evaluation_cache_lock:
+        _evaluation_cache.clear()
+
+
 def evaluate_project_plan(
     plan: ProjectPlan,
     skill_level: str = "intermediate",
     project_type: str = "medium",
     time_constraint: str = "1-2 weeks",
-    use_llm: bool = False
+    use_llm: bool = False,
+    fail_fast: bool = False,
+    collect_all_feedback: bool = True,
+    parallel: bool = False
 ) -> EvaluationResult:
     """
     Main entry point for evaluating a ProjectPlan.
@@ -452,6 +679,12 @@ def evaluate_project_plan(
         project_type: Project type ("toy", "medium", "ambitious")
         time_constraint: Time available (e.g., "1 week", "1-2 weeks")
         use_llm: Whether to use LLM-based evaluation (slower but more nuanced)
+        fail_fast: Skip remaining checks once structural errors are found
+                   (heuristic mode only, see evaluate_plan_quality)
+        collect_all_feedback: When False, stop at the first blocking issue
+                              (heuristic mode only, see evaluate_plan_quality)
+        parallel: Run the rubrics on a thread pool (see evaluate_plan_quality);
+                  does not change the result, so it is not part of the memo key
 
     Returns:
         EvaluationResult with approval decision and feedback
@@ -461,6 +694,12 @@ def evaluate_project_plan(
         heuristic checks, then optionally use LLM for nuanced assessment.
         This two-tier approach balances speed and quality.
 
+        Evaluation is a pure function of the plan's content and the scalar
+        arguments, so results are memoized by a key built from the plan's content.
+        Re-evaluating an unchanged plan (e.g. after a no-op refinement) is
+        a dictionary lookup plus a copy of the stored result, so callers
+        never share (and can't corrupt) the memoized object.
+
         Phase 5 adds sophisticated scope validation to ensure projects are
         "just right" - not too big to finish, not too small to learn from.
 
@@ -471,8 +710,18 @@ def evaluate_project_plan(
         >>> else:
         >>>     print(f"Issues: {result.critical_issues}")
     """
+    cache_key = (_plan_content_key(plan), skill_level, project_type, time_constraint, use_llm, fail_fast, collect_all_feedback)
+    cached = _recall_evaluation(cache_key)
+    if cached is not None:
+        return cached
+
     # Always run heuristic evaluation with Phase 5 enhancements
-    result = evaluate_plan_quality(plan, skill_level, project_type, time_constraint)
+    result = evaluate_plan_quality(
+        plan, skill_level, project_type, time_constraint,
+        fail_fast=fail_fast and not use_llm,
+        collect_all_feedback=collect_all_feedback or use_llm,
+        parallel=parallel
+    )
 
     # Optionally add LLM-based evaluation
     if use_llm and not result.approved:
@@ -480,4 +729,106 @@ def evaluate_project_plan(
         # For Phase 5, the enhanced heuristics are sufficient
         pass
 
+    _remember_evaluation(cache_key, result)
+
     return result
+
+
+# Mirror the functools.lru_cache interface so callers can reset the memo
+evaluate_project_plan.cache_clear = clear_evaluation_cache
+
+
+def _get_process_pool(processes: int) -> ProcessPoolExecutor:
+    """Return the shared batch-evaluation pool with this many workers, creating it once."""
+    with _process_pools_lock:
+        pool = _process_pools.get(processes)
+        if pool is None:
+            pool = _process_pools[processes] = ProcessPoolExecutor(max_workers=processes)
+        return pool
+
+
+def evaluate_many(
+    plans: List[ProjectPlan],
+    skill_level: str = "intermediate",
+    project_type: str = "medium",
+    time_constraint: str = "1-2 weeks",
+    fail_fast: bool = False,
+    collect_all_feedback: bool = True,
+    processes: int = 1
+) -> List[EvaluationResult]:
+    """
+    Heuristically evaluate a batch of candidate plans for the same user.
+
+    Args:
+        plans: Candidate ProjectPlans (e.g. from a refinement sweep)
+        skill_level: User's skill level
+        project_type: Project type ("toy", "medium", "ambitious")
+        time_constraint: Time available (e.g., "1 week", "1-2 weeks")
+        fail_fast: See evaluate_plan_quality
+        collect_all_feedback: See evaluate_plan_quality
+        processes: Worker processes to spread the plans across; 1 evaluates
+                   everything in this process
+
+    Returns:
+        One EvaluationResult per plan, in the same order
+
+    Teaching Note:
+        Candidates in a sweep often repeat: refinement converges and
+        several iterations yield the same plan. Routing the batch through
+        the evaluate_project_plan memo evaluates each distinct plan once,
+        while the per-time-constraint step limits are looked up once for
+        the batch.
+
+        Heuristic evaluation is pure Python, so threads cannot speed it up
+        (see evaluate_plan_quality's parallel flag). For large sweeps on a
+        multi-core machine, processes > 1 sends only the distinct, not yet
+        memoized plans to a shared process pool. Each plan is pickled to a
+        worker and back, so this only pays off for batches of dozens of
+        plans or more.
+    """
+    if processes <= 1:
+        return [
+            evaluate_project_plan(
+                plan, skill_level, project_type, time_constraint,
+                fail_fast=fail_fast, collect_all_feedback=collect_all_feedback
+            )
+            for plan in plans
+        ]
+
+    cache_keys = [
+        (_plan_content_key(plan), skill_level, project_type, time_constraint, False, fail_fast, collect_all_feedback)
+        for plan in plans
+    ]
+
+    # Serve memoized plans directly; queue each remaining distinct plan once
+    results = {}
+    pending = {}
+    for cache_key, plan in zip(cache_keys, plans):
+        cached = _recall_evaluation(cache_key)
+        if cached is not None:
+            results[cache_key] = cached
+        else:
+            pending.setdefault(cache_key, plan)
+
+    if pending:
+        evaluate = partial(
+            evaluate_plan_quality,
+            skill_level=skill_level,
+            project_type=project_type,
+            time_constraint=time_constraint,
+            fail_fast=fail_fast,
+            collect_all_feedback=collect_all_feedback
+        )
+        chunksize = max(1, len(pending) // (processes * 4))
+        pool = _get_process_pool(processes)
+        for cache_key, result in zip(pending, pool.map(evaluate, pending.values(), chunksize=chunksize)):
+            results[cache_key] = result
+            _remember_evaluation(cache_key, result)
+
+    # Repeated plans get their own copies, as they do in the serial path
+    ordered = []
+    seen = set()
+    for cache_key in cache_keys:
+        ordered.append(deepcopy(results[cache_key]) if cache_key in seen else results[cache_key])
+        seen.add(cache_key)
+    return ordered
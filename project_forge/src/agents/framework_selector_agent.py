@@ -16,13 +16,36 @@ Key responsibilities:
 The output FrameworkChoice guides the build plan and teaching approach.
 """
 
-from crewai import Agent, Task
-from typing import Dict, Any
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, Any, Optional, Tuple
 import json
-import yaml
-from pathlib import Path
+import logging
 
 from ..models.project_models import ProjectIdea, ProjectGoals, FrameworkChoice
+from ..tools.config_tool import DEFAULT_CONFIG_PATH, config_version, get_config, parse_config_file
+from ..tools.json_tool import dumps_json_indented, loads_json
+
+# The agent and task factories import CrewAI when called; the config loading
+# and prompt rendering helpers below are plain Python and run without it.
+if TYPE_CHECKING:
+    from crewai import Agent, Task
+
+
+# Child of the "project_forge" logger configured by the CLI runner, so the
+# rationale shows at the default INFO level and library callers stay quiet
+_logger = logging.getLogger("project_forge.framework_selector")
+
+
+@lru_cache(maxsize=16)
+def _config_json_blocks(path_str: str, mtime_ns: int, skill_level: str) -> Tuple[str, str]:
+    """Render one skill level's guidance and the framework templates as indented JSON."""
+    config = parse_config_file(path_str, mtime_ns)
+    return (
+        dumps_json_indented(config.get("skill_levels", {}).get(skill_level, {})),
+        dumps_json_indented(config.get("framework_templates", {})),
+    )
 
 
 def load_framework_config() -> Dict[str, Any]:
@@ -30,20 +53,22 @@ def load_framework_config() -> Dict[str, Any]:
     Load framework templates and skill level presets from defaults.yaml.
 
     Returns:
-        Dict with skill_levels and framework_templates
+        Dict with skill_levels and framework_templates. The dict is shared
+        between calls, so treat it as read-only.
 
     Teaching Note:
         Externalizing configuration to YAML makes the system flexible and
         maintainable. Users can edit defaults.yaml to add new framework
         templates or adjust skill level recommendations without touching code.
+
+        The parsed file comes from tools.config_tool, which memoizes it on
+        its path and modification time and shares it with any other agent
+        that reads defaults.yaml. Failed loads are not cached.
     """
-    config_path = Path(__file__).parent.parent / "config" / "defaults.yaml"
     try:
-        with open(config_path, 'r') as f:
-            config = yaml.safe_load(f)
-        return config
+        return get_config()
     except Exception as e:
-        print(f"Warning: Could not load config from {config_path}: {e}")
+        _logger.warning("Could not load config from %s: %s", DEFAULT_CONFIG_PATH, e)
         # Return minimal fallback config
         return {
             "skill_levels": {},
@@ -51,6 +76,12 @@ def load_framework_config() -> Dict[str, Any]:
         }
 
 
+def _bullet_list(items) -> str:
+    """Render items as "- item" lines for a prompt."""
+    return "\n".join(map("- {}".format, items))
+
+
+@lru_cache(maxsize=1)
 def create_framework_selector_agent() -> Agent:
     """
     Create the FrameworkSelectorAgent with specialized prompting for tech stack selection.
@@ -59,6 +90,9 @@ def create_framework_selector_agent() -> Agent:
     tools vs. complex ones. It prioritizes developer experience, learning
     value, and well-documented, stable technologies.
 
+    The agent's configuration never changes between calls, so the instance is
+    built once and reused (see reset_framework_selector_agent()).
+
     Returns:
         CrewAI Agent configured for framework selection
 
@@ -68,6 +102,8 @@ def create_framework_selector_agent() -> Agent:
         agent tries to hit the "Goldilocks zone" - just right for the user's
         skill level and project needs.
     """
+    from crewai import Agent
+
     return Agent(
         role="Technology Stack Advisor",
         goal="Select appropriate, well-matched frameworks and tools for the project",
@@ -104,57 +140,18 @@ def create_framework_selector_agent() -> Agent:
     )
 
 
-def create_framework_selection_task(
-    agent: Agent,
-    project_idea: ProjectIdea,
-    project_goals: ProjectGoals,
-    skill_level: str = "intermediate"
-) -> Task:
+def reset_framework_selector_agent() -> None:
     """
-    Create the task for selecting frameworks and tools.
-
-    Args:
-        agent: The FrameworkSelectorAgent
-        project_idea: Refined project concept
-        project_goals: Learning and technical goals
-        skill_level: User's skill level
-
-    Returns:
-        CrewAI Task configured for framework selection
+    Drop the cached FrameworkSelectorAgent so the next call builds a fresh one.
 
-    Teaching Note:
-        This task provides the agent with rich context (idea, goals, skill level,
-        and framework templates from config). The agent uses all this information
-        to make informed recommendations that balance learning value, simplicity,
-        and project requirements.
+    Mainly useful in tests, or after changing LLM settings in the environment.
     """
-    # Load configuration for framework templates and skill level guidance
-    config = load_framework_config()
-    skill_config = config.get("skill_levels", {}).get(skill_level, {})
-    framework_templates = config.get("framework_templates", {})
-
-    description = f"""
-Select appropriate frameworks and tools for this project:
-
-PROJECT CONCEPT:
-{project_idea.refined_summary}
+    create_framework_selector_agent.cache_clear()
 
-LEARNING GOALS:
-{chr(10).join(f"- {goal}" for goal in project_goals.learning_goals)}
 
-TECHNICAL GOALS:
-{chr(10).join(f"- {goal}" for goal in project_goals.technical_goals)}
-
-USER SKILL LEVEL: {skill_level}
-SKILL LEVEL GUIDANCE:
-{json.dumps(skill_config, indent=2)}
-
-AVAILABLE FRAMEWORK TEMPLATES:
-{json.dumps(framework_templates, indent=2)}
-
-Your task is to select:
-
-1. FRONTEND (or None if CLI-only):
+# Catalogue of frontend, backend, storage and library options offered to the
+# agent. It is static, so it is spliced into the template once at import.
+_FRAMEWORK_OPTIONS_BLOCK = """1. FRONTEND (or None if CLI-only):
    - Streamlit: Great for quick data apps, dashboards, prototypes (beginner-friendly)
    - Gradio: Best for ML/AI demos and interfaces (beginner-friendly)
    - Flask + Jinja: Simple server-rendered web apps (intermediate)
@@ -184,7 +181,32 @@ Your task is to select:
    - Data science: pandas, numpy, matplotlib, plotly
    - Testing: pytest, unittest
    - Other domain-specific tools
+"""
+
+# Framework selection prompt. Only the named fields change between calls, so
+# the body is built once at import time and filled in with str.format_map.
+_TASK_TEMPLATE = """
+Select appropriate frameworks and tools for this project:
+
+PROJECT CONCEPT:
+{refined_summary}
+
+LEARNING GOALS:
+{learning_goals}
 
+TECHNICAL GOALS:
+{technical_goals}
+
+USER SKILL LEVEL: {skill_level}
+SKILL LEVEL GUIDANCE:
+{skill_block}
+
+AVAILABLE FRAMEWORK TEMPLATES:
+{templates_block}
+
+Your task is to select:
+
+""" + _FRAMEWORK_OPTIONS_BLOCK + """
 SELECTION CRITERIA:
 - Match skill level: don't overwhelm {skill_level} users
 - Prioritize simplicity and good documentation
@@ -203,6 +225,51 @@ OUTPUT FORMAT (must be valid JSON):
 }}
 """
 
+
+def create_framework_selection_task(
+    agent: Agent,
+    project_idea: ProjectIdea,
+    project_goals: ProjectGoals,
+    skill_level: str = "intermediate"
+) -> Task:
+    """
+    Create the task for selecting frameworks and tools.
+
+    Args:
+        agent: The FrameworkSelectorAgent
+        project_idea: Refined project concept
+        project_goals: Learning and technical goals
+        skill_level: User's skill level
+
+    Returns:
+        CrewAI Task configured for framework selection
+
+    Teaching Note:
+        This task provides the agent with rich context (idea, goals, skill level,
+        and framework templates from config). The agent uses all this information
+        to make informed recommendations that balance learning value, simplicity,
+        and project requirements.
+    """
+    from crewai import Task
+
+    # Framework templates and skill level guidance from config, rendered as
+    # JSON once per (config version, skill level) rather than on every call
+    try:
+        skill_block, templates_block = _config_json_blocks(*config_version(), skill_level)
+    except Exception:
+        config = load_framework_config()  # warns and returns the fallback config
+        skill_block = dumps_json_indented(config.get("skill_levels", {}).get(skill_level, {}))
+        templates_block = dumps_json_indented(config.get("framework_templates", {}))
+
+    description = _TASK_TEMPLATE.format_map({
+        "refined_summary": project_idea.refined_summary,
+        "learning_goals": _bullet_list(project_goals.learning_goals),
+        "technical_goals": _bullet_list(project_goals.technical_goals),
+        "skill_level": skill_level,
+        "skill_block": skill_block,
+        "templates_block": templates_block
+    })
+
     return Task(
         description=description,
         expected_output="JSON object with frontend, backend, storage, special_libs, and rationale",
@@ -210,35 +277,51 @@ OUTPUT FORMAT (must be valid JSON):
     )
 
 
-def parse_framework_selection_result(result: str) -> FrameworkChoice:
+def fallback_framework_choice() -> FrameworkChoice:
+    """Return the safe default stack used when the agent's reply can't be parsed."""
+    return FrameworkChoice(
+        frontend="Streamlit",
+        backend="Python",
+        storage="JSON files",
+        special_libs=[]
+    )
+
+
+def try_parse_framework_selection(result: str) -> Optional[FrameworkChoice]:
     """
     Parse the agent's JSON output into a FrameworkChoice object.
 
+    Unlike parse_framework_selection_result(), a reply that can't be parsed
+    yields None instead of the fallback stack, so callers can tell the two
+    apart (e.g. to avoid caching the fallback).
+
     Args:
         result: JSON string from the agent
 
     Returns:
-        FrameworkChoice with selected frameworks and libraries
+        FrameworkChoice with selected frameworks and libraries, or None if
+        the reply is not a usable JSON object
 
     Teaching Note:
         Framework selection output includes a rationale field that's useful
         for debugging and understanding the agent's reasoning, but we don't
-        store it in the FrameworkChoice model. We print it for visibility
-        during execution.
+        store it in the FrameworkChoice model. We log it at INFO level, which
+        the CLI shows by default; unlike print, batch callers can raise the
+        level and skip the formatting and stdout writes entirely.
     """
     try:
-        # Clean up potential markdown code blocks
-        clean_result = result.strip()
-        if clean_result.startswith("```"):
-            lines = clean_result.split("\n")
-            clean_result = "\n".join(lines[1:-1] if len(lines) > 2 else lines)
+        # Slice from the first "{" to the last "}", which drops markdown
+        # fences (closed or truncated), preamble like "Here is the JSON:"
+        # and trailing chatter in one pass without splitting into lines
+        start = result.find("{")
+        end = result.rfind("}")
+        clean_result = result[start:end + 1] if 0 <= start < end else result
 
-        data = json.loads(clean_result)
+        data = loads_json(clean_result)
 
         # Print rationale if provided (helpful for debugging)
         if "rationale" in data:
-            print(f"\nFramework Selection Rationale:")
-            print(f"  {data['rationale']}\n")
+            _logger.info("Framework selection rationale: %s", data["rationale"])
 
         return FrameworkChoice(
             frontend=data.get("frontend"),
@@ -246,17 +329,27 @@ def parse_framework_selection_result(result: str) -> FrameworkChoice:
             storage=data.get("storage"),
             special_libs=data.get("special_libs", [])
         )
-    except (json.JSONDecodeError, KeyError, AttributeError) as e:
-        print(f"Warning: Could not parse framework selection output as JSON: {e}")
-        print(f"Using fallback framework choices")
+    except (json.JSONDecodeError, KeyError, AttributeError, TypeError) as e:
+        _logger.warning("Could not parse framework selection output as JSON: %s", e)
+        return None
 
-        # Fallback to safe defaults
-        return FrameworkChoice(
-            frontend="Streamlit",
-            backend="Python",
-            storage="JSON files",
-            special_libs=[]
-        )
+
+def parse_framework_selection_result(result: str) -> FrameworkChoice:
+    """
+    Parse the agent's JSON output, falling back to a safe default stack.
+
+    Args:
+        result: JSON string from the agent
+
+    Returns:
+        FrameworkChoice from the reply, or fallback_framework_choice() if the
+        reply can't be parsed
+    """
+    choice = try_parse_framework_selection(result)
+    if choice is None:
+        _logger.warning("Using fallback framework choices")
+        return fallback_framework_choice()
+    return choice
 
 
 def select_frameworks(
@@ -14,13 +14,27 @@ Key responsibilities:
 The output ProjectGoals guides framework selection and teaching enrichment.
 """
 
-from crewai import Agent, Task
-from typing import Dict, Any
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, Any
 import json
+import logging
 
 from ..models.project_models import ProjectIdea, ProjectGoals
+from ..tools.json_tool import loads_json
+from ..tools.text_cleaner_tool import compact_constraints
+
+# Only the agent and task factories (and analyze_goals) need CrewAI, so it is
+# imported there; parse_goals_analysis_result can be used and tested without it.
+if TYPE_CHECKING:
+    from crewai import Agent, Task
+
+# Parse fallbacks are reported here rather than printed to stdout
+_logger = logging.getLogger("project_forge.goals_analyzer")
 
 
+@lru_cache(maxsize=1)
 def create_goals_analyzer_agent() -> Agent:
     """
     Create the GoalsAnalyzerAgent with specialized prompting for goal extraction.
@@ -29,6 +43,9 @@ def create_goals_analyzer_agent() -> Agent:
     a project concept and identifies both the learning value (what skills are
     being practiced) and the technical deliverables (what gets built).
 
+    The agent's configuration never changes between calls, so the instance is
+    built once and reused (see reset_goals_analyzer_agent()).
+
     Returns:
         CrewAI Agent configured for goals analysis
 
@@ -38,6 +55,8 @@ def create_goals_analyzer_agent() -> Agent:
         you build?". Both perspectives are crucial for creating a project that
         is both functional and educational.
     """
+    from crewai import Agent
+
     return Agent(
         role="Learning & Technical Goals Analyst",
         goal="Extract clear learning objectives and technical deliverables from project concepts",
@@ -69,34 +88,25 @@ def create_goals_analyzer_agent() -> Agent:
     )
 
 
-def create_goals_analysis_task(agent: Agent, project_idea: ProjectIdea, skill_level: str = "intermediate") -> Task:
+def reset_goals_analyzer_agent() -> None:
     """
-    Create the task for analyzing goals from a refined project concept.
-
-    Args:
-        agent: The GoalsAnalyzerAgent
-        project_idea: Refined project concept from ConceptExpanderAgent
-        skill_level: User's skill level
+    Drop the cached GoalsAnalyzerAgent so the next call builds a fresh one.
 
-    Returns:
-        CrewAI Task configured for goals analysis
+    Mainly useful in tests, or after changing LLM settings in the environment.
+    """
+    create_goals_analyzer_agent.cache_clear()
 
-    Teaching Note:
-        Goal extraction is crucial because it drives all downstream decisions:
-        - Framework selection picks tools that support these goals
-        - Phase design organizes work to achieve these goals
-        - Teaching enrichment explains how each step advances these goals
 
-        Good goals are specific, achievable, and aligned with the project.
-    """
-    description = f"""
+# Goals analysis prompt. Only the named fields change between calls, so the
+# body is built once at import time and filled in with str.format_map.
+_TASK_TEMPLATE = """
 Analyze this refined project concept and extract both learning and technical goals:
 
 PROJECT CONCEPT:
-{project_idea.refined_summary}
+{refined_summary}
 
 CONSTRAINTS:
-{json.dumps(project_idea.constraints, indent=2)}
+{constraints}
 
 USER SKILL LEVEL: {skill_level}
 
@@ -155,6 +165,35 @@ OUTPUT FORMAT (must be valid JSON):
 }}
 """
 
+
+def create_goals_analysis_task(agent: Agent, project_idea: ProjectIdea, skill_level: str = "intermediate") -> Task:
+    """
+    Create the task for analyzing goals from a refined project concept.
+
+    Args:
+        agent: The GoalsAnalyzerAgent
+        project_idea: Refined project concept from ConceptExpanderAgent
+        skill_level: User's skill level
+
+    Returns:
+        CrewAI Task configured for goals analysis
+
+    Teaching Note:
+        Goal extraction is crucial because it drives all downstream decisions:
+        - Framework selection picks tools that support these goals
+        - Phase design organizes work to achieve these goals
+        - Teaching enrichment explains how each step advances these goals
+
+        Good goals are specific, achievable, and aligned with the project.
+    """
+    from crewai import Task
+
+    description = _TASK_TEMPLATE.format_map({
+        "refined_summary": project_idea.refined_summary,
+        "constraints": compact_constraints(project_idea.constraints),
+        "skill_level": skill_level
+    })
+
     return Task(
         description=description,
         expected_output="JSON object with learning_goals, technical_goals, and priority_notes",
@@ -178,23 +217,22 @@ def parse_goals_analysis_result(result: str) -> ProjectGoals:
         sensible defaults if parsing fails.
     """
     try:
-        # Clean up potential markdown code blocks
-        clean_result = result.strip()
-        if clean_result.startswith("```"):
-            lines = clean_result.split("\n")
-            # Remove first and last lines (```json and ```)
-            clean_result = "\n".join(lines[1:-1] if len(lines) > 2 else lines)
+        # Slice from the first "{" to the last "}", which drops markdown
+        # fences (closed or truncated), preamble like "Here is the JSON:"
+        # and trailing chatter in one pass without splitting into lines
+        start = result.find("{")
+        end = result.rfind("}")
+        clean_result = result[start:end + 1] if 0 <= start < end else result
 
-        data = json.loads(clean_result)
+        data = loads_json(clean_result)
 
         return ProjectGoals(
             learning_goals=data.get("learning_goals", []),
             technical_goals=data.get("technical_goals", []),
             priority_notes=data.get("priority_notes", "")
         )
-    except (json.JSONDecodeError, KeyError, AttributeError) as e:
-        print(f"Warning: Could not parse goals analysis output as JSON: {e}")
-        print(f"Using fallback goals")
+    except (json.JSONDecodeError, KeyError, AttributeError, TypeError) as e:
+        _logger.warning("Could not parse goals analysis output as JSON: %s; using fallback goals", e)
 
         # Fallback to empty goals (better than crashing)
         return ProjectGoals(
@@ -27,33 +27,41 @@ Teaching Note:
     - This structure makes progress visible and momentum sustainable
 """
 
-from crewai import Agent, Task
-from typing import List, Dict, Any
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import TYPE_CHECKING, List, Dict, Any, Iterable, Iterator, Optional, Tuple
+import asyncio
 import json
+import logging
+import re
 
 from ..models.project_models import ProjectIdea, ProjectGoals, FrameworkChoice, Phase, Step
+from ..tools.llm_tool import agent_llm_kwargs, import_litellm, llm_model
+from ..tools.cache_tool import ResponseCache, make_cache_key
+from ..tools.json_tool import loads_json
+from ..tools.text_cleaner_tool import compact_constraints
 
+# CrewAI is imported by the agent/task factories and execute_phase_design;
+# the parser, the validator and the design cache don't need it.
+if TYPE_CHECKING:
+    from crewai import Agent, Task
 
-def create_phase_designer_agent() -> Agent:
-    """
-    Create the PhaseDesignerAgent with specialized prompting for build planning.
 
-    This agent understands how to structure projects into logical phases and
-    break those phases into small, concrete steps. It has strong intuitions
-    about appropriate scope and realistic timeframes.
+# Parsed phase designs keyed on phase_design_fingerprint(). Phase design is
+# the longest LLM call in the pipeline, so a hit saves the most time.
+phase_cache = ResponseCache("phase_design")
 
-    Returns:
-        CrewAI Agent configured for phase design
+# Name of the placeholder phase returned when the agent output can't be parsed
+_PARSE_ERROR_PHASE_NAME = "Phase 1: Setup (Parsing Error)"
 
-    Teaching Note:
-        The backstory shapes how this agent thinks about project structure.
-        We want it to be pragmatic, realistic about scope, and focused on
-        concrete deliverables rather than vague "research" or "learn" steps.
-    """
-    return Agent(
-        role="Project Phase Designer",
-        goal="Transform project concepts into structured 5-phase build plans with ~50 concrete, actionable steps",
-        backstory="""You are an expert project architect and engineering manager
+_logger = logging.getLogger("project_forge.phase_designer")
+
+# Agent persona, shared by the CrewAI agent and the direct LiteLLM calls made
+# by design_phases_batch() so both paths prompt the model identically
+_AGENT_ROLE = "Project Phase Designer"
+_AGENT_GOAL = "Transform project concepts into structured 5-phase build plans with ~50 concrete, actionable steps"
+_AGENT_BACKSTORY = """You are an expert project architect and engineering manager
         who specializes in creating build plans for AUTONOMOUS AI EXECUTION.
 
         Your plans are designed for AI agents (like Claude Code) that will execute
@@ -86,67 +94,172 @@ def create_phase_designer_agent() -> Agent:
         - Make steps too large (multi-hour efforts) or too small (trivial)
         - Ignore dependencies or assume knowledge appears magically
         - Create more than 5 phases or wildly unbalanced phase sizes
-        - Design plans that require the user to review progress mid-way""",
-        allow_delegation=False,
-        verbose=True
-    )
+        - Design plans that require the user to review progress mid-way"""
 
+# Maximum number of concurrent LLM calls made by design_phases_batch
+MAX_BATCH_CONCURRENCY = 4
 
-def create_phase_design_task(
-    agent: Agent,
-    idea: ProjectIdea,
-    goals: ProjectGoals,
-    framework: FrameworkChoice,
-    skill_level: str = "intermediate"
-) -> Task:
+# Shape a design is expected to have. A plan outside these bounds is still
+# accepted; parse_phase_design_result() only logs a warning about it.
+EXPECTED_PHASES = 5
+MIN_STEPS_PER_PHASE = 8
+MAX_STEPS_PER_PHASE = 12
+
+# Replies that fail to parse (see phase_design_problems) are sent back to
+# the agent with the problems listed, up to this many times
+MAX_REPAIR_ATTEMPTS = 2
+
+# Opening of the phases array in a (possibly fenced) streamed reply
+_PHASES_ARRAY_RE = re.compile(r'"phases"\s*:\s*\[')
+
+# Characters the streaming scanner stops at: structure outside strings, and
+# the closing quote or an escape inside them
+_STRUCTURE_RE = re.compile(r'[{}"\]]')
+_STRING_SPECIAL_RE = re.compile(r'["\\]')
+
+_REPAIR_TEMPLATE = """
+
+Your previous output failed validation:
+{problems}
+
+PREVIOUS OUTPUT:
+{previous}
+
+Return ONLY the corrected JSON object, fixing every problem listed above.
+"""
+
+# JSON schema of the phase design output. Sent as an OpenAI-style strict
+# json_schema response format to models known to support it (see
+# _response_format_for), so the model can only emit a {"phases": [...]}
+# object of this exact shape: no markdown fences, no chatter, no missing fields.
+_STEP_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "index": {"type": "integer"},
+        "title": {"type": "string"},
+        "description": {"type": "string"},
+        "dependencies": {"type": "array", "items": {"type": "integer"}},
+    },
+    "required": ["index", "title", "description", "dependencies"],
+    "additionalProperties": False,
+}
+_PHASE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "index": {"type": "integer"},
+        "name": {"type": "string"},
+        "description": {"type": "string"},
+        "steps": {"type": "array", "items": _STEP_SCHEMA},
+    },
+    "required": ["index", "name", "description", "steps"],
+    "additionalProperties": False,
+}
+_PHASE_DESIGN_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "phase_design",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {"phases": {"type": "array", "items": _PHASE_SCHEMA}},
+            "required": ["phases"],
+            "additionalProperties": False,
+        },
+    },
+}
+
+# Plain JSON mode, for models without strict structured outputs (older OpenAI
+# models, most other providers). The repair loop covers what the schema would.
+_JSON_OBJECT_RESPONSE_FORMAT = {"type": "json_object"}
+
+# OpenAI models known to accept strict json_schema response formats. Exact
+# IDs rather than prefixes: o1-mini, o1-preview and gpt-4o-2024-05-13 share
+# a prefix with supported models but reject the schema, and the CrewAI path
+# has no retry. Anything not listed gets JSON mode.
+_STRICT_SCHEMA_MODELS = frozenset({
+    "gpt-4o", "gpt-4o-2024-08-06", "gpt-4o-2024-11-20",
+    "gpt-4o-mini", "gpt-4o-mini-2024-07-18",
+    "gpt-4.1", "gpt-4.1-mini", "gpt-4.1-nano",
+    "gpt-5", "gpt-5-mini", "gpt-5-nano",
+    "o1", "o1-2024-12-17", "o3", "o3-mini", "o4-mini",
+})
+
+
+def _response_format_for(model: str) -> Dict[str, Any]:
+    """Pick the strict phase design schema for capable models, JSON mode for the rest."""
+    name = model.lower()
+    if name.startswith("openai/"):
+        name = name[len("openai/"):]
+    if name in _STRICT_SCHEMA_MODELS:
+        return _PHASE_DESIGN_RESPONSE_FORMAT
+    return _JSON_OBJECT_RESPONSE_FORMAT
+
+
+@lru_cache(maxsize=1)
+def create_phase_designer_agent() -> Agent:
     """
-    Create the task for designing phases and steps.
+    Create the PhaseDesignerAgent with specialized prompting for build planning.
 
-    This task provides comprehensive context about the project and asks the
-    agent to produce a structured 5-phase plan with detailed steps.
+    This agent understands how to structure projects into logical phases and
+    break those phases into small, concrete steps. It has strong intuitions
+    about appropriate scope and realistic timeframes.
 
-    Args:
-        agent: The PhaseDesignerAgent
-        idea: Refined project concept with constraints
-        goals: Learning and technical objectives
-        framework: Selected technology stack
-        skill_level: User's skill level
+    When the user has configured a model, its LLM is constrained to the phase
+    design JSON schema (or to JSON mode, for models without strict structured
+    outputs), so replies parse on the first try instead of occasionally
+    falling back to a stub plan.
+
+    The agent's configuration never changes between calls, so the instance is
+    built once and reused (see reset_phase_designer_agent()). Only the task
+    differs per project; create_phase_design_task() builds a fresh one.
 
     Returns:
-        CrewAI Task configured for phase design
+        CrewAI Agent configured for phase design
 
     Teaching Note:
-        The prompt is quite detailed because we need to guide the LLM to
-        produce a very specific structure. We provide rules, examples, and
-        format specifications to minimize ambiguity and maximize quality.
+        The backstory shapes how this agent thinks about project structure.
+        We want it to be pragmatic, realistic about scope, and focused on
+        concrete deliverables rather than vague "research" or "learn" steps.
     """
-    description = f"""
-Create a detailed 5-phase build plan for AUTONOMOUS AI EXECUTION.
+    from crewai import Agent
 
-CRITICAL: This plan will be given to an AI agent (like Claude Code) that will execute
-ALL phases and steps in ONE CONTINUOUS SESSION without user intervention. Each step must
-be clear, specific, and executable without requiring clarification or external research.
-The AI should be able to work for 1+ hours and deliver a complete, working project.
+    return Agent(
+        role=_AGENT_ROLE,
+        goal=_AGENT_GOAL,
+        backstory=_AGENT_BACKSTORY,
+        # Structured output (configured model only): strict schema where the
+        # model supports it, JSON mode otherwise
+        **agent_llm_kwargs(_response_format_for(llm_model())),
+        allow_delegation=False,
+        verbose=True
+    )
 
-PROJECT CONCEPT:
-{idea.refined_summary}
 
-CONSTRAINTS:
-{json.dumps(idea.constraints, indent=2)}
+def reset_phase_designer_agent() -> None:
+    """
+    Drop the cached PhaseDesignerAgent so the next call builds a fresh one.
 
-LEARNING GOALS (for users of the final program):
-{chr(10).join(f'- {goal}' for goal in goals.learning_goals)}
+    Mainly useful in tests, or after changing LLM settings in the environment.
+    """
+    create_phase_designer_agent.cache_clear()
 
-TECHNICAL GOALS (features the program must have):
-{chr(10).join(f'- {goal}' for goal in goals.technical_goals)}
 
-SELECTED FRAMEWORKS:
-- Frontend: {framework.frontend or 'None (CLI-only)'}
-- Backend: {framework.backend or 'None'}
-- Storage: {framework.storage or 'None'}
-- Libraries: {', '.join(framework.special_libs) if framework.special_libs else 'Standard libs'}
+# Task prompt, split into an invariant head and a per-call tail. The head
+# (rules, examples and output format) is built once at import time and forms a
+# stable prefix that providers with prompt caching (OpenAI automatically,
+# Anthropic via LiteLLM) can reuse across runs; the project-specific context
+# comes last so it never breaks that prefix. Only the tail is formatted per
+# call, from values computed once each.
+_TASK_TEMPLATE_STATIC_HEAD = """
+Create a detailed 5-phase build plan for AUTONOMOUS AI EXECUTION.
+
+CRITICAL: This plan will be given to an AI agent (like Claude Code) that will execute
+ALL phases and steps in ONE CONTINUOUS SESSION without user intervention. Each step must
+be clear, specific, and executable without requiring clarification or external research.
+The AI should be able to work for 1+ hours and deliver a complete, working project.
 
-USER SKILL LEVEL: {skill_level}
+The project concept, constraints, goals, selected frameworks and user skill level
+are given at the end.
 
 Your task is to create a 5-phase build plan with approximately 10 steps per phase (50 total)
 that an AI agent can execute autonomously from start to finish.
@@ -167,7 +280,7 @@ STEP REQUIREMENTS FOR AUTONOMOUS AI EXECUTION:
 6. No step should require external research, user input, or clarification
 7. Use specific technical terms matching the chosen frameworks
 8. Include enough detail that an AI knows exactly what to implement
-9. Steps should match the {skill_level} skill level of the final program's users
+9. Steps should match the skill level of the final program's users
 10. Each step should be completable without waiting for user review
 
 WHAT MAKES A GOOD STEP FOR AI EXECUTION:
@@ -185,25 +298,25 @@ WHAT MAKES A BAD STEP FOR AI EXECUTION:
 ✗ "Fix any issues" (requires user to identify issues first)
 
 OUTPUT FORMAT (must be valid JSON):
-{{
+{
     "phases": [
-        {{
+        {
             "index": 1,
             "name": "Phase Name (e.g., Foundations & Setup)",
             "description": "1-2 sentence overview of what this phase accomplishes",
             "steps": [
-                {{
+                {
                     "index": 1,
                     "title": "Short, specific step name",
                     "description": "Detailed instructions for this step (2-4 sentences). Be specific about what to build, which files to create/modify, and what the deliverable looks like.",
                     "dependencies": []
-                }},
+                },
                 ... (approximately 10 steps per phase)
             ]
-        }},
+        },
         ... (5 phases total)
     ]
-}}
+}
 
 IMPORTANT FOR AUTONOMOUS EXECUTION:
 - Generate exactly 5 phases that flow sequentially
@@ -214,10 +327,86 @@ IMPORTANT FOR AUTONOMOUS EXECUTION:
 - Make every step concrete, specific, and immediately buildable
 - No step should say "if needed" or "consider" - be decisive
 - Ensure the entire plan can be completed in 1-3 hours of continuous AI work
-- The final program should be appropriate for {skill_level} users
+- The final program should be appropriate for the given user skill level
 - All 50 steps should be executable sequentially without user intervention
+
 """
 
+
+_TASK_TEMPLATE_DYNAMIC = """PROJECT CONCEPT:
+{summary}
+
+CONSTRAINTS:
+{constraints}
+
+LEARNING GOALS (for users of the final program):
+{learning_goals}
+
+TECHNICAL GOALS (features the program must have):
+{technical_goals}
+
+SELECTED FRAMEWORKS:
+- Frontend: {frontend}
+- Backend: {backend}
+- Storage: {storage}
+- Libraries: {libraries}
+
+USER SKILL LEVEL: {skill}
+"""
+
+
+def _build_task_description(
+    idea: ProjectIdea,
+    goals: ProjectGoals,
+    framework: FrameworkChoice,
+    skill_level: str
+) -> str:
+    """Render the full phase design prompt: the static head plus this project's tail."""
+    return _TASK_TEMPLATE_STATIC_HEAD + _TASK_TEMPLATE_DYNAMIC.format(
+        summary=idea.refined_summary,
+        constraints=compact_constraints(idea.constraints),
+        learning_goals="\n".join([f"- {goal}" for goal in goals.learning_goals]),
+        technical_goals="\n".join([f"- {goal}" for goal in goals.technical_goals]),
+        frontend=framework.frontend or "None (CLI-only)",
+        backend=framework.backend or "None",
+        storage=framework.storage or "None",
+        libraries=", ".join(framework.special_libs) if framework.special_libs else "Standard libs",
+        skill=skill_level
+    )
+
+
+def create_phase_design_task(
+    agent: Agent,
+    idea: ProjectIdea,
+    goals: ProjectGoals,
+    framework: FrameworkChoice,
+    skill_level: str = "intermediate"
+) -> Task:
+    """
+    Create the task for designing phases and steps.
+
+    This task provides comprehensive context about the project and asks the
+    agent to produce a structured 5-phase plan with detailed steps.
+
+    Args:
+        agent: The PhaseDesignerAgent
+        idea: Refined project concept with constraints
+        goals: Learning and technical objectives
+        framework: Selected technology stack
+        skill_level: User's skill level
+
+    Returns:
+        CrewAI Task configured for phase design
+
+    Teaching Note:
+        The prompt is quite detailed because we need to guide the LLM to
+        produce a very specific structure. We provide rules, examples, and
+        format specifications to minimize ambiguity and maximize quality.
+    """
+    description = _build_task_description(idea, goals, framework, skill_level)
+
+    from crewai import Task
+
     return Task(
         description=description,
         expected_output="JSON object with 5 phases containing approximately 50 total steps",
@@ -225,6 +414,132 @@ IMPORTANT FOR AUTONOMOUS EXECUTION:
     )
 
 
+def _load_phase_design_json(result: str) -> Dict[str, Any]:
+    """Decode the agent's reply, ignoring any code fence or text around the JSON object."""
+    # Slice from the first "{" to the last "}" so fences (closed, unclosed
+    # or on the same line as the JSON) and preamble text don't matter
+    start = result.find("{")
+    end = result.rfind("}")
+    clean_result = result[start:end + 1] if 0 <= start < end else result
+    return loads_json(clean_result)
+
+
+def phase_design_problems(result: str) -> List[str]:
+    """
+    List the ways a raw phase design reply fails to parse into a plan.
+
+    Only parse and schema failures count: invalid JSON, missing keys and
+    values of the wrong type. These are what the repair loop asks the agent
+    to fix. A plan that parses but has an unexpected number of phases or
+    steps is kept as is; parse_phase_design_result() logs a warning and the
+    evaluator decides whether the plan needs another round. Bad step
+    dependencies are not problems either; parse_phase_design_result() drops
+    them.
+
+    Args:
+        result: Raw JSON string from the agent
+
+    Returns:
+        Human-readable problems (with their location), empty if the design
+        parses cleanly
+
+    Example:
+        >>> phase_design_problems('{"phases": []}')
+        ['"phases" list is empty']
+    """
+    try:
+        data = _load_phase_design_json(result)
+    except json.JSONDecodeError as e:
+        return [f"output is not valid JSON: {e}"]
+
+    phases_data = data.get("phases") if isinstance(data, dict) else None
+    if not isinstance(phases_data, list):
+        return ['top level must be an object with a "phases" list']
+    if not phases_data:
+        return ['"phases" list is empty']
+
+    problems = []
+    for phase_number, phase_data in enumerate(phases_data, 1):
+        steps_data = phase_data.get("steps") if isinstance(phase_data, dict) else None
+        if not isinstance(steps_data, list):
+            problems.append(f"phases[{phase_number}]: missing \"steps\" list")
+            continue
+        for step_number, step_data in enumerate(steps_data, 1):
+            location = f"phases[{phase_number}].steps[{step_number}]"
+            if not isinstance(step_data, dict) or not step_data.get("title") or not step_data.get("description"):
+                problems.append(f"{location}: missing title or description")
+            elif not isinstance(step_data["title"], str) or not isinstance(step_data["description"], str):
+                problems.append(f"{location}: title and description must be strings")
+
+    return problems
+
+
+def _shape_warnings(phases: List[Phase]) -> List[str]:
+    """List how a parsed plan departs from the expected phase and step counts."""
+    warnings = []
+    if len(phases) != EXPECTED_PHASES:
+        warnings.append(f"expected {EXPECTED_PHASES} phases, got {len(phases)}")
+    for phase_number, phase in enumerate(phases, 1):
+        if not MIN_STEPS_PER_PHASE <= len(phase.steps) <= MAX_STEPS_PER_PHASE:
+            warnings.append(
+                f"phases[{phase_number}]: expected {MIN_STEPS_PER_PHASE}-{MAX_STEPS_PER_PHASE} "
+                f"steps, got {len(phase.steps)}"
+            )
+    return warnings
+
+
+def _earlier_dependencies(dependencies: Any, step_index: int) -> List[int]:
+    """Keep the dependencies that name an earlier step; drop forward, self and non-integer ones."""
+    if not isinstance(dependencies, list):
+        return []
+    return [dep for dep in dependencies if type(dep) is int and 0 < dep < step_index]
+
+
+def _build_phase(phase_data: Dict[str, Any], phase_number: int, first_step_index: int) -> Phase:
+    """
+    Build one Phase from its JSON, numbering steps globally from first_step_index.
+
+    Raises:
+        ValueError: If the phase, its "steps" value or one of its steps is
+            not the JSON type the schema asks for
+    """
+    if not isinstance(phase_data, dict):
+        raise ValueError(f"phases[{phase_number}] is not an object")
+    steps_data = phase_data.get("steps", [])
+    if not isinstance(steps_data, list):
+        raise ValueError(f'phases[{phase_number}]: "steps" is not a list')
+
+    steps = []
+    for offset, step_data in enumerate(steps_data):
+        if not isinstance(step_data, dict):
+            raise ValueError(f"phases[{phase_number}].steps[{offset + 1}] is not an object")
+        # Fix step index to be global rather than per-phase
+        step_index = first_step_index + offset
+        raw_dependencies = step_data.get("dependencies", [])
+        dependencies = _earlier_dependencies(raw_dependencies, step_index)
+        if dependencies != raw_dependencies:
+            # Not worth a repair call: the plan stays usable without the
+            # bad references, so they are dropped and logged
+            _logger.warning(
+                "Step %d: dropped dependencies that are not earlier steps: %s",
+                step_index, raw_dependencies
+            )
+        steps.append(Step(
+            index=step_index,
+            title=step_data.get("title", f"Step {step_index}"),
+            description=step_data.get("description", ""),
+            teaching_guidance="",  # Educational feature instructions from TeacherAgent
+            dependencies=dependencies
+        ))
+
+    return Phase(
+        index=phase_data.get("index", phase_number),
+        name=phase_data.get("name", f"Phase {phase_number}"),
+        description=phase_data.get("description", ""),
+        steps=steps
+    )
+
+
 def parse_phase_design_result(result: str) -> List[Phase]:
     """
     Parse the agent's JSON output into Phase and Step objects.
@@ -246,14 +561,7 @@ def parse_phase_design_result(result: str) -> List[Phase]:
         indices, since the LLM might reset numbering per phase.
     """
     try:
-        # Clean up markdown code blocks if present
-        clean_result = result.strip()
-        if clean_result.startswith("```"):
-            lines = clean_result.split("\n")
-            # Remove first and last lines (```json and ```)
-            clean_result = "\n".join(lines[1:-1])
-
-        data = json.loads(clean_result)
+        data = _load_phase_design_json(result)
         phases_data = data.get("phases", [])
 
         if not phases_data:
@@ -263,47 +571,35 @@ def parse_phase_design_result(result: str) -> List[Phase]:
         global_step_index = 1  # Track global step numbering
 
         for phase_data in phases_data:
-            steps = []
-            steps_data = phase_data.get("steps", [])
-
-            for step_data in steps_data:
-                # Fix step index to be global rather than per-phase
-                step = Step(
-                    index=global_step_index,
-                    title=step_data.get("title", f"Step {global_step_index}"),
-                    description=step_data.get("description", ""),
-                    teaching_guidance="",  # Educational feature instructions from TeacherAgent
-                    dependencies=step_data.get("dependencies", [])
-                )
-                steps.append(step)
-                global_step_index += 1
-
-            phase = Phase(
-                index=phase_data.get("index", len(phases) + 1),
-                name=phase_data.get("name", f"Phase {len(phases) + 1}"),
-                description=phase_data.get("description", ""),
-                steps=steps
-            )
+            phase = _build_phase(phase_data, len(phases) + 1, global_step_index)
             phases.append(phase)
+            global_step_index += len(phase.steps)
+
+        # Odd phase/step counts are not worth a repair call; the evaluator
+        # scores the plan's shape and asks for a refinement if it matters
+        shape_warnings = _shape_warnings(phases)
+        if shape_warnings:
+            _logger.warning("Phase design has an unexpected shape: %s", "; ".join(shape_warnings))
 
         return phases
 
-    except (json.JSONDecodeError, KeyError, ValueError) as e:
-        print(f"Error parsing phase design result: {e}")
-        print(f"Raw result: {result[:500]}...")
+    except (json.JSONDecodeError, KeyError, ValueError, AttributeError, TypeError) as e:
+        _logger.warning("Could not parse phase design result: %s", e)
+        # %.500s truncates lazily - nothing is sliced unless DEBUG is enabled
+        _logger.debug("Raw phase design result (first 500 chars): %.500s", result)
 
         # Return a minimal fallback structure
         return [
             Phase(
                 index=1,
-                name="Phase 1: Setup (Parsing Error)",
-                description=f"Error parsing plan: {str(e)}",
+                name=_PARSE_ERROR_PHASE_NAME,
+                description=f"Error parsing plan ({type(e).__name__}); see the log for details",
                 steps=[
                     Step(
                         index=1,
                         title="Fix phase design parsing",
                         description="The agent output could not be parsed. Check the raw output and fix the JSON structure.",
-                        what_you_learn="",
+                        teaching_guidance="",
                         dependencies=[]
                     )
                 ]
@@ -311,6 +607,268 @@ def parse_phase_design_result(result: str) -> List[Phase]:
         ]
 
 
+def iter_streamed_phases(chunks: Iterable[str]) -> Iterator[Phase]:
+    """
+    Yield phases from a streamed phase design reply as each one completes.
+
+    Once the "phases" array opens, every chunk is scanned exactly once from
+    a running offset, tracking brace depth (and skipping string contents, so
+    braces inside titles don't count). The chunks of the phase being
+    generated are collected in a list; when the depth drops back to the
+    array level, they are joined and decoded once, and the phase is built
+    and yielded. The total work is linear in the size of the reply. Steps
+    are numbered globally, as in parse_phase_design_result().
+
+    Args:
+        chunks: Iterable of text fragments from a streaming LLM call
+
+    Yields:
+        Phase objects, in order, as soon as their JSON is complete
+
+    Teaching Note:
+        A 5-phase plan takes tens of seconds to generate. Yielding phase 1
+        while phase 5 is still being decoded lets a UI show progress, or a
+        per-phase consumer start work, instead of waiting for the whole
+        reply. Use parse_phase_design_result() on the full text when the
+        reply needs validation or the parse fallback.
+    """
+    head_parts = []  # text before the phases array opens
+    phase_parts = []  # text of the phase object still being generated
+    depth = 0
+    in_string = False
+    escaped = False
+    phase_number = 1
+    step_index = 1
+
+    for text in chunks:
+        if head_parts is not None:
+            head_parts.append(text)
+            if "[" not in text:
+                continue
+            head = "".join(head_parts)
+            match = _PHASES_ARRAY_RE.search(head)
+            if match is None:
+                continue
+            head_parts = None
+            text = head[match.end():]
+
+        pos = 0
+        if escaped:
+            pos, escaped = 1, False  # the escaped character opened this chunk
+        segment_start = 0
+
+        while True:
+            if in_string:
+                match = _STRING_SPECIAL_RE.search(text, pos)
+                if match is None:
+                    break
+                if match.group() == "\\":
+                    pos = match.end() + 1
+                    if pos > len(text):
+                        escaped = True
+                        break
+                    continue
+                in_string = False
+                pos = match.end()
+                continue
+
+            match = _STRUCTURE_RE.search(text, pos)
+            if match is None:
+                break
+            char = match.group()
+            pos = match.end()
+            if char == '"':
+                in_string = True
+            elif char == "{":
+                if depth == 0:
+                    segment_start = match.start()
+                depth += 1
+            elif char == "}":
+                depth -= 1
+                if depth == 0:
+                    phase_parts.append(text[segment_start:pos])
+                    try:
+                        phase_data = loads_json("".join(phase_parts))
+                    except json.JSONDecodeError:
+                        return
+                    phase_parts = []
+
+                    try:
+                        phase = _build_phase(phase_data, phase_number, step_index)
+                    except ValueError as e:
+                        _logger.warning("Stopped streaming phases: %s", e)
+                        return
+                    yield phase
+                    phase_number += 1
+                    step_index += len(phase.steps)
+            elif depth == 0:
+                return  # "]" closes the phases array
+
+        if depth > 0:
+            phase_parts.append(text[segment_start:])
+
+
+def _canonical_list(items: List[str]) -> str:
+    """Join items case- and whitespace-insensitively, ignoring their order."""
+    return "\n".join(sorted(" ".join(str(item).lower().split()) for item in items))
+
+
+def phase_design_fingerprint(
+    idea: ProjectIdea,
+    goals: ProjectGoals,
+    framework: FrameworkChoice,
+    skill_level: str
+) -> str:
+    """
+    Build the phase_cache key for one set of phase-design inputs.
+
+    Every field that reaches the phase design prompt is part of the key, but
+    normalized: case, whitespace and the order of goals and libraries are
+    ignored, since none of them change what plan the agent should design.
+
+    Args:
+        idea: Refined project concept
+        goals: Learning and technical objectives
+        framework: Selected technology stack
+        skill_level: User's skill level
+
+    Returns:
+        Cache key for phase_cache
+    """
+    return make_cache_key(
+        " ".join(idea.refined_summary.lower().split()),
+        json.dumps(idea.constraints, sort_keys=True, default=str),
+        _canonical_list(goals.learning_goals),
+        _canonical_list(goals.technical_goals),
+        (framework.frontend or "").lower(),
+        (framework.backend or "").lower(),
+        (framework.storage or "").lower(),
+        _canonical_list(framework.special_libs or []),
+        skill_level
+    )
+
+
+def get_cached_phase_design(key: str, approved_only: bool = False) -> Optional[List[Phase]]:
+    """
+    Look up a previously designed plan in phase_cache.
+
+    Args:
+        key: Key from phase_design_fingerprint()
+        approved_only: Only return a design the evaluator approved (see
+                       store_phase_design); otherwise any stored design
+
+    Returns:
+        Freshly built Phase objects (safe to mutate), or None on a miss
+    """
+    cached = phase_cache.get(key)
+    if cached is None or (approved_only and not cached.get("approved")):
+        return None
+    return [
+        Phase(
+            index=phase_data["index"],
+            name=phase_data["name"],
+            description=phase_data["description"],
+            steps=[Step(**step_data) for step_data in phase_data["steps"]]
+        )
+        for phase_data in cached["phases"]
+    ]
+
+
+def store_phase_design(key: str, phases: List[Phase], approved: bool = False) -> None:
+    """
+    Store a validated plan in phase_cache.
+
+    Callers only store designs that passed phase_design_problems(); the
+    ``approved`` flag additionally records that the evaluator accepted the
+    full plan built from this design. Readers that need an approved design
+    (the planning crew) check the flag, and an unapproved design never
+    replaces an approved one for the same key.
+
+    Only the PhaseDesignerAgent's fields are kept; teaching guidance added
+    later by the TeacherAgent is left out so a cached design re-enters the
+    pipeline exactly where a fresh one would. Parse-error placeholders are
+    never stored.
+
+    Args:
+        key: Key from phase_design_fingerprint()
+        phases: Phases parsed from a validated agent reply
+        approved: Whether the evaluator approved the plan
+    """
+    if not phases or phases[0].name == _PARSE_ERROR_PHASE_NAME:
+        return
+    if not approved:
+        existing = phase_cache.get(key)
+        if existing is not None and existing.get("approved"):
+            return
+    phase_cache.set(key, {
+        "approved": approved,
+        "phases": [
+            {
+                "index": phase.index,
+                "name": phase.name,
+                "description": phase.description,
+                "steps": [
+                    {
+                        "index": step.index,
+                        "title": step.title,
+                        "description": step.description,
+                        "dependencies": step.dependencies,
+                    }
+                    for step in phase.steps
+                ],
+            }
+            for phase in phases
+        ]
+    })
+
+
+def _repair_description(description: str, result: str, problems: List[str]) -> str:
+    """Append the previous reply and its validation problems to the original prompt."""
+    return description + _REPAIR_TEMPLATE.format(
+        problems="\n".join([f"- {problem}" for problem in problems]),
+        previous=result
+    )
+
+
+def execute_phase_design(agent: Agent, task: Task, verbose: bool = True) -> str:
+    """
+    Run the phase design task, asking the agent to repair invalid output.
+
+    The reply is checked with phase_design_problems(). If it doesn't parse
+    into a plan, the agent gets the original task plus its previous output and the list
+    of problems, up to MAX_REPAIR_ATTEMPTS times. The last reply is returned
+    either way; parse_phase_design_result() still handles anything left.
+
+    Args:
+        agent: The PhaseDesignerAgent
+        task: Task from create_phase_design_task()
+        verbose: Whether CrewAI prints agent execution logs
+
+    Returns:
+        Raw JSON string from the agent
+    """
+    from crewai import Crew, Task
+
+    result = Crew(agents=[agent], tasks=[task], verbose=verbose).kickoff().raw
+
+    for attempt in range(1, MAX_REPAIR_ATTEMPTS + 1):
+        problems = phase_design_problems(result)
+        if not problems:
+            break
+        _logger.warning(
+            "Phase design failed validation (repair %d/%d): %s",
+            attempt, MAX_REPAIR_ATTEMPTS, "; ".join(problems)
+        )
+        repair_task = Task(
+            description=_repair_description(task.description, result, problems),
+            expected_output=task.expected_output,
+            agent=agent
+        )
+        result = Crew(agents=[agent], tasks=[repair_task], verbose=verbose).kickoff().raw
+
+    return result
+
+
 def design_phases(
     idea: ProjectIdea,
     goals: ProjectGoals,
@@ -321,10 +879,11 @@ def design_phases(
     High-level function to design project phases using PhaseDesignerAgent.
 
     This is the main entry point for phase design. It:
-    1. Creates the agent
-    2. Creates the task with full context
-    3. Executes the task
-    4. Parses the result into Phase/Step objects
+    1. Returns the cached design for these inputs, if there is one
+    2. Creates the agent
+    3. Creates the task with full context
+    4. Executes the task, asking the agent to repair invalid output
+    5. Parses the result into Phase/Step objects and caches them
 
     Args:
         idea: Refined project concept
@@ -340,17 +899,131 @@ def design_phases(
         >>> print(f"Created {len(phases)} phases with {sum(len(p.steps) for p in phases)} total steps")
         Created 5 phases with 50 total steps
     """
-    from crewai import Crew
+    # Equivalent inputs were designed before - skip the LLM on a hit
+    cache_key = phase_design_fingerprint(idea, goals, framework, skill_level)
+    cached = get_cached_phase_design(cache_key)
+    if cached is not None:
+        return cached
 
     agent = create_phase_designer_agent()
     task = create_phase_design_task(agent, idea, goals, framework, skill_level)
 
-    # Execute the task through a Crew
-    crew = Crew(agents=[agent], tasks=[task], verbose=True)
-    output = crew.kickoff()
-    result = output.raw
+    # Execute the task through a Crew, repairing invalid output
+    result = execute_phase_design(agent, task)
 
-    # Parse into Phase objects
+    # Parse into Phase objects; only a reply that passed validation is cached
     phases = parse_phase_design_result(result)
+    if not phase_design_problems(result):
+        store_phase_design(cache_key, phases)
 
     return phases
+
+
+async def _adesign_one(
+    idea: ProjectIdea,
+    goals: ProjectGoals,
+    framework: FrameworkChoice,
+    skill_level: str,
+    semaphore: asyncio.Semaphore
+) -> List[Phase]:
+    """Design one plan with async LLM calls, honoring the shared concurrency limit."""
+    cache_key = phase_design_fingerprint(idea, goals, framework, skill_level)
+    cached = get_cached_phase_design(cache_key)
+    if cached is not None:
+        return cached
+
+    litellm = import_litellm()
+    model = llm_model()
+    system = f"You are {_AGENT_ROLE}. {_AGENT_BACKSTORY}\n\nYour goal: {_AGENT_GOAL}"
+    description = _build_task_description(idea, goals, framework, skill_level)
+    prompt = description
+
+    response_format = _response_format_for(model)
+
+    # Same validate-and-repair loop as execute_phase_design()
+    for attempt in range(MAX_REPAIR_ATTEMPTS + 1):
+        messages = [{"role": "system", "content": system}, {"role": "user", "content": prompt}]
+        async with semaphore:
+            try:
+                response = await litellm.acompletion(
+                    model=model, messages=messages, response_format=response_format
+                )
+            except litellm.BadRequestError as e:
+                if response_format is _JSON_OBJECT_RESPONSE_FORMAT:
+                    raise
+                # The provider rejected the strict schema - retry in JSON mode
+                _logger.warning("%s rejected the strict phase design schema (%s); using JSON mode", model, e)
+                response_format = _JSON_OBJECT_RESPONSE_FORMAT
+                response = await litellm.acompletion(
+                    model=model, messages=messages, response_format=response_format
+                )
+        result = response.choices[0].message.content or ""
+        problems = phase_design_problems(result)
+        if not problems or attempt == MAX_REPAIR_ATTEMPTS:
+            break
+        _logger.warning(
+            "Phase design failed validation (repair %d/%d): %s",
+            attempt + 1, MAX_REPAIR_ATTEMPTS, "; ".join(problems)
+        )
+        prompt = _repair_description(description, result, problems)
+
+    phases = parse_phase_design_result(result)
+    if not problems:
+        store_phase_design(cache_key, phases)
+    return phases
+
+
+async def design_phases_batch(
+    requests: List[Tuple[ProjectIdea, ProjectGoals, FrameworkChoice, str]],
+    max_concurrency: int = MAX_BATCH_CONCURRENCY
+) -> List[List[Phase]]:
+    """
+    Design plans for many independent projects concurrently.
+
+    design_phases() blocks on one long LLM round-trip at a time, so N projects
+    take N round-trips. This fires the calls concurrently (up to
+    max_concurrency in flight, to stay inside provider rate limits) so the
+    batch takes about as long as its slowest plan. It calls the LLM directly
+    through LiteLLM (which CrewAI uses underneath) with the same persona,
+    prompt, output schema and repair loop as the CrewAI agent, and shares
+    phase_cache with design_phases().
+
+    Args:
+        requests: List of (idea, goals, framework, skill_level) tuples
+        max_concurrency: Maximum number of LLM calls in flight at once
+
+    Returns:
+        One list of Phase objects per request, in the same order as requests
+
+    Teaching Note:
+        Every prompt starts with the same static head, so providers with
+        prompt caching bill that shared prefix once for the whole batch;
+        only the short per-project tail is new input. Each plan still gets
+        its own reply - a single combined reply for N plans of ~50 steps
+        would run into output token limits, and one malformed reply would
+        lose every plan in the batch.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    return await asyncio.gather(
+        *(
+            _adesign_one(idea, goals, framework, skill_level, semaphore)
+            for idea, goals, framework, skill_level in requests
+        )
+    )
+
+
+def design_phases_batch_sync(
+    requests: List[Tuple[ProjectIdea, ProjectGoals, FrameworkChoice, str]],
+    max_concurrency: int = MAX_BATCH_CONCURRENCY
+) -> List[List[Phase]]:
+    """
+    Synchronous wrapper around design_phases_batch() for CLI callers.
+
+    Args:
+        requests: List of (idea, goals, framework, skill_level) tuples
+        max_concurrency: Maximum number of LLM calls in flight at once
+
+    Returns:
+        One list of Phase objects per request, in the same order as requests
+    """
+    return asyncio.run(design_phases_batch(requests, max_concurrency))
@@ -38,11 +38,17 @@ How to Modify Templates:
     making it suitable for learners and experienced developers alike.
 """
 
-from crewai import Agent, Task
-from typing import List
-import json
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, List
 
 from ..models.project_models import ProjectPlan, Phase, Step
+from ..tools.text_cleaner_tool import compact_constraints
+
+# Only the agent/task factories need CrewAI; generate_project_name and the
+# fallback README formatter work without it.
+if TYPE_CHECKING:
+    from crewai import Agent, Task
 
 
 def create_prd_writer_agent() -> Agent:
@@ -66,6 +72,8 @@ def create_prd_writer_agent() -> Agent:
 
         The backstory emphasizes these qualities to guide the LLM's output style.
     """
+    from crewai import Agent
+
     return Agent(
         role="Technical Documentation Specialist & PRD Writer",
         goal="Convert structured project plans into comprehensive, actionable README/PRD documents",
@@ -125,7 +133,7 @@ def create_prd_writing_task(agent: Agent, project_plan: ProjectPlan) -> Task:
         - Level of detail for each section
     """
     # Extract data from the plan for the prompt
-    total_steps = sum(len(phase.steps) for phase in project_plan.phases)
+    total_steps = project_plan.total_steps
 
     # Build a structured representation of phases and steps for the prompt
     phases_summary = []
@@ -143,6 +151,8 @@ def create_prd_writing_task(agent: Agent, project_plan: ProjectPlan) -> Task:
         phases_summary.append(phase_info)
 
     phases_text = "\n\n".join(phases_summary)
+    learning_goals_text = "\n".join([f"- {goal}" for goal in project_plan.goals.learning_goals])
+    technical_goals_text = "\n".join([f"- {goal}" for goal in project_plan.goals.technical_goals])
 
     description = f"""
 Create a comprehensive README/PRD document for this project plan.
@@ -150,13 +160,13 @@ Create a comprehensive README/PRD document for this project plan.
 PROJECT OVERVIEW:
 - Original Idea: {project_plan.idea.raw_description}
 - Refined Concept: {project_plan.idea.refined_summary}
-- Constraints: {json.dumps(project_plan.idea.constraints, indent=2)}
+- Constraints: {compact_constraints(project_plan.idea.constraints)}
 
 LEARNING GOALS:
-{chr(10).join(f'- {goal}' for goal in project_plan.goals.learning_goals)}
+{learning_goals_text}
 
 TECHNICAL GOALS:
-{chr(10).join(f'- {goal}' for goal in project_plan.goals.technical_goals)}
+{technical_goals_text}
 
 TECHNOLOGY STACK:
 - Frontend: {project_plan.framework.frontend or 'None (CLI-only)'}
@@ -366,6 +376,8 @@ directly to a .md file, so output ONLY the markdown content with no meta-comment
 or explanations outside the document itself.
 """
 
+    from crewai import Task
+
     return Task(
         description=description,
         expected_output="""A complete, well-formatted README markdown document (5000+ characters)
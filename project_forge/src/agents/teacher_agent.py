@@ -30,12 +30,18 @@ Teaching Note:
     - Ensures the AI can build a complete, working feature autonomously
 """
 
-from crewai import Agent, Task
-from typing import List, Dict, Any
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, List, Dict, Any
 import json
 
 from ..models.project_models import ProjectIdea, ProjectGoals, Phase, Step, ProjectPlan
 
+# The orchestrator imports this module at startup; CrewAI is only needed once
+# an agent or task is actually built, so it is imported there.
+if TYPE_CHECKING:
+    from crewai import Agent, Task
+
 
 def create_teacher_agent() -> Agent:
     """
@@ -53,6 +59,8 @@ def create_teacher_agent() -> Agent:
         not educational features for end users. It fills in technical details,
         code patterns, and architectural decisions so the AI can work autonomously.
     """
+    from crewai import Agent
+
     return Agent(
         role="Technical Implementation Guide and Software Architecture Specialist",
         goal="Provide comprehensive implementation guidance that enables AI agents to execute build steps autonomously",
@@ -135,6 +143,9 @@ def create_teaching_enrichment_task(
         phases_summary.append(
             f"Phase {phase.index}: {phase.name}\n" + "\n".join(steps_summary)
         )
+    phases_text = "\n".join(phases_summary)
+    learning_goals_text = "\n".join([f"- {goal}" for goal in goals.learning_goals])
+    technical_goals_text = "\n".join([f"- {goal}" for goal in goals.technical_goals])
 
     description = f"""
 Add comprehensive implementation guidance to enable AUTONOMOUS AI EXECUTION of this project plan.
@@ -144,15 +155,15 @@ ALL steps in ONE CONTINUOUS SESSION without user intervention. Your guidance mus
 enough that the AI can work autonomously for 1+ hours and deliver a complete, working project.
 
 LEARNING GOALS (what users should learn from using the final program):
-{chr(10).join(f'- {goal}' for goal in goals.learning_goals)}
+{learning_goals_text}
 
 TECHNICAL GOALS (what the program must do):
-{chr(10).join(f'- {goal}' for goal in goals.technical_goals)}
+{technical_goals_text}
 
 TARGET USER SKILL LEVEL: {skill_level}
 
 CURRENT PLAN STRUCTURE:
-{chr(10).join(phases_summary)}
+{phases_text}
 
 Your task is to:
 1. Add comprehensive "teaching_guidance" to EVERY step (detailed implementation guidance)
@@ -232,6 +243,8 @@ IMPORTANT FOR AUTONOMOUS EXECUTION:
 - The final program should be appropriate for {skill_level} users
 """
 
+    from crewai import Task
+
     return Task(
         description=description,
         expected_output="""JSON object with enriched phases (including comprehensive implementation
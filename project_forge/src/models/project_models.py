@@ -9,7 +9,7 @@ from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Any
 
 
-@dataclass
+@dataclass(slots=True)
 class ProjectIdea:
     """
     Raw and refined representation of the user's project idea.
@@ -23,6 +23,12 @@ class ProjectIdea:
         raw_description: The original idea string from the user's CLI input
         refined_summary: Cleaned, expanded version with context and clarity
         constraints: Dict of project constraints (e.g., {'time': '1 week', 'complexity': 'medium'})
+
+    Teaching Note:
+        slots=True drops the per-instance __dict__, so each ProjectIdea is
+        smaller and attribute access is a little faster. That matters on the
+        cache-hit and batch paths, which build many of these from trusted
+        cached data without any other work.
     """
     raw_description: str
     refined_summary: str = ""
@@ -72,7 +78,7 @@ class FrameworkChoice:
     special_libs: List[str] = field(default_factory=list)  # CrewAI, LangChain, etc.
 
 
-@dataclass
+@dataclass(slots=True)
 class Step:
     """
     A single implementation step within a phase.
@@ -88,6 +94,12 @@ class Step:
         teaching_guidance: Instructions for implementing agent on what educational features to build
                           (tooltips, examples, documentation, interactive demos, etc.)
         dependencies: List of step indices that must be completed before this one
+
+    Teaching Note:
+        A plan holds ~50 Steps and each one is rebuilt by the parser, the
+        cache and the TeacherAgent, so they use slots=True like ProjectIdea.
+        They stay mutable (not frozen): dependencies is a list, and callers
+        build plans step by step.
     """
     index: int
     title: str
@@ -96,7 +108,7 @@ class Step:
     dependencies: List[int] = field(default_factory=list)  # indices of prerequisite steps
 
 
-@dataclass
+@dataclass(slots=True)
 class Phase:
     """
     A major milestone in the project, containing multiple steps.
@@ -110,6 +122,9 @@ class Phase:
         name: Descriptive phase name (e.g., "Foundations & Models", "Core API")
         description: Overview of what this phase accomplishes and why
         steps: List of Step objects that make up this phase
+
+    Teaching Note:
+        Uses slots=True for the same reason as Step.
     """
     index: int
     name: str
@@ -138,3 +153,14 @@ class ProjectPlan:
     framework: FrameworkChoice
     phases: List[Phase] = field(default_factory=list)
     teaching_notes: str = ""  # global pedagogical notes
+
+    @property
+    def total_steps(self) -> int:
+        """
+        Number of steps across all phases.
+
+        Computed on access rather than cached: phases is a mutable list, and
+        summing a handful of phase lengths costs less than invalidating a
+        cache correctly would.
+        """
+        return sum(len(phase.steps) for phase in self.phases)
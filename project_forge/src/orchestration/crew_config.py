@@ -12,14 +12,14 @@ Phase 4 will add: PRDWriterAgent.
 """
 
 from typing import List, Optional, Dict, Any
-from dataclasses import dataclass
-from crewai import Crew
+from dataclasses import dataclass, asdict, replace
 
 from ..models.project_models import ProjectIdea, ProjectGoals, FrameworkChoice, ProjectPlan, Phase
 from ..agents.concept_expander_agent import (
-    create_concept_expander_agent,
-    create_concept_expansion_task,
-    parse_concept_expansion_result
+    expand_concept,
+    is_insufficient_input,
+    plan_cache_key,
+    plan_cache
 )
 from ..agents.goals_analyzer_agent import (
     create_goals_analyzer_agent,
@@ -29,12 +29,17 @@ from ..agents.goals_analyzer_agent import (
 from ..agents.framework_selector_agent import (
     create_framework_selector_agent,
     create_framework_selection_task,
-    parse_framework_selection_result
+    try_parse_framework_selection,
+    fallback_framework_choice
 )
 from ..agents.phase_designer_agent import (
     create_phase_designer_agent,
     create_phase_design_task,
-    parse_phase_design_result
+    parse_phase_design_result,
+    execute_phase_design,
+    phase_design_fingerprint,
+    get_cached_phase_design,
+    store_phase_design
 )
 from ..agents.teacher_agent import (
     create_teacher_agent,
@@ -130,6 +135,9 @@ def create_planning_crew(raw_idea: str, skill_level: str = "intermediate", verbo
     Returns:
         PlanningResult with all planning outputs
 
+    Raises:
+        ValueError: If the idea is too short to expand (see MIN_IDEA_WORDS)
+
     Teaching Note:
         In CrewAI, agents don't directly pass objects to each other. Instead,
         each task produces text output that the next task can reference. This
@@ -142,6 +150,8 @@ def create_planning_crew(raw_idea: str, skill_level: str = "intermediate", verbo
         which is important for a teaching system where we want to show
         intermediate results and catch issues early.
     """
+    from crewai import Crew
+
     print("\n" + "=" * 80)
     print("PLANNING CREW - Phase 2")
     print("=" * 80 + "\n")
@@ -154,16 +164,16 @@ def create_planning_crew(raw_idea: str, skill_level: str = "intermediate", verbo
     if progress_callback:
         progress_callback("ConceptExpander", 10, "📝 Expanding project concept...")
 
-    concept_agent = create_concept_expander_agent()
-    concept_task = create_concept_expansion_task(concept_agent, raw_idea, skill_level)
-
-    # Execute task through a Crew
-    concept_crew = Crew(agents=[concept_agent], tasks=[concept_task], verbose=verbose)
-    concept_output = concept_crew.kickoff()
-    concept_result = concept_output.raw
+    # expand_concept checks the concept and prompt caches before running the
+    # agent, so repeating an idea skips the LLM call
+    project_idea = expand_concept(raw_idea, skill_level, verbose=verbose)
 
-    # Parse into ProjectIdea
-    project_idea = parse_concept_expansion_result(concept_result, raw_idea)
+    # Too little input to plan from: stop before any other agent (or LLM call) runs
+    if is_insufficient_input(project_idea):
+        raise ValueError(
+            f"Project idea is too short to plan: {raw_idea!r}. "
+            "Please describe the project in a sentence."
+        )
 
     print(f"✓ Refined concept:")
     print(f"  {project_idea.refined_summary}\n")
@@ -177,6 +187,22 @@ def create_planning_crew(raw_idea: str, skill_level: str = "intermediate", verbo
     if progress_callback:
         progress_callback("GoalsAnalyzer", 40, "✅ ConceptExpander completed")
 
+    # The same idea was planned before - skip goals and frameworks
+    plan_key = plan_cache_key(raw_idea, skill_level)
+    cached_plan = plan_cache.get(plan_key)
+    if cached_plan is not None:
+        print("STEPS 2-3/3: Reusing cached goals and frameworks for this idea\n")
+
+        if progress_callback:
+            progress_callback("FrameworkSelector", 100, "✅ Reused cached planning results")
+
+        return PlanningResult(
+            project_idea=project_idea,
+            project_goals=ProjectGoals(**cached_plan["goals"]),
+            framework_choice=FrameworkChoice(**cached_plan["framework"]),
+            clarity_score=clarity_score
+        )
+
     # STEP 2: Goals Analysis
     # Extract learning and technical goals from the refined concept
     print("STEP 2/3: Analyzing learning and technical goals...")
@@ -226,8 +252,12 @@ def create_planning_crew(raw_idea: str, skill_level: str = "intermediate", verbo
     framework_output = framework_crew.kickoff()
     framework_result = framework_output.raw
 
-    # Parse into FrameworkChoice
-    framework_choice = parse_framework_selection_result(framework_result)
+    # Parse into FrameworkChoice, falling back to a safe default stack
+    framework_choice = try_parse_framework_selection(framework_result)
+    framework_fell_back = framework_choice is None
+    if framework_fell_back:
+        print("  Could not parse the framework selection; using the default stack")
+        framework_choice = fallback_framework_choice()
 
     print(f"✓ Selected frameworks:")
     print(f"  Frontend: {framework_choice.frontend or 'None (CLI-only)'}")
@@ -240,6 +270,15 @@ def create_planning_crew(raw_idea: str, skill_level: str = "intermediate", verbo
     if progress_callback:
         progress_callback("FrameworkSelector", 100, "✅ FrameworkSelector completed")
 
+    # Cache the downstream results for this idea. Parse fallbacks are not
+    # cached, so the next run asks the agents again.
+    goals_fell_back = project_goals.priority_notes.startswith("Error parsing goals")
+    if not goals_fell_back and not framework_fell_back:
+        plan_cache.set(plan_key, {
+            "goals": asdict(project_goals),
+            "framework": asdict(framework_choice),
+        })
+
     print("=" * 80)
     print("PLANNING COMPLETE")
     print("=" * 80 + "\n")
@@ -318,6 +357,8 @@ def create_full_plan_crew(
         Phase 3 agents to build and enrich the plan. The evaluation loop
         ensures quality before returning.
     """
+    from crewai import Crew
+
     print("\n" + "=" * 80)
     print("FULL PLAN CREW - Phase 3")
     print("=" * 80 + "\n")
@@ -345,22 +386,33 @@ def create_full_plan_crew(
         if progress_callback:
             progress_callback("PhaseDesigner", 50, "📋 Designing project phases...")
 
-        phase_designer = create_phase_designer_agent()
-        phase_task = create_phase_design_task(
-            phase_designer,
+        # An approved design for equivalent inputs is reused on the first
+        # iteration only; retries after a rejection always ask the LLM again
+        phase_key = phase_design_fingerprint(
             planning_result.project_idea,
             planning_result.project_goals,
             planning_result.framework_choice,
             skill_level
         )
+        phases = get_cached_phase_design(phase_key, approved_only=True) if iteration == 1 else None
 
-        # Execute task through a Crew
-        phase_crew = Crew(agents=[phase_designer], tasks=[phase_task], verbose=verbose)
-        phase_output = phase_crew.kickoff()
-        phase_result = phase_output.raw
+        if phases is not None:
+            print("Reusing cached phase design for these inputs")
+        else:
+            phase_designer = create_phase_designer_agent()
+            phase_task = create_phase_design_task(
+                phase_designer,
+                planning_result.project_idea,
+                planning_result.project_goals,
+                planning_result.framework_choice,
+                skill_level
+            )
 
-        # Parse into Phase objects
-        phases = parse_phase_design_result(phase_result)
+            # Execute task through a Crew, repairing invalid output
+            phase_result = execute_phase_design(phase_designer, phase_task, verbose)
+
+            # Parse into Phase objects
+            phases = parse_phase_design_result(phase_result)
 
         total_steps = sum(len(phase.steps) for phase in phases)
         print(f"✓ Created {len(phases)} phases with {total_steps} total steps\n")
@@ -427,6 +479,7 @@ def create_full_plan_crew(
 
         if evaluation_result.approved:
             print(f"✓ Plan approved after {iteration} iteration(s)!\n")
+            store_phase_design(phase_key, phases, approved=True)
             if progress_callback:
                 progress_callback("EvaluatorAgent", 100, "✅ EvaluatorAgent completed")
             break
@@ -438,7 +491,7 @@ def create_full_plan_crew(
         else:
             print(f"Max iterations reached. Using best-effort plan.\n")
             # Accept the plan even if not perfect after max iterations
-            evaluation_result.approved = True
+            evaluation_result = replace(evaluation_result, approved=True)
             if progress_callback:
                 progress_callback("EvaluatorAgent", 100, "✅ EvaluatorAgent completed")
             break
@@ -490,6 +543,8 @@ def create_complete_pipeline(
         This separation (plan creation vs. README writing) maintains clean
         separation of concerns and makes testing easier.
     """
+    from crewai import Crew
+
     print("\n" + "=" * 80)
     print("COMPLETE PROJECT FORGE PIPELINE - Phase 4")
     print("=" * 80 + "\n")
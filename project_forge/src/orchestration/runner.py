@@ -321,7 +321,7 @@ def main():
             print("PROJECT STRUCTURE:")
             for phase in plan.phases:
                 print(f"  Phase {phase.index}: {phase.name} ({len(phase.steps)} steps)")
-            total_steps = sum(len(p.steps) for p in plan.phases)
+            total_steps = plan.total_steps
             print(f"  Total: {len(plan.phases)} phases, {total_steps} steps")
             print()
             print("EDUCATIONAL GUIDANCE:")
@@ -399,7 +399,7 @@ def main():
             print("PROJECT STRUCTURE:")
             for phase in plan.phases:
                 print(f"  Phase {phase.index}: {phase.name} ({len(phase.steps)} steps)")
-            total_steps = sum(len(p.steps) for p in plan.phases)
+            total_steps = plan.total_steps
             print(f"  Total: {len(plan.phases)} phases, {total_steps} steps")
             print()
             print("README OUTPUT:")
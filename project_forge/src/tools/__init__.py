@@ -1,11 +1,19 @@
-"""Tools for text processing, evaluation, and consistency checking."""
+"""Tools for text processing, evaluation, consistency checking, response caching, config loading, JSON, and LLM settings."""
 
 from . import text_cleaner_tool
 from . import rubric_tool
 from . import consistency_tool
+from . import cache_tool
+from . import config_tool
+from . import json_tool
+from . import llm_tool
 
 __all__ = [
     "text_cleaner_tool",
     "rubric_tool",
     "consistency_tool",
+    "cache_tool",
+    "config_tool",
+    "json_tool",
+    "llm_tool",
 ]
@@ -0,0 +1,198 @@
+"""
+Response caching utilities for Project Forge.
+
+Every agent in the pipeline spends nearly all of its wall-clock time waiting
+on an LLM round-trip. These tools persist parsed agent outputs on disk so that
+re-running the pipeline with the same input returns the stored result instead
+of paying for another LLM call.
+
+The cache is a small SQLite database per namespace under the cache directory
+(".project_forge_cache" by default). Only stdlib modules are used, so there
+is nothing extra to install.
+
+Environment variables:
+    PROJECT_FORGE_CACHE_DIR: Directory for cache files (default: .project_forge_cache)
+    PROJECT_FORGE_CACHE: Set to "0", "false" or "off" to disable caching entirely
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+DEFAULT_CACHE_DIR = ".project_forge_cache"
+
+
+def cache_enabled() -> bool:
+    """
+    Check whether response caching is enabled via the environment.
+
+    Returns:
+        False if PROJECT_FORGE_CACHE is set to "0", "false" or "off", else True
+    """
+    return os.getenv("PROJECT_FORGE_CACHE", "1").strip().lower() not in ("0", "false", "off")
+
+
+def make_cache_key(*parts: str) -> str:
+    """
+    Build a stable cache key from one or more input strings.
+
+    Args:
+        *parts: Strings that together identify a cached result
+
+    Returns:
+        Hex digest that is safe to use as a database key
+
+    Example:
+        >>> make_cache_key("build a todo app", "beginner") == make_cache_key("build a todo app", "beginner")
+        True
+    """
+    return hashlib.sha1("|".join(parts).encode("utf-8")).hexdigest()
+
+
+def make_prompt_key(prompt: str, model: str, temperature: Optional[float] = None) -> str:
+    """
+    Build a cache key for an exact LLM request.
+
+    Args:
+        prompt: Full prompt text sent to the model
+        model: Model identifier (e.g. "gpt-4o-mini")
+        temperature: Sampling temperature, or None for the provider default
+
+    Returns:
+        SHA-256 hex digest of the (model, temperature, prompt) triple
+    """
+    return hashlib.sha256(f"{model}|{temperature}|{prompt}".encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """
+    Persistent key -> JSON-dict store for parsed agent outputs.
+
+    Each namespace (e.g. "concept_expansion") lives in its own SQLite file,
+    so agents never see each other's entries. A short-lived connection is
+    opened per operation, which keeps the cache safe to use from several
+    threads or CLI processes at once.
+
+    Attributes:
+        name: Namespace for this cache (used as the database file name)
+        path: Location of the SQLite database file
+
+    Teaching Note:
+        Caching LLM responses is the single biggest speed-up available to an
+        agent pipeline: a hit replaces a multi-second network call with a
+        local disk read. We store the *parsed* result (a plain dict) rather
+        than the raw LLM text so a hit also skips JSON cleanup and parsing.
+    """
+
+    def __init__(self, name: str, cache_dir: Optional[str] = None):
+        self.name = name
+        directory = Path(cache_dir or os.getenv("PROJECT_FORGE_CACHE_DIR", DEFAULT_CACHE_DIR))
+        self.path = directory / f"{name}.sqlite3"
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection, creating the database and table on first use."""
+        if not self._initialized:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path)
+        if not self._initialized:
+            # WAL lets concurrent CLI runs read while another process writes
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+            conn.commit()
+            self._initialized = True
+        return conn
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached value.
+
+        Args:
+            key: Cache key (see make_cache_key)
+
+        Returns:
+            The stored dict, or None on a miss or when caching is disabled
+        """
+        if not cache_enabled():
+            return None
+        try:
+            conn = self._connect()
+            try:
+                row = conn.execute("SELECT value FROM entries WHERE key = ?", (key,)).fetchone()
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            return None
+        return json.loads(row[0]) if row else None
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        """
+        Store a value, replacing any existing entry for the key.
+
+        Cache write failures are ignored - a broken cache should never break
+        the pipeline, it just makes the next run slower.
+
+        Args:
+            key: Cache key (see make_cache_key)
+            value: JSON-serializable dict to store
+        """
+        if not cache_enabled():
+            return
+        try:
+            conn = self._connect()
+            try:
+                conn.execute(
+                    "INSERT OR REPLACE INTO entries (key, value) VALUES (?, ?)",
+                    (key, json.dumps(value))
+                )
+                conn.commit()
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            pass
+
+    def clear(self) -> None:
+        """Remove every entry in this namespace."""
+        try:
+            conn = self._connect()
+            try:
+                conn.execute("DELETE FROM entries")
+                conn.commit()
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            pass
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+
+
+class PromptCache(ResponseCache):
+    """
+    Persistent cache of raw LLM responses keyed by the exact request.
+
+    Unlike a ResponseCache keyed on the *input* (e.g. the cleaned idea), this
+    keys on the fully rendered prompt plus model and temperature. Any change
+    to the prompt template or model therefore misses automatically, which
+    makes it a strictly safe cache to leave on during development.
+
+    Usage:
+        >>> cache = PromptCache("concept_expansion_prompts")
+        >>> response = cache.get_response(prompt, "gpt-4o-mini")
+        >>> if response is None:
+        ...     response = call_llm(prompt)
+        ...     cache.set_response(prompt, "gpt-4o-mini", None, response)
+    """
+
+    def get_response(self, prompt: str, model: str, temperature: Optional[float] = None) -> Optional[str]:
+        """Return the cached response text for this request, or None on a miss."""
+        entry = self.get(make_prompt_key(prompt, model, temperature))
+        return entry["response"] if entry else None
+
+    def set_response(self, prompt: str, model: str, temperature: Optional[float], response: str) -> None:
+        """Store the response text for this request."""
+        self.set(make_prompt_key(prompt, model, temperature), {"response": response})
@@ -0,0 +1,92 @@
+"""
+Configuration loading for Project Forge.
+
+defaults.yaml holds the skill level presets and framework templates that
+agents fold into their prompts. This module is the one place that reads it,
+so every agent shares a single parsed copy per process instead of each one
+re-parsing the file.
+
+The parsed config is memoized on the file's path and modification time: an
+edit to defaults.yaml changes the mtime and is picked up on the next call,
+without restarting the process.
+"""
+
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import yaml
+
+
+# libyaml's C loader parses several times faster than the pure-Python one.
+# PyYAML wheels ship with it on common platforms; source builds without
+# libyaml fall back to the equivalent pure-Python SafeLoader.
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+
+DEFAULT_CONFIG_PATH = Path(__file__).resolve().parent.parent / "config" / "defaults.yaml"
+_DEFAULT_CONFIG_PATH_STR = str(DEFAULT_CONFIG_PATH)
+
+
+def config_version(path: Optional[str] = None) -> Tuple[str, int]:
+    """
+    Identify the current version of a config file.
+
+    Args:
+        path: Config file to check (default: the bundled defaults.yaml)
+
+    Returns:
+        (path, mtime_ns) tuple; it changes whenever the file is edited
+
+    Raises:
+        OSError: If the file does not exist or cannot be read
+    """
+    path_str = _DEFAULT_CONFIG_PATH_STR if path is None else str(path)
+    return path_str, os.stat(path_str).st_mtime_ns
+
+
+@lru_cache(maxsize=4)
+def parse_config_file(path_str: str, mtime_ns: int) -> Dict[str, Any]:
+    """
+    Parse a YAML config file, memoized on its (path, mtime_ns) version.
+
+    Callers normally pass config_version() as the arguments. The returned
+    dict is shared between callers, so treat it as read-only.
+
+    Args:
+        path_str: Path of the YAML file
+        mtime_ns: Modification time of the file; part of the cache key only
+
+    Returns:
+        Parsed config dict
+
+    Raises:
+        OSError: If the file cannot be read
+        yaml.YAMLError: If the file is not valid YAML
+    """
+    # Binary mode hands the raw bytes to the YAML reader, which detects the
+    # encoding itself instead of relying on the platform's locale default
+    with open(path_str, 'rb') as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+
+def get_config() -> Dict[str, Any]:
+    """
+    Return the parsed bundled defaults.yaml, re-reading it only after edits.
+
+    Returns:
+        Parsed config dict (shared; treat as read-only)
+
+    Raises:
+        OSError: If defaults.yaml cannot be read
+        yaml.YAMLError: If defaults.yaml is not valid YAML
+
+    Example:
+        >>> get_config() is get_config()
+        True
+    """
+    return parse_config_file(*config_version())
@@ -12,6 +12,12 @@ from typing import List, Dict, Any
 from dataclasses import dataclass, field
 
 
+# Issue severities. String literals are interned by the compiler, so equality
+# checks against these constants hit CPython's identity fast path.
+SEVERITY_ERROR = 'error'
+SEVERITY_WARNING = 'warning'
+
+
 @dataclass
 class ConsistencyIssue:
     """
@@ -45,19 +51,19 @@ class ConsistencyReport:
 
     def has_errors(self) -> bool:
         """Check if any error-level issues were found."""
-        return any(issue.severity == 'error' for issue in self.issues)
+        return any(issue.severity == SEVERITY_ERROR for issue in self.issues)
 
     def has_warnings(self) -> bool:
         """Check if any warning-level issues were found."""
-        return any(issue.severity == 'warning' for issue in self.issues)
+        return any(issue.severity == SEVERITY_WARNING for issue in self.issues)
 
     def get_error_count(self) -> int:
         """Count total errors."""
-        return sum(1 for issue in self.issues if issue.severity == 'error')
+        return sum(1 for issue in self.issues if issue.severity == SEVERITY_ERROR)
 
     def get_warning_count(self) -> int:
         """Count total warnings."""
-        return sum(1 for issue in self.issues if issue.severity == 'warning')
+        return sum(1 for issue in self.issues if issue.severity == SEVERITY_WARNING)
 
 
 def check_phase_count(phases: List[Any], expected_count: int = 5) -> ConsistencyReport:
@@ -83,7 +89,7 @@ def check_phase_count(phases: List[Any], expected_count: int = 5) -> Consistency
     actual_count = len(phases)
     if actual_count != expected_count:
         report.issues.append(ConsistencyIssue(
-            severity='error',
+            severity=SEVERITY_ERROR,
             category='phase_count',
             message=f"Expected {expected_count} phases but found {actual_count}",
             location="ProjectPlan.phases"
@@ -119,15 +125,20 @@ def check_step_numbering(phases: List[Any]) -> ConsistencyReport:
         return report
 
     expected_index = 1
-    all_indices = []
+    seen_indices = set()
+    duplicates = set()
 
     for phase in phases:
         for step in phase.steps:
-            all_indices.append(step.index)
+            # Track repeats as we go (a single set lookup per step)
+            if step.index in seen_indices:
+                duplicates.add(step.index)
+            else:
+                seen_indices.add(step.index)
 
             if step.index != expected_index:
                 report.issues.append(ConsistencyIssue(
-                    severity='warning',
+                    severity=SEVERITY_WARNING,
                     category='step_numbering',
                     message=f"Expected step index {expected_index} but found {step.index}",
                     location=f"Phase {phase.index}, Step '{step.title}'"
@@ -135,12 +146,11 @@ def check_step_numbering(phases: List[Any]) -> ConsistencyReport:
 
             expected_index += 1
 
-    # Check for duplicate indices
-    duplicates = [idx for idx in set(all_indices) if all_indices.count(idx) > 1]
+    # Report duplicate indices
     if duplicates:
-        for dup in duplicates:
+        for dup in sorted(duplicates):
             report.issues.append(ConsistencyIssue(
-                severity='error',
+                severity=SEVERITY_ERROR,
                 category='step_numbering',
                 message=f"Duplicate step index: {dup}",
                 location="Multiple steps"
@@ -148,7 +158,7 @@ def check_step_numbering(phases: List[Any]) -> ConsistencyReport:
         report.passed = False
 
     if not report.issues:
-        total_steps = len(all_indices)
+        total_steps = expected_index - 1
         report.summary = f"Step numbering is correct: {total_steps} sequential steps"
 
     return report
@@ -179,11 +189,8 @@ def check_dependencies(phases: List[Any]) -> ConsistencyReport:
         report.summary = "No phases to check"
         return report
 
-    # Collect all valid step indices
-    all_step_indices = []
-    for phase in phases:
-        for step in phase.steps:
-            all_step_indices.append(step.index)
+    # Collect all valid step indices (a set, so each lookup below is O(1))
+    all_step_indices = {step.index for phase in phases for step in phase.steps}
 
     # Check each step's dependencies
     for phase in phases:
@@ -192,7 +199,7 @@ def check_dependencies(phases: List[Any]) -> ConsistencyReport:
                 # Check if dependency exists
                 if dep_index not in all_step_indices:
                     report.issues.append(ConsistencyIssue(
-                        severity='error',
+                        severity=SEVERITY_ERROR,
                         category='dependencies',
                         message=f"References non-existent step {dep_index}",
                         location=f"Phase {phase.index}, Step {step.index} '{step.title}'"
@@ -202,7 +209,7 @@ def check_dependencies(phases: List[Any]) -> ConsistencyReport:
                 # Check if dependency is earlier (no forward or self-references)
                 elif dep_index >= step.index:
                     report.issues.append(ConsistencyIssue(
-                        severity='error',
+                        severity=SEVERITY_ERROR,
                         category='dependencies',
                         message=f"References step {dep_index} which is not earlier than current step {step.index}",
                         location=f"Phase {phase.index}, Step {step.index} '{step.title}'"
@@ -236,7 +243,7 @@ def validate_project_plan(plan: Any) -> ConsistencyReport:
 
     if not hasattr(plan, 'phases'):
         report.issues.append(ConsistencyIssue(
-            severity='error',
+            severity=SEVERITY_ERROR,
             category='structure',
             message="ProjectPlan has no 'phases' attribute",
             location="ProjectPlan"
@@ -0,0 +1,53 @@
+"""
+JSON encoding and decoding for Project Forge.
+
+Agents parse every LLM reply as JSON and render config blocks into their
+prompts. orjson does both several times faster than the stdlib, but it is an
+optional dependency: when it isn't installed these helpers fall back to the
+json module, configured to produce the same text (UTF-8 characters are kept
+rather than escaped, as orjson does).
+
+orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch
+decode errors with ``except json.JSONDecodeError`` whichever parser ran.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads_json(text: str) -> Any:
+    """
+    Parse a JSON document.
+
+    Args:
+        text: JSON text, e.g. an LLM reply with any markdown fence removed
+
+    Returns:
+        The decoded Python value
+
+    Raises:
+        json.JSONDecodeError: If text is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def dumps_json_indented(obj: Any) -> str:
+    """
+    Render a value as JSON with 2-space indentation.
+
+    Args:
+        obj: JSON-serializable value (non-string dict keys are allowed)
+
+    Returns:
+        Indented JSON text
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj, indent=2, ensure_ascii=False)
@@ -0,0 +1,99 @@
+"""
+LLM configuration helpers for Project Forge agents.
+
+By default every agent lets CrewAI pick its model from the environment. A few
+agents ask the provider for JSON output, which means building their own
+crewai.LLM - and that object has to name a model. This module reads the same
+environment variables CrewAI reads, so those agents run on the model the user
+chose. When the user hasn't chosen one, the agents fall back to a plain
+CrewAI agent and CrewAI's own defaults stay in charge.
+
+The batch helpers (expand_concepts_batch, design_phases_batch) skip CrewAI
+and call LiteLLM directly; import_litellm() loads it with a clear error when
+it isn't installed.
+
+Environment variables (checked in CrewAI's order):
+    MODEL, MODEL_NAME, OPENAI_MODEL_NAME: Model name, e.g. "gpt-4o" or "anthropic/claude-3-5-sonnet"
+"""
+
+import os
+from types import ModuleType
+from typing import Any, Dict, Optional
+
+
+# Environment variables CrewAI consults for an agent's model, in priority order
+MODEL_ENV_VARS = ("MODEL", "MODEL_NAME", "OPENAI_MODEL_NAME")
+
+# CrewAI's fallback model. Only used where an explicit model name is required
+# (the direct LiteLLM batch calls and the prompt cache key).
+DEFAULT_MODEL = "gpt-4o-mini"
+
+
+def configured_model() -> Optional[str]:
+    """
+    Return the model the user configured through the environment.
+
+    Returns:
+        The model name, or None if none of MODEL_ENV_VARS is set
+    """
+    for name in MODEL_ENV_VARS:
+        model = os.getenv(name)
+        if model:
+            return model
+    return None
+
+
+def llm_model() -> str:
+    """
+    Return the model agents run on: the configured one, else CrewAI's default.
+
+    Returns:
+        Model name usable with LiteLLM
+    """
+    return configured_model() or DEFAULT_MODEL
+
+
+def agent_llm_kwargs(response_format: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Build the ``llm`` keyword argument for an agent that wants structured output.
+
+    Args:
+        response_format: Provider response_format (JSON mode or a JSON schema)
+
+    Returns:
+        ``{"llm": LLM(...)}`` when the user configured a model, otherwise an
+        empty dict so crewai.Agent builds its usual default LLM
+
+    Teaching Note:
+        Passing ``llm=LLM(model=...)`` replaces CrewAI's whole LLM setup for
+        that agent. Doing that with a hard-coded model would quietly ignore
+        the user's configuration, so we only do it when we know which model
+        the user wants.
+    """
+    model = configured_model()
+    if model is None:
+        return {}
+
+    from crewai import LLM
+
+    return {"llm": LLM(model=model, response_format=response_format)}
+
+
+def import_litellm() -> ModuleType:
+    """
+    Import LiteLLM for the direct batch LLM calls.
+
+    Returns:
+        The litellm module
+
+    Raises:
+        ImportError: If LiteLLM is not installed, with install instructions
+    """
+    try:
+        import litellm
+    except ImportError as e:
+        raise ImportError(
+            "The batch helpers call LiteLLM directly, but it is not installed. "
+            "Install it with: pip install 'litellm>=1.44.22'"
+        ) from e
+    return litellm
@@ -7,7 +7,8 @@ revisions. Provides structured scoring with explanations.
 """
 
 from dataclasses import dataclass, field
-from typing import List, Dict, Any
+from functools import lru_cache
+from typing import List, Dict, Any, Tuple
 from enum import Enum
 
 
@@ -21,7 +22,7 @@ class RubricCriterion(Enum):
     BALANCE = "balance"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RubricScore:
     """
     Score for a single evaluation criterion.
@@ -263,6 +264,15 @@ def get_all_rubrics() -> Dict[RubricCriterion, Dict[str, Any]]:
     }
 
 
+# Words that signal an underspecified concept
+_VAGUE_WORDS = ('something', 'stuff', 'things', 'maybe', 'somehow')
+
+# Entries kept by each per-component rubric cache. Refinement iterations
+# usually change only part of a plan, so the unchanged components hit.
+RUBRIC_CACHE_SIZE = 512
+
+
+@lru_cache(maxsize=RUBRIC_CACHE_SIZE)
 def evaluate_concept_clarity(concept_text: str) -> RubricScore:
     """
     Quick evaluation of concept clarity (used in Phase 2).
@@ -295,14 +305,16 @@ def evaluate_concept_clarity(concept_text: str) -> RubricScore:
         feedback_points.append("Concept is quite verbose - could be more concise")
 
     # Check for vague words
-    vague_words = ['something', 'stuff', 'things', 'maybe', 'somehow']
-    vague_count = sum(1 for word in vague_words if word in concept_text.lower())
+    concept_lower = concept_text.lower()
+    vague_count = sum(1 for word in _VAGUE_WORDS if word in concept_lower)
     if vague_count > 2:
         score -= 2
         feedback_points.append(f"Contains {vague_count} vague terms - be more specific")
 
-    # Check for technical specificity (presence of technical terms)
-    if not any(char.isupper() for char in concept_text):  # No proper nouns/acronyms
+    # Check for technical specificity (presence of technical terms). Any
+    # uppercase letter makes the lowercased copy differ, so comparing the two
+    # strings (a C-level memcmp) replaces a per-character isupper() loop.
+    if concept_lower == concept_text:  # No proper nouns/acronyms
         score -= 1
         feedback_points.append("Could mention specific technologies or frameworks")
 
@@ -334,10 +346,16 @@ def evaluate_phase_balance(phases: List[Any]) -> RubricScore:
         small feel trivial, while phases that are too large feel overwhelming.
         We aim for roughly 8-12 steps per phase for good pacing.
     """
+    return _phase_balance_for_counts(tuple(len(phase.steps) for phase in phases or ()))
+
+
+@lru_cache(maxsize=RUBRIC_CACHE_SIZE)
+def _phase_balance_for_counts(step_counts: Tuple[int, ...]) -> RubricScore:
+    """Memoized balance scoring; the score depends only on the steps per phase."""
     score = 10
     feedback_points = []
 
-    if not phases:
+    if not step_counts:
         return RubricScore(
             criterion=RubricCriterion.BALANCE,
             score=0,
@@ -346,14 +364,14 @@ def evaluate_phase_balance(phases: List[Any]) -> RubricScore:
         )
 
     # Check total phase count
-    if len(phases) != 5:
+    phase_count = len(step_counts)
+    if phase_count != 5:
         score -= 3
-        feedback_points.append(f"Expected 5 phases but found {len(phases)}")
+        feedback_points.append(f"Expected 5 phases but found {phase_count}")
 
     # Check step distribution
-    step_counts = [len(phase.steps) for phase in phases]
     total_steps = sum(step_counts)
-    avg_steps = total_steps / len(phases) if phases else 0
+    avg_steps = total_steps / phase_count
 
     # Check for empty or nearly empty phases
     empty_phases = [i + 1 for i, count in enumerate(step_counts) if count < 3]
@@ -372,7 +390,7 @@ def evaluate_phase_balance(phases: List[Any]) -> RubricScore:
         variance = sum((count - avg_steps) ** 2 for count in step_counts) / len(step_counts)
         if variance > 16:  # Standard deviation > 4
             score -= 1
-            feedback_points.append(f"Uneven step distribution (counts: {step_counts})")
+            feedback_points.append(f"Uneven step distribution (counts: {list(step_counts)})")
 
     # Check total step count
     if total_steps < 40:
@@ -382,7 +400,7 @@ def evaluate_phase_balance(phases: List[Any]) -> RubricScore:
         score -= 1
         feedback_points.append(f"{total_steps} total steps - plan may be overscoped")
 
-    feedback = " | ".join(feedback_points) if feedback_points else f"Well-balanced: {len(phases)} phases with {total_steps} steps (avg {avg_steps:.1f} per phase)"
+    feedback = " | ".join(feedback_points) if feedback_points else f"Well-balanced: {phase_count} phases with {total_steps} steps (avg {avg_steps:.1f} per phase)"
 
     return RubricScore(
         criterion=RubricCriterion.BALANCE,
@@ -392,6 +410,11 @@ def evaluate_phase_balance(phases: List[Any]) -> RubricScore:
     )
 
 
+# Phase-name keywords that indicate a progression from basics to advanced work
+_ADVANCED_PHASE_KEYWORDS = ('advanced', 'production', 'deployment', 'optimization', 'polish', 'testing')
+_BASIC_PHASE_KEYWORDS = ('setup', 'foundation', 'basics', 'introduction', 'getting started')
+
+
 def evaluate_teaching_clarity(plan: Any, skill_level: str = "intermediate") -> RubricScore:
     """
     Evaluate the teaching clarity of a project plan.
@@ -416,12 +439,16 @@ def evaluate_teaching_clarity(plan: Any, skill_level: str = "intermediate") -> R
     score = 10
     feedback_points = []
 
-    # Check for educational guidance in steps
-    total_steps = sum(len(phase.steps) for phase in plan.phases)
-    steps_with_guidance = sum(
-        1 for phase in plan.phases for step in phase.steps
-        if hasattr(step, 'teaching_guidance') and step.teaching_guidance and len(step.teaching_guidance.strip()) > 20
-    )
+    # Check for educational guidance in steps (counted in the same walk as the
+    # steps; teaching_guidance is a declared Step field, so it is read directly)
+    total_steps = 0
+    steps_with_guidance = 0
+    for phase in plan.phases:
+        total_steps += len(phase.steps)
+        for step in phase.steps:
+            guidance = step.teaching_guidance
+            if guidance and len(guidance.strip()) > 20:
+                steps_with_guidance += 1
 
     guidance_coverage = (steps_with_guidance / total_steps * 100) if total_steps > 0 else 0
 
@@ -443,19 +470,19 @@ def evaluate_teaching_clarity(plan: Any, skill_level: str = "intermediate") -> R
 
     # Check for progressive complexity (later phases should introduce more advanced concepts)
     # Simple heuristic: later phase names should indicate progression
-    advanced_keywords = ['advanced', 'production', 'deployment', 'optimization', 'polish', 'testing']
-    basic_keywords = ['setup', 'foundation', 'basics', 'introduction', 'getting started']
 
     early_phases = plan.phases[:2] if len(plan.phases) >= 2 else []
     late_phases = plan.phases[-2:] if len(plan.phases) >= 2 else []
 
+    # Lowercase each phase name once (not once per keyword)
+    early_names = [phase.name.lower() for phase in early_phases]
+    late_names = [phase.name.lower() for phase in late_phases]
+
     early_has_basics = any(
-        any(keyword in phase.name.lower() for keyword in basic_keywords)
-        for phase in early_phases
+        keyword in name for name in early_names for keyword in _BASIC_PHASE_KEYWORDS
     )
     late_has_advanced = any(
-        any(keyword in phase.name.lower() for keyword in advanced_keywords)
-        for phase in late_phases
+        keyword in name for name in late_names for keyword in _ADVANCED_PHASE_KEYWORDS
     )
 
     if not early_has_basics:
@@ -481,6 +508,41 @@ def evaluate_teaching_clarity(plan: Any, skill_level: str = "intermediate") -> R
     )
 
 
+# Technical depth indicators: keyword lists per topic. Plain substring checks
+# (str.__contains__) are used deliberately - CPython's fast search beats a
+# combined regex alternation, which backtracks at every text position.
+# The keywords need no sys.intern: the compiler already interns these
+# literals, and a substring search never hashes or compares them by identity.
+_TECHNICAL_DEPTH_KEYWORDS = {
+    'testing': ('test', 'testing', 'pytest', 'unittest', 'tdd'),
+    'deployment': ('deploy', 'deployment', 'production', 'docker', 'ci/cd'),
+    'architecture': ('architecture', 'design pattern', 'solid', 'refactor', 'modular'),
+    'error_handling': ('error', 'exception', 'logging', 'validation', 'edge case'),
+    'database': ('database', 'migration', 'query', 'index', 'transaction'),
+    'security': ('security', 'authentication', 'authorization', 'encryption', 'sanitize'),
+}
+
+
+def _depth_topic_count(all_text: str) -> int:
+    """
+    Count the technical depth topics mentioned in the lowercased step text.
+
+    Not memoized: the text holds every step title and description, so a
+    cache keyed on it would pin whole plans in memory to save a few dozen
+    substring scans. Each topic's scan stops at its first matching keyword.
+    """
+    return sum(
+        1 for keywords in _TECHNICAL_DEPTH_KEYWORDS.values()
+        if any(keyword in all_text for keyword in keywords)
+    )
+
+
+# Frameworks considered too complex for beginners, and hints that a stack is
+# simple-only (too light for advanced users)
+_COMPLEX_FRAMEWORKS = ('React', 'Vue', 'Django', 'PostgreSQL', 'Kubernetes')
+_SIMPLE_FRAMEWORK_HINTS = ('streamlit', 'json', 'csv', 'cli')
+
+
 def evaluate_technical_depth(plan: Any, skill_level: str = "intermediate") -> RubricScore:
     """
     Evaluate the technical depth and sophistication of a project plan.
@@ -506,40 +568,15 @@ def evaluate_technical_depth(plan: Any, skill_level: str = "intermediate") -> Ru
     score = 10
     feedback_points = []
 
-    # Check for presence of advanced topics across all steps
-    all_step_titles = [
-        step.title.lower()
-        for phase in plan.phases
-        for step in phase.steps
-    ]
-    all_step_descriptions = [
-        step.description.lower()
-        for phase in plan.phases
-        for step in phase.steps
-    ]
-
-    # Technical depth indicators
-    testing_keywords = ['test', 'testing', 'pytest', 'unittest', 'tdd']
-    deployment_keywords = ['deploy', 'deployment', 'production', 'docker', 'ci/cd']
-    architecture_keywords = ['architecture', 'design pattern', 'solid', 'refactor', 'modular']
-    error_handling_keywords = ['error', 'exception', 'logging', 'validation', 'edge case']
-    database_keywords = ['database', 'migration', 'query', 'index', 'transaction']
-    security_keywords = ['security', 'authentication', 'authorization', 'encryption', 'sanitize']
-
-    all_text = ' '.join(all_step_titles + all_step_descriptions)
-
-    has_testing = any(keyword in all_text for keyword in testing_keywords)
-    has_deployment = any(keyword in all_text for keyword in deployment_keywords)
-    has_architecture = any(keyword in all_text for keyword in architecture_keywords)
-    has_error_handling = any(keyword in all_text for keyword in error_handling_keywords)
-    has_database = any(keyword in all_text for keyword in database_keywords)
-    has_security = any(keyword in all_text for keyword in security_keywords)
-
-    depth_indicators = [
-        has_testing, has_deployment, has_architecture,
-        has_error_handling, has_database, has_security
-    ]
-    depth_score = sum(depth_indicators)
+    # Check for presence of advanced topics across all steps. The step text is
+    # gathered in a single walk over the plan and lowercased once as a whole.
+    steps = [step for phase in plan.phases for step in phase.steps]
+    all_text = ' '.join(
+        [step.title for step in steps] + [step.description for step in steps]
+    ).lower()
+
+    # Technical depth indicators: count the topics with at least one keyword present
+    depth_score = _depth_topic_count(all_text)
 
     # Skill level expectations
     if skill_level == "beginner":
@@ -566,9 +603,8 @@ def evaluate_technical_depth(plan: Any, skill_level: str = "intermediate") -> Ru
 
         # Beginners should have simple frameworks
         if skill_level == "beginner":
-            complex_frameworks = ['React', 'Vue', 'Django', 'PostgreSQL', 'Kubernetes']
             uses_complex = any(
-                any(complex in str(fw) for complex in complex_frameworks)
+                any(complex in str(fw) for complex in _COMPLEX_FRAMEWORKS)
                 for fw in frameworks
             )
             if uses_complex:
@@ -578,8 +614,8 @@ def evaluate_technical_depth(plan: Any, skill_level: str = "intermediate") -> Ru
         # Advanced users should use production-grade tools
         if skill_level == "advanced":
             simple_only = all(
-                any(simple in str(fw).lower() for simple in ['streamlit', 'json', 'csv', 'cli'])
-                for fw in frameworks
+                any(simple in fw_lower for simple in _SIMPLE_FRAMEWORK_HINTS)
+                for fw_lower in (str(fw).lower() for fw in frameworks)
             )
             if simple_only:
                 score -= 2
@@ -601,6 +637,18 @@ def evaluate_technical_depth(plan: Any, skill_level: str = "intermediate") -> Ru
     )
 
 
+# Expected scope by project type
+_TYPE_EXPECTATIONS = {
+    "toy": {"min_steps": 15, "max_steps": 30, "ideal_phases": 3, "max_weeks": 1},
+    "medium": {"min_steps": 35, "max_steps": 55, "ideal_phases": 5, "max_weeks": 2},
+    "ambitious": {"min_steps": 50, "max_steps": 70, "ideal_phases": 5, "max_weeks": 4}
+}
+
+# Step-title keywords for deployment work and for advanced features
+_DEPLOYMENT_TITLE_KEYWORDS = ('deploy', 'production', 'docker', 'ci/cd')
+_ADVANCED_TITLE_KEYWORDS = ('advanced', 'optimization', 'scale', 'production', 'testing')
+
+
 def evaluate_feasibility_for_project_type(
     plan: Any,
     project_type: str = "medium",
@@ -635,13 +683,7 @@ def evaluate_feasibility_for_project_type(
     phase_count = len(plan.phases)
 
     # Expected ranges by project type
-    type_expectations = {
-        "toy": {"min_steps": 15, "max_steps": 30, "ideal_phases": 3, "max_weeks": 1},
-        "medium": {"min_steps": 35, "max_steps": 55, "ideal_phases": 5, "max_weeks": 2},
-        "ambitious": {"min_steps": 50, "max_steps": 70, "ideal_phases": 5, "max_weeks": 4}
-    }
-
-    expected = type_expectations.get(project_type, type_expectations["medium"])
+    expected = _TYPE_EXPECTATIONS.get(project_type, _TYPE_EXPECTATIONS["medium"])
 
     # Check step count
     if total_steps < expected["min_steps"]:
@@ -681,21 +723,25 @@ def evaluate_feasibility_for_project_type(
             f"{project_type.title()} projects typically need ~{expected['max_weeks']} weeks (only {weeks_available} available)"
         )
 
+    # Title keyword checks below lowercase each step title once, not once per keyword
+    if project_type in ("toy", "ambitious"):
+        step_titles = [step.title.lower() for phase in plan.phases for step in phase.steps]
+
     # Check for deployment/production steps in toy projects
     if project_type == "toy":
-        deployment_steps = [
-            step for phase in plan.phases for step in phase.steps
-            if any(keyword in step.title.lower() for keyword in ['deploy', 'production', 'docker', 'ci/cd'])
-        ]
-        if len(deployment_steps) > 2:
+        deployment_steps = sum(
+            1 for title in step_titles
+            if any(keyword in title for keyword in _DEPLOYMENT_TITLE_KEYWORDS)
+        )
+        if deployment_steps > 2:
             score -= 1
             feedback_points.append("Toy projects should focus on core learning, not deployment complexity")
 
     # Check for insufficient advanced features in ambitious projects
     if project_type == "ambitious":
         advanced_features = sum(
-            1 for phase in plan.phases for step in phase.steps
-            if any(keyword in step.title.lower() for keyword in ['advanced', 'optimization', 'scale', 'production', 'testing'])
+            1 for title in step_titles
+            if any(keyword in title for keyword in _ADVANCED_TITLE_KEYWORDS)
         )
         if advanced_features < 5:
             score -= 2
@@ -709,3 +755,16 @@ def evaluate_feasibility_for_project_type(
         feedback=feedback,
         pass_threshold=6
     )
+
+
+def rubric_cache_info() -> Dict[str, Any]:
+    """
+    Report hit/miss statistics for the memoized per-component rubrics.
+
+    Returns:
+        Dict mapping rubric name to its functools cache_info() tuple
+    """
+    return {
+        "concept_clarity": evaluate_concept_clarity.cache_info(),
+        "phase_balance": _phase_balance_for_counts.cache_info(),
+    }
@@ -6,8 +6,10 @@ remove noise, normalize whitespace, and prepare text for structured processing.
 Used throughout the system to ensure consistent text quality.
 """
 
+import json
 import re
-from typing import List
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple
 
 
 def normalize_whitespace(text: str) -> str:
@@ -95,12 +97,15 @@ def expand_common_abbreviations(text: str) -> str:
     return expanded
 
 
+@lru_cache(maxsize=1024)
 def clean_project_idea(raw_idea: str) -> str:
     """
     Apply full cleaning pipeline to a raw project idea.
 
     This is the main entry point used by ConceptExpanderAgent to prepare
     user input for structured processing. Combines all cleaning steps.
+    Results are memoized, since the same idea is cleaned several times per
+    run (prompt building, cache keys, retries).
 
     Args:
         raw_idea: Raw string from CLI input
@@ -125,7 +130,9 @@ def extract_keywords(text: str) -> List[str]:
     Extract important keywords from project description.
 
     Identifies technical terms, frameworks, and key concepts that help
-    agents understand the project domain and requirements.
+    agents understand the project domain and requirements. The tokenize and
+    stop-word pass is memoized per input text; each call returns a fresh
+    list, so callers are free to modify it.
 
     Args:
         text: Project description text
@@ -137,6 +144,12 @@ def extract_keywords(text: str) -> List[str]:
         >>> extract_keywords("Build a Streamlit dashboard with async APIs")
         ['streamlit', 'dashboard', 'async', 'apis']
     """
+    return list(_extract_keywords_cached(text))
+
+
+@lru_cache(maxsize=1024)
+def _extract_keywords_cached(text: str) -> Tuple[str, ...]:
+    """Memoized keyword extraction; returns an immutable tuple safe to share."""
     # Remove common stop words
     stop_words = {
         'a', 'an', 'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
@@ -156,4 +169,49 @@ def extract_keywords(text: str) -> List[str]:
             seen.add(keyword)
             unique_keywords.append(keyword)
 
-    return unique_keywords
+    return tuple(unique_keywords)
+
+
+# Constraint values longer than this are cut short in prompts
+MAX_CONSTRAINT_VALUE_CHARS = 200
+
+
+def compact_constraints(constraints: Dict[str, Any], max_value_chars: int = MAX_CONSTRAINT_VALUE_CHARS) -> str:
+    """
+    Render project constraints as compact JSON for an LLM prompt.
+
+    Constraints are embedded in several agent prompts. Indented JSON spends
+    tokens on newlines and padding the model doesn't need, so this uses
+    compact separators and keeps non-ASCII text as-is. String values longer
+    than max_value_chars are truncated with a marker saying how much was cut.
+
+    Args:
+        constraints: ProjectIdea.constraints dict
+        max_value_chars: Longest string value kept in full
+
+    Returns:
+        Single-line JSON text
+
+    Example:
+        >>> compact_constraints({"time": "1 week", "complexity": "medium"})
+        '{"time":"1 week","complexity":"medium"}'
+    """
+    compact = {
+        key: f"{value[:max_value_chars]}…[{len(value) - max_value_chars} chars omitted]"
+        if isinstance(value, str) and len(value) > max_value_chars else value
+        for key, value in constraints.items()
+    }
+    return json.dumps(compact, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+def text_cleaner_cache_info() -> Dict[str, Any]:
+    """
+    Report hit/miss statistics for the memoized cleaning helpers.
+
+    Returns:
+        Dict mapping helper name to its functools cache_info() tuple
+    """
+    return {
+        "clean_project_idea": clean_project_idea.cache_info(),
+        "extract_keywords": _extract_keywords_cached.cache_info(),
+    }
@@ -0,0 +1,360 @@
+"""
+Agent Parsing Tests - Validates how agent outputs are turned into models.
+
+Every agent asks the LLM for JSON and then parses the reply. LLM replies are
+messy (markdown fences, preamble text, truncated output), so these tests feed
+representative raw strings through the parse_* functions directly. No LLM or
+CrewAI installation is needed.
+
+Teaching Note:
+    Parsing is where most agent pipelines silently lose data. Testing the
+    parsers in isolation with hand-written "LLM replies" is cheap and catches
+    regressions long before a real (slow, paid) run would.
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Add project_forge to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+
+class TestConceptExpansionParsing:
+    """Test parse_concept_expansion_result and the expand_concept fast paths."""
+
+    def test_parses_fenced_json(self):
+        """JSON wrapped in a ```json fence is extracted."""
+        from src.agents.concept_expander_agent import parse_concept_expansion_result
+
+        result = '```json\n{"refined_summary": "A habit tracker", "constraints": {"time": "1 week"}}\n```'
+        idea = parse_concept_expansion_result(result, "habit tracker")
+
+        assert idea.refined_summary == "A habit tracker"
+        assert idea.constraints == {"time": "1 week"}
+
+    def test_parses_fence_without_closing_marker(self):
+        """A truncated fence (no closing ```) still yields the JSON body."""
+        from src.agents.concept_expander_agent import parse_concept_expansion_result
+
+        result = '```json\n{"refined_summary": "A habit tracker", "constraints": {}}'
+        idea = parse_concept_expansion_result(result, "habit tracker")
+
+        assert idea.refined_summary == "A habit tracker"
+
+    def test_parses_streamed_chunks(self):
+        """An iterable of streamed chunks is accumulated before parsing."""
+        from src.agents.concept_expander_agent import parse_concept_expansion_result
+
+        chunks = iter(['{"refined_summary": ', '"A recipe API", ', '"constraints": {}}'])
+        idea = parse_concept_expansion_result(chunks, "recipe api")
+
+        assert idea.refined_summary == "A recipe API"
+
+    def test_malformed_output_falls_back(self):
+        """Non-JSON output becomes the refined summary and records the error."""
+        from src.agents.concept_expander_agent import parse_concept_expansion_result
+
+        idea = parse_concept_expansion_result("Sorry, I cannot do that.", "raw idea")
+
+        assert idea.refined_summary == "Sorry, I cannot do that."
+        assert "parsing_error" in idea.constraints
+
+    def test_short_idea_skips_llm(self):
+        """Ideas under three words return a placeholder without calling the LLM."""
+        from src.agents.concept_expander_agent import expand_concept
+
+        idea = expand_concept("an app")
+
+        assert idea.constraints == {"status": "insufficient_input"}
+
+    def test_oversized_idea_is_capped(self):
+        """Ideas over MAX_IDEA_CHARS keep only their head and tail in the prompt."""
+        from src.agents.concept_expander_agent import _build_task_description, MAX_IDEA_CHARS
+
+        raw_idea = "build a recipe app " + "with many extra details " * 200 + "ending here"
+        description = _build_task_description(raw_idea, "beginner")
+        prompt_idea = description.split('RAW IDEA: "', 1)[1].split('"\n', 1)[0]
+
+        assert len(prompt_idea) <= MAX_IDEA_CHARS
+        assert prompt_idea.startswith("build a recipe app")
+        assert prompt_idea.endswith("ending here")
+
+
+class TestGoalsAnalysisParsing:
+    """Test parse_goals_analysis_result."""
+
+    def test_parses_fenced_json(self):
+        """Goals wrapped in a ```json fence are extracted."""
+        from src.agents.goals_analyzer_agent import parse_goals_analysis_result
+
+        result = '```json\n{"learning_goals": ["async/await"], "technical_goals": ["REST API"], "priority_notes": "API first"}\n```'
+        goals = parse_goals_analysis_result(result)
+
+        assert goals.learning_goals == ["async/await"]
+        assert goals.technical_goals == ["REST API"]
+        assert goals.priority_notes == "API first"
+
+    def test_ignores_text_around_the_json(self):
+        """Preamble and trailing chatter around the object are dropped."""
+        from src.agents.goals_analyzer_agent import parse_goals_analysis_result
+
+        result = 'Here is the JSON:\n{"learning_goals": ["SQL joins"], "technical_goals": []}\nLet me know!'
+        goals = parse_goals_analysis_result(result)
+
+        assert goals.learning_goals == ["SQL joins"]
+
+    def test_malformed_output_falls_back(self):
+        """Non-JSON output yields placeholder goals that record the error."""
+        from src.agents.goals_analyzer_agent import parse_goals_analysis_result
+
+        goals = parse_goals_analysis_result("Here are your goals: learn things")
+
+        assert goals.priority_notes.startswith("Error parsing goals")
+
+
+class TestFrameworkSelectionParsing:
+    """Test parse_framework_selection_result and the framework config loader."""
+
+    def test_parses_fenced_json(self):
+        """A fenced selection is parsed, including a truncated closing fence."""
+        from src.agents.framework_selector_agent import parse_framework_selection_result
+
+        body = '{"frontend": null, "backend": "FastAPI", "storage": "SQLite", "special_libs": ["httpx"]}'
+        choice = parse_framework_selection_result("```json\n" + body + "\n```")
+
+        assert choice.frontend is None
+        assert choice.backend == "FastAPI"
+        assert choice.special_libs == ["httpx"]
+        assert parse_framework_selection_result("```json\n" + body) == choice
+
+    def test_malformed_output_falls_back(self):
+        """Non-JSON output falls back to the beginner-safe default stack."""
+        from src.agents.framework_selector_agent import parse_framework_selection_result
+
+        choice = parse_framework_selection_result("I recommend Streamlit.")
+
+        assert (choice.frontend, choice.backend, choice.storage) == ("Streamlit", "Python", "JSON files")
+
+    def test_config_is_loaded_once(self):
+        """Repeat loads of an unchanged defaults.yaml return the same object."""
+        from src.agents.framework_selector_agent import load_framework_config
+
+        config = load_framework_config()
+
+        assert "skill_levels" in config
+        assert load_framework_config() is config
+
+
+def _phase_design_json(steps_per_phase=10, phases=5):
+    """Build a phase design reply with per-phase step numbering, as LLMs often do."""
+    import json
+
+    return json.dumps({"phases": [
+        {
+            "index": phase_index,
+            "name": f"Phase {phase_index}",
+            "description": "Build features",
+            "steps": [
+                {"index": step_index, "title": f"Step {step_index}", "description": "Write code", "dependencies": []}
+                for step_index in range(1, steps_per_phase + 1)
+            ],
+        }
+        for phase_index in range(1, phases + 1)
+    ]})
+
+
+class TestPhaseDesignParsing:
+    """Test parse_phase_design_result, its validator and the streaming parser."""
+
+    def test_steps_are_numbered_globally(self):
+        """Per-phase step numbering is rewritten to run 1..N across phases."""
+        from src.agents.phase_designer_agent import parse_phase_design_result
+
+        phases = parse_phase_design_result("```json\n" + _phase_design_json(steps_per_phase=3) + "\n```")
+
+        assert [step.index for step in phases[1].steps] == [4, 5, 6]
+
+    @pytest.mark.parametrize("wrap", [
+        lambda body: "```json\n" + body + "```",
+        lambda body: "```json\n" + body,
+        lambda body: "Here is the plan:\n" + body + "\nGood luck!",
+    ])
+    def test_ignores_fences_and_text_around_the_json(self, wrap):
+        """Same-line, unclosed and missing fences with chatter still parse."""
+        from src.agents.phase_designer_agent import parse_phase_design_result, phase_design_problems
+
+        text = wrap(_phase_design_json())
+
+        assert phase_design_problems(text) == []
+        assert parse_phase_design_result(text) == parse_phase_design_result(_phase_design_json())
+
+    def test_malformed_output_falls_back(self):
+        """Unparseable output yields a single placeholder phase."""
+        from src.agents.phase_designer_agent import parse_phase_design_result
+
+        phases = parse_phase_design_result("The plan is coming soon!")
+
+        assert len(phases) == 1
+        assert "Parsing Error" in phases[0].name
+
+    def test_problems_name_their_location(self):
+        """The validator accepts a parseable design and pinpoints schema failures."""
+        import json
+        from src.agents.phase_designer_agent import phase_design_problems
+
+        data = json.loads(_phase_design_json())
+        del data["phases"][1]["steps"][2]["title"]
+        data["phases"][3]["steps"] = "none"
+
+        assert phase_design_problems(_phase_design_json()) == []
+        assert phase_design_problems(json.dumps(data)) == [
+            "phases[2].steps[3]: missing title or description",
+            'phases[4]: missing "steps" list',
+        ]
+
+    def test_unexpected_shape_only_warns(self, caplog):
+        """Odd phase and step counts are logged, not sent back for repair."""
+        from src.agents.phase_designer_agent import parse_phase_design_result, phase_design_problems
+
+        text = _phase_design_json(steps_per_phase=3, phases=4)
+
+        assert phase_design_problems(text) == []
+        with caplog.at_level("WARNING", logger="project_forge.phase_designer"):
+            assert len(parse_phase_design_result(text)) == 4
+        assert "expected 5 phases, got 4" in caplog.text
+
+    def test_bad_dependencies_are_dropped_not_repaired(self):
+        """Dependencies that don't name earlier steps are removed while parsing."""
+        import json
+        from src.agents.phase_designer_agent import parse_phase_design_result, phase_design_problems
+
+        data = json.loads(_phase_design_json())
+        data["phases"][1]["steps"][0]["dependencies"] = [10, 11, 12, "3"]
+
+        assert phase_design_problems(json.dumps(data)) == []
+        assert parse_phase_design_result(json.dumps(data))[1].steps[0].dependencies == [10]
+
+    @pytest.mark.parametrize("steps", [None, 5, "none", [None]])
+    def test_non_list_steps_fall_back(self, steps):
+        """A "steps" value of the wrong type gives the fallback plan, not a TypeError."""
+        import json
+        from src.agents.phase_designer_agent import (
+            _PARSE_ERROR_PHASE_NAME, iter_streamed_phases, parse_phase_design_result,
+        )
+
+        text = json.dumps({"phases": [{"name": "Setup", "steps": steps}]})
+
+        assert parse_phase_design_result(text)[0].name == _PARSE_ERROR_PHASE_NAME
+        assert list(iter_streamed_phases(text)) == []
+
+    def test_strict_schema_only_for_capable_models(self):
+        """Strict json_schema goes to known-capable models; others get JSON mode."""
+        from src.agents.phase_designer_agent import _response_format_for
+
+        assert _response_format_for("gpt-4o-mini")["type"] == "json_schema"
+        assert _response_format_for("openai/gpt-4.1")["type"] == "json_schema"
+        assert _response_format_for("gpt-3.5-turbo") == {"type": "json_object"}
+        assert _response_format_for("o1-mini") == {"type": "json_object"}
+        assert _response_format_for("o1-preview") == {"type": "json_object"}
+        assert _response_format_for("gpt-4o-2024-05-13") == {"type": "json_object"}
+        assert _response_format_for("anthropic/claude-3-5-sonnet") == {"type": "json_object"}
+
+    def test_batch_falls_back_to_json_mode(self, tmp_path, monkeypatch):
+        """A provider that rejects the strict schema is retried in JSON mode."""
+        import types
+        from src.agents import phase_designer_agent
+        from src.tools.cache_tool import ResponseCache
+        from src.models.project_models import ProjectIdea, ProjectGoals, FrameworkChoice
+
+        formats = []
+
+        class BadRequestError(Exception):
+            pass
+
+        async def acompletion(model, messages, response_format):
+            formats.append(response_format["type"])
+            if response_format["type"] == "json_schema":
+                raise BadRequestError("response_format json_schema is not supported")
+            message = types.SimpleNamespace(content=_phase_design_json())
+            return types.SimpleNamespace(choices=[types.SimpleNamespace(message=message)])
+
+        fake = types.ModuleType("litellm")
+        fake.BadRequestError, fake.acompletion = BadRequestError, acompletion
+        monkeypatch.setitem(sys.modules, "litellm", fake)
+        monkeypatch.setenv("MODEL", "gpt-4o")
+        monkeypatch.setattr(phase_designer_agent, "phase_cache", ResponseCache("phase_design", cache_dir=str(tmp_path)))
+
+        request = (ProjectIdea("raw", "A recipe API"), ProjectGoals(), FrameworkChoice(), "beginner")
+        plans = phase_designer_agent.design_phases_batch_sync([request])
+
+        assert formats == ["json_schema", "json_object"]
+        assert len(plans[0]) == 5
+
+    def test_prompt_embeds_compact_constraints(self):
+        """Constraints reach the prompt as one-line JSON with long values cut."""
+        from src.agents.phase_designer_agent import _build_task_description
+        from src.models.project_models import ProjectIdea, ProjectGoals, FrameworkChoice
+
+        idea = ProjectIdea("raw", "A recipe API", {"time": "1 week", "notes": "x" * 250})
+        description = _build_task_description(idea, ProjectGoals(), FrameworkChoice(), "beginner")
+
+        assert '{"time":"1 week","notes":"' + "x" * 200 + '…[50 chars omitted]"}' in description
+
+    def test_streamed_phases_match_full_parse(self):
+        """Phases parsed from small streamed chunks equal a one-shot parse."""
+        from src.agents.phase_designer_agent import iter_streamed_phases, parse_phase_design_result
+
+        text = "```json\n" + _phase_design_json(steps_per_phase=4) + "\n```"
+        chunks = [text[i:i + 7] for i in range(0, len(text), 7)]
+
+        assert list(iter_streamed_phases(chunks)) == parse_phase_design_result(text)
+
+    def test_streaming_ignores_braces_inside_strings(self):
+        """Braces, brackets and escaped quotes in text don't end a phase early."""
+        import json
+        from src.agents.phase_designer_agent import iter_streamed_phases, parse_phase_design_result
+
+        data = json.loads(_phase_design_json(steps_per_phase=2))
+        data["phases"][0]["name"] = 'Parse "{json}" ] and \\ paths'
+        data["phases"][0]["steps"][0]["description"] = 'Return "}" or \\"'
+        text = json.dumps(data)
+
+        assert list(iter_streamed_phases(text)) == parse_phase_design_result(text)
+
+
+class TestLLMSettings:
+    """Test how agents pick their model from the environment."""
+
+    @pytest.fixture(autouse=True)
+    def clear_model_env(self, monkeypatch):
+        from src.tools.llm_tool import MODEL_ENV_VARS
+
+        for name in MODEL_ENV_VARS:
+            monkeypatch.delenv(name, raising=False)
+
+    def test_unconfigured_model_keeps_crewai_default(self):
+        """Without a configured model no LLM override is passed to the agent."""
+        from src.tools.llm_tool import agent_llm_kwargs, llm_model, DEFAULT_MODEL
+
+        assert agent_llm_kwargs({"type": "json_object"}) == {}
+        assert llm_model() == DEFAULT_MODEL
+
+    def test_configured_model_is_used(self, monkeypatch):
+        """CrewAI's MODEL variable wins over OPENAI_MODEL_NAME."""
+        from src.tools.llm_tool import configured_model
+
+        monkeypatch.setenv("OPENAI_MODEL_NAME", "gpt-4o")
+        monkeypatch.setenv("MODEL", "anthropic/claude-3-5-sonnet")
+
+        assert configured_model() == "anthropic/claude-3-5-sonnet"
+
+    def test_missing_litellm_names_the_package(self, monkeypatch):
+        """The batch helpers fail with install instructions when LiteLLM is absent."""
+        from src.tools.llm_tool import import_litellm
+
+        monkeypatch.setitem(sys.modules, "litellm", None)
+
+        with pytest.raises(ImportError, match="pip install 'litellm"):
+            import_litellm()
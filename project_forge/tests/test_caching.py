@@ -0,0 +1,325 @@
+"""
+Caching Tests - Validates the response cache and memoized helpers.
+
+These tests exercise the caching layers that let Project Forge skip repeat
+LLM calls and repeat preprocessing work. They never call an LLM: cache
+entries are written and read directly.
+
+Teaching Note:
+    Caches are easy to get subtly wrong (stale entries, keys that collide,
+    failures that break the pipeline). Each test here pins down one of those
+    behaviors so refactors can't silently regress them.
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Add project_forge to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+
+class TestResponseCache:
+    """Test the persistent on-disk response cache."""
+
+    def test_roundtrip(self, tmp_path):
+        """Stored values come back unchanged."""
+        from src.tools.cache_tool import ResponseCache, make_cache_key
+
+        cache = ResponseCache("test", cache_dir=str(tmp_path))
+        key = make_cache_key("build a todo app", "beginner")
+
+        assert cache.get(key) is None
+        cache.set(key, {"refined_summary": "A todo app", "constraints": {"time": "1 week"}})
+
+        assert key in cache
+        assert cache.get(key)["constraints"]["time"] == "1 week"
+
+    def test_namespaces_are_isolated(self, tmp_path):
+        """Entries in one namespace are invisible to another."""
+        from src.tools.cache_tool import ResponseCache
+
+        ResponseCache("a", cache_dir=str(tmp_path)).set("k", {"v": 1})
+
+        assert ResponseCache("b", cache_dir=str(tmp_path)).get("k") is None
+
+    def test_disabled_via_environment(self, tmp_path, monkeypatch):
+        """PROJECT_FORGE_CACHE=off turns every lookup into a miss."""
+        from src.tools.cache_tool import ResponseCache
+
+        cache = ResponseCache("test", cache_dir=str(tmp_path))
+        cache.set("k", {"v": 1})
+        monkeypatch.setenv("PROJECT_FORGE_CACHE", "off")
+
+        assert cache.get("k") is None
+
+    def test_prompt_cache_is_model_specific(self, tmp_path):
+        """A response cached for one model is not served for another."""
+        from src.tools.cache_tool import PromptCache
+
+        cache = PromptCache("prompts", cache_dir=str(tmp_path))
+        cache.set_response("Expand this idea", "gpt-4o-mini", None, '{"refined_summary": "x"}')
+
+        assert cache.get_response("Expand this idea", "gpt-4o-mini") == '{"refined_summary": "x"}'
+        assert cache.get_response("Expand this idea", "gpt-4o") is None
+        assert cache.get_response("Expand this idea", "gpt-4o-mini", 0.2) is None
+
+    def test_key_depends_on_every_part(self):
+        """Different skill levels never share a cache key."""
+        from src.tools.cache_tool import make_cache_key
+
+        assert make_cache_key("idea", "beginner") != make_cache_key("idea", "advanced")
+
+
+class TestTextCleanerMemoization:
+    """Test the memoized text cleaning helpers."""
+
+    def test_repeat_calls_hit_cache(self):
+        """Cleaning the same idea twice is served from the cache."""
+        from src.tools.text_cleaner_tool import clean_project_idea, text_cleaner_cache_info
+
+        clean_project_idea("Um, build a   DB app for recipes")
+        hits_before = text_cleaner_cache_info()["clean_project_idea"].hits
+        clean_project_idea("Um, build a   DB app for recipes")
+
+        assert text_cleaner_cache_info()["clean_project_idea"].hits == hits_before + 1
+
+    def test_keywords_are_not_shared_between_callers(self):
+        """Mutating a returned keyword list never corrupts the cached value."""
+        from src.tools.text_cleaner_tool import extract_keywords
+
+        first = extract_keywords("Build a Streamlit dashboard with async APIs")
+        first.append("injected")
+
+        assert extract_keywords("Build a Streamlit dashboard with async APIs") == [
+            "streamlit", "dashboard", "async", "apis"
+        ]
+
+
+class TestPlanCacheKey:
+    """Test the plan-cache key derived from a raw idea."""
+
+    def test_depends_on_cleaned_idea_and_skill_level(self):
+        """Cosmetically different ideas share a key; skill levels do not."""
+        from src.agents.concept_expander_agent import plan_cache_key
+
+        a = plan_cache_key("Build a  Streamlit dashboard for recipes", "beginner")
+        b = plan_cache_key("  Build a Streamlit dashboard\nfor recipes ", "beginner")
+
+        assert a == b
+        assert a != plan_cache_key("Build a Streamlit dashboard for recipes", "advanced")
+
+
+class TestRubricComponentCaches:
+    """Test the per-component rubric memoization."""
+
+    def test_balance_reuses_score_for_same_shape(self):
+        """Phases with the same step counts share one balance computation."""
+        from src.tools.rubric_tool import evaluate_phase_balance, rubric_cache_info
+        from src.models.project_models import Phase, Step
+
+        def phases(title):
+            return [Phase(i, f"Phase {i}", "", [Step(i * 10 + j, title) for j in range(8)]) for i in range(5)]
+
+        first = evaluate_phase_balance(phases("Write the model"))
+        hits_before = rubric_cache_info()["phase_balance"].hits
+
+        assert evaluate_phase_balance(phases("Add the view")) == first
+        assert rubric_cache_info()["phase_balance"].hits == hits_before + 1
+
+
+class TestConfigCache:
+    """Test the mtime-keyed config loader shared by the agents."""
+
+    def test_edits_are_picked_up(self, tmp_path):
+        """Unchanged files are parsed once; an edit misses the cache."""
+        import os
+        from src.tools.config_tool import config_version, parse_config_file
+
+        path = tmp_path / "defaults.yaml"
+        path.write_text("skill_levels:\n  beginner: {}\n")
+        first = parse_config_file(*config_version(path))
+
+        assert parse_config_file(*config_version(path)) is first
+
+        path.write_text("skill_levels:\n  advanced: {}\n")
+        os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 1_000_000))
+
+        assert "advanced" in parse_config_file(*config_version(path))["skill_levels"]
+
+
+class TestPhaseDesignCache:
+    """Test the phase design cache and its input fingerprint."""
+
+    def _inputs(self, summary, learning_goals, libs):
+        from src.models.project_models import ProjectIdea, ProjectGoals, FrameworkChoice
+
+        return (
+            ProjectIdea("raw", summary, {"time": "1 week"}),
+            ProjectGoals(learning_goals, ["CRUD API"], "notes"),
+            FrameworkChoice("Streamlit", "FastAPI", "SQLite", libs),
+        )
+
+    def test_fingerprint_ignores_case_whitespace_and_order(self):
+        """Cosmetically different inputs share a key; skill level does not."""
+        from src.agents.phase_designer_agent import phase_design_fingerprint
+
+        a = self._inputs("A recipe  API", ["SQL", "REST"], ["httpx", "pandas"])
+        b = self._inputs("a recipe api", ["rest", "sql"], ["Pandas", "httpx"])
+
+        assert phase_design_fingerprint(*a, "beginner") == phase_design_fingerprint(*b, "beginner")
+        assert phase_design_fingerprint(*a, "beginner") != phase_design_fingerprint(*a, "advanced")
+
+    def test_roundtrip_drops_teaching_guidance(self, tmp_path, monkeypatch):
+        """Stored designs come back as fresh objects without TeacherAgent output."""
+        from src.agents import phase_designer_agent
+        from src.tools.cache_tool import ResponseCache
+        from src.models.project_models import Phase, Step
+
+        monkeypatch.setattr(phase_designer_agent, "phase_cache", ResponseCache("phase_design", cache_dir=str(tmp_path)))
+        phases = [Phase(1, "Setup", "Scaffold", [Step(1, "Init repo", "git init", "Explain git", [])])]
+        phase_designer_agent.store_phase_design("key", phases)
+
+        cached = phase_designer_agent.get_cached_phase_design("key")
+
+        assert cached[0].steps[0].title == "Init repo"
+        assert cached[0].steps[0].teaching_guidance == ""
+        assert phase_designer_agent.get_cached_phase_design("missing") is None
+
+    def test_approved_flag_is_checked_on_read(self, tmp_path, monkeypatch):
+        """Approved-only reads skip unapproved designs, which never replace approved ones."""
+        from src.agents import phase_designer_agent
+        from src.tools.cache_tool import ResponseCache
+        from src.models.project_models import Phase, Step
+
+        monkeypatch.setattr(phase_designer_agent, "phase_cache", ResponseCache("phase_design", cache_dir=str(tmp_path)))
+        draft = [Phase(1, "Draft", "", [Step(1, "Init repo")])]
+        approved = [Phase(1, "Approved", "", [Step(1, "Init repo")])]
+
+        phase_designer_agent.store_phase_design("key", draft)
+        assert phase_designer_agent.get_cached_phase_design("key", approved_only=True) is None
+
+        phase_designer_agent.store_phase_design("key", approved, approved=True)
+        phase_designer_agent.store_phase_design("key", draft)
+
+        assert phase_designer_agent.get_cached_phase_design("key", approved_only=True)[0].name == "Approved"
+        assert phase_designer_agent.get_cached_phase_design("key")[0].name == "Approved"
+
+    def test_batch_serves_hits_in_order(self, tmp_path, monkeypatch):
+        """A fully cached batch returns each plan in request order without an LLM."""
+        from src.agents import phase_designer_agent
+        from src.tools.cache_tool import ResponseCache
+        from src.models.project_models import Phase, Step
+
+        monkeypatch.setattr(phase_designer_agent, "phase_cache", ResponseCache("phase_design", cache_dir=str(tmp_path)))
+        requests = [self._inputs(summary, ["SQL"], []) + ("beginner",) for summary in ("A recipe API", "A chat bot")]
+        for idea, goals, framework, skill_level in requests:
+            key = phase_designer_agent.phase_design_fingerprint(idea, goals, framework, skill_level)
+            phase_designer_agent.store_phase_design(key, [Phase(1, idea.refined_summary, "", [Step(1, "Init repo")])])
+
+        plans = phase_designer_agent.design_phases_batch_sync(requests)
+
+        assert [plan[0].name for plan in plans] == ["A recipe API", "A chat bot"]
+
+
+class TestPlanningCrewCache:
+    """Test that the planning crew reuses cached concepts and plans."""
+
+    # Canned replies, keyed on the role of the agent running the task
+    _REPLIES = {
+        "Project Concept Expander": '{"refined_summary": "A CLI todo app with SQLite storage.", "constraints": {"time": "1 week"}}',
+        "Learning & Technical Goals Analyst": '{"learning_goals": ["SQL"], "technical_goals": ["CRUD"], "priority_notes": "Start small"}',
+        "Technology Stack Advisor": '{"frontend": null, "backend": "Typer", "storage": "SQLite", "special_libs": []}',
+    }
+
+    @pytest.fixture
+    def fake_crewai(self, tmp_path, monkeypatch):
+        """Install a stand-in crewai module that counts kickoffs instead of calling an LLM."""
+        import types
+        from src.agents import concept_expander_agent, goals_analyzer_agent, framework_selector_agent
+        from src.tools.cache_tool import PromptCache, ResponseCache
+
+        kickoffs = []
+        replies = self.replies = dict(self._REPLIES)
+
+        class Agent:
+            def __init__(self, **kwargs):
+                self.role = kwargs["role"]
+
+        class Task:
+            def __init__(self, description, expected_output, agent):
+                self.description = description
+                self.agent = agent
+
+        class Crew:
+            def __init__(self, agents, tasks, verbose=False):
+                self.tasks = tasks
+
+            def kickoff(self):
+                role = self.tasks[0].agent.role
+                kickoffs.append(role)
+                return types.SimpleNamespace(raw=replies[role])
+
+        fake = types.ModuleType("crewai")
+        fake.Agent, fake.Task, fake.Crew = Agent, Task, Crew
+        fake.LLM = lambda **kwargs: kwargs
+        monkeypatch.setitem(sys.modules, "crewai", fake)
+
+        cache_dir = str(tmp_path)
+        monkeypatch.setattr(concept_expander_agent, "_concept_cache", ResponseCache("concept", cache_dir=cache_dir))
+        monkeypatch.setattr(concept_expander_agent, "_prompt_cache", PromptCache("prompts", cache_dir=cache_dir))
+        monkeypatch.setattr(concept_expander_agent, "plan_cache", ResponseCache("plan", cache_dir=cache_dir))
+
+        resets = (
+            concept_expander_agent.reset_concept_expander_agent,
+            goals_analyzer_agent.reset_goals_analyzer_agent,
+            framework_selector_agent.reset_framework_selector_agent,
+        )
+        for reset in resets:
+            reset()
+        yield kickoffs
+        for reset in resets:
+            reset()
+
+    def test_second_run_skips_the_llm(self, fake_crewai, monkeypatch):
+        """Planning the same idea twice runs every agent once."""
+        from src.agents import concept_expander_agent
+        from src.orchestration import crew_config
+
+        monkeypatch.setattr(crew_config, "plan_cache", concept_expander_agent.plan_cache)
+
+        first = crew_config.create_planning_crew("build a todo app with sqlite", "beginner", verbose=False)
+        assert len(fake_crewai) == 3
+
+        second = crew_config.create_planning_crew("build a todo app with sqlite", "beginner", verbose=False)
+
+        assert len(fake_crewai) == 3
+        assert second.project_idea.refined_summary == first.project_idea.refined_summary
+        assert second.framework_choice.backend == "Typer"
+
+    def test_insufficient_input_stops_before_any_agent(self, fake_crewai):
+        """A too-short idea is rejected without running a single agent."""
+        from src.orchestration import crew_config
+
+        with pytest.raises(ValueError, match="too short"):
+            crew_config.create_planning_crew("an app", "beginner", verbose=False)
+
+        assert fake_crewai == []
+
+    def test_framework_fallback_is_not_cached(self, fake_crewai, monkeypatch):
+        """A malformed framework reply is replaced by the default stack but retried next run."""
+        from src.agents import concept_expander_agent
+        from src.orchestration import crew_config
+
+        monkeypatch.setattr(crew_config, "plan_cache", concept_expander_agent.plan_cache)
+        self.replies["Technology Stack Advisor"] = "I recommend Streamlit."
+
+        first = crew_config.create_planning_crew("build a todo app with sqlite", "beginner", verbose=False)
+        assert first.framework_choice.backend == "Python"
+
+        self.replies["Technology Stack Advisor"] = self._REPLIES["Technology Stack Advisor"]
+        second = crew_config.create_planning_crew("build a todo app with sqlite", "beginner", verbose=False)
+
+        assert fake_crewai.count("Technology Stack Advisor") == 2
+        assert second.framework_choice.backend == "Typer"
@@ -0,0 +1,193 @@
+"""
+Evaluator Tests - Validates heuristic plan evaluation and its fast paths.
+
+evaluate_plan_quality and evaluate_project_plan run without an LLM, and
+without CrewAI installed, so these tests build small plans by hand and check
+the approval decision, the early-exit options and the result memo.
+
+Teaching Note:
+    The evaluator decides whether a plan goes back for another (paid)
+    refinement round. Its shortcuts - memoization, fail-fast exits - must
+    never change that decision, which is exactly what these tests pin down.
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Add project_forge to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+
+def _make_plan(steps_per_phase=5, phases=5, broken=False):
+    """Build a plan of numbered steps; broken=True adds a dangling dependency."""
+    from src.models.project_models import (
+        ProjectPlan, ProjectIdea, ProjectGoals,
+        FrameworkChoice, Phase, Step
+    )
+
+    idea = ProjectIdea("raw", "A Streamlit dashboard that tracks daily habits with SQLite storage and charts", {})
+    goals = ProjectGoals(["learn data modeling"], ["build a dashboard"], "notes")
+    framework = FrameworkChoice("Streamlit", "Python", "SQLite", [])
+
+    plan_phases = []
+    index = 1
+    for phase_index in range(1, phases + 1):
+        steps = []
+        for _ in range(steps_per_phase):
+            steps.append(Step(
+                index,
+                f"Implement habit feature {index}",
+                "Add the model, the view and pytest tests with error handling",
+                "Create the SQLAlchemy model, write pytest tests, and log errors with the logging module",
+                [999] if broken and index == 1 else []
+            ))
+            index += 1
+        plan_phases.append(Phase(phase_index, f"Phase {phase_index}", "Build features", steps))
+
+    return ProjectPlan(idea, goals, framework, plan_phases, "Global teaching notes " * 5)
+
+
+class TestEvaluatePlanQuality:
+    """Test the heuristic evaluation and its early-exit options."""
+
+    def test_trivial_plan_is_rejected(self):
+        """Plans below MIN_PLAN_STEPS are rejected as too trivial."""
+        from src.agents.evaluator_agent import evaluate_plan_quality
+
+        result = evaluate_plan_quality(_make_plan(steps_per_phase=2))
+
+        assert not result.approved
+        assert any("too trivial" in issue for issue in result.critical_issues)
+
+    def test_step_ceiling_follows_weeks_available(self):
+        """Only constraints of two weeks or less cap the step count."""
+        from src.agents.evaluator_agent import evaluate_plan_quality
+
+        plan = _make_plan(steps_per_phase=9)
+
+        def too_ambitious(time_constraint):
+            result = evaluate_plan_quality(plan, "intermediate", "medium", time_constraint)
+            return any("too ambitious" in issue for issue in result.critical_issues)
+
+        assert too_ambitious("1 week")
+        assert not too_ambitious("1-2 weeks")
+        assert not too_ambitious("12 weeks")
+
+    def test_fail_fast_skips_rubrics_on_structural_errors(self):
+        """With fail_fast, a broken plan is rejected without scoring rubrics."""
+        from src.agents.evaluator_agent import evaluate_plan_quality
+
+        plan = _make_plan(broken=True)
+        result = evaluate_plan_quality(plan, fail_fast=True)
+
+        assert not result.approved
+        assert evaluate_plan_quality(plan).approved is False
+        assert all(score.score == 0 for score in result.scores.values())
+
+    def test_first_blocker_matches_full_evaluation(self):
+        """collect_all_feedback=False keeps the decision and the first issue."""
+        from src.agents.evaluator_agent import evaluate_plan_quality
+
+        plan = _make_plan(steps_per_phase=2)
+        full = evaluate_plan_quality(plan, "beginner", "toy", "1 week")
+        first = evaluate_plan_quality(plan, "beginner", "toy", "1 week", collect_all_feedback=False)
+
+        assert first.approved == full.approved
+        assert first.critical_issues[0] == full.critical_issues[0]
+        assert len(first.critical_issues) <= len(full.critical_issues)
+
+    def test_parallel_matches_serial(self):
+        """Running the rubrics on the thread pool gives the same result."""
+        from src.agents.evaluator_agent import evaluate_plan_quality
+
+        plan = _make_plan()
+
+        assert evaluate_plan_quality(plan, parallel=True) == evaluate_plan_quality(plan)
+
+
+class TestEvaluationMemo:
+    """Test the content-keyed memo in evaluate_project_plan."""
+
+    @pytest.fixture
+    def quality_calls(self, monkeypatch):
+        """Count how often the heuristic evaluation actually runs."""
+        from src.agents import evaluator_agent
+
+        calls = []
+        evaluate = evaluator_agent.evaluate_plan_quality
+
+        def counting(*args, **kwargs):
+            calls.append(args[0])
+            return evaluate(*args, **kwargs)
+
+        monkeypatch.setattr(evaluator_agent, "evaluate_plan_quality", counting)
+        evaluator_agent.evaluate_project_plan.cache_clear()
+        return calls
+
+    def test_equal_plans_share_a_result(self, quality_calls):
+        """Two distinct but identical plans are evaluated once."""
+        from src.agents.evaluator_agent import evaluate_project_plan
+
+        first = evaluate_project_plan(_make_plan())
+
+        assert evaluate_project_plan(_make_plan()) == first
+        assert len(quality_calls) == 1
+
+    def test_hits_are_private_copies(self, quality_calls):
+        """Mutating a returned result does not leak into later hits."""
+        from src.agents.evaluator_agent import evaluate_project_plan
+
+        first = evaluate_project_plan(_make_plan(broken=True))
+        first.scores.clear()
+        first.consistency_report.issues.clear()
+
+        second = evaluate_project_plan(_make_plan(broken=True))
+
+        assert second.scores and second.consistency_report.issues
+        assert len(quality_calls) == 1
+
+    def test_key_is_a_content_digest(self):
+        """The memo key is a short digest that still tracks every step's text."""
+        from src.agents.evaluator_agent import _plan_content_key
+
+        plan = _make_plan()
+        edited = _make_plan()
+        edited.phases[-1].steps[-1].teaching_guidance = "Add a docstring"
+
+        assert _plan_content_key(plan) == _plan_content_key(_make_plan())
+        assert _plan_content_key(plan) != _plan_content_key(edited)
+        assert len(_plan_content_key(plan)) == 32
+
+    def test_cache_clear_forces_reevaluation(self, quality_calls):
+        """cache_clear() drops memoized results."""
+        from src.agents.evaluator_agent import evaluate_project_plan
+
+        plan = _make_plan()
+        evaluate_project_plan(plan)
+        evaluate_project_plan.cache_clear()
+        evaluate_project_plan(plan)
+
+        assert len(quality_calls) == 2
+
+    def test_batch_follows_input_order(self):
+        """evaluate_many returns one result per plan, in order."""
+        from src.agents.evaluator_agent import evaluate_many
+
+        plans = [_make_plan(), _make_plan(steps_per_phase=2), _make_plan()]
+        results = evaluate_many(plans)
+
+        assert len(results) == 3
+        assert results[0] == results[2] and results[0] is not results[2]
+        assert not results[1].approved
+
+    def test_process_pool_matches_serial(self):
+        """Spreading a batch over worker processes gives the same results."""
+        from src.agents.evaluator_agent import evaluate_many, evaluate_project_plan
+
+        plans = [_make_plan(), _make_plan(steps_per_phase=2), _make_plan(broken=True)]
+        serial = evaluate_many(plans)
+        evaluate_project_plan.cache_clear()
+
+        assert evaluate_many(plans, processes=2) == serial